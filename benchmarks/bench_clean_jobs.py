@@ -0,0 +1,116 @@
+"""
+Clean Jobs Benchmark
+Compares JobScraper.clean_jobs with the per-job BeautifulSoup cleaning path
+
+Usage: python benchmarks/bench_clean_jobs.py [--jobs N] [--repeat N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "utils"))
+
+from job_scraper import JobScraper, MAX_DESCRIPTION_LENGTH  # noqa: E402
+
+try:
+    from bs4 import BeautifulSoup
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+WORDS = (
+    "python django react typescript kubernetes aws postgres team product "
+    "design scalable services customers remote growth data pipelines &amp; "
+    "experience years building shipping mentoring on-call &nbsp; APIs"
+).split()
+
+
+def make_description(rng: random.Random, paragraphs: int) -> str:
+    """Build an HTML job description of roughly ``paragraphs`` blocks."""
+    blocks = []
+    for _ in range(paragraphs):
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 60)))
+        if rng.random() < 0.3:
+            items = "".join(f"<li>{rng.choice(WORDS)} {rng.choice(WORDS)}</li>" for _ in range(5))
+            blocks.append(f"<h3>Requirements</h3>\n<ul>{items}</ul>")
+        else:
+            blocks.append(f'<p class="body">{words} <a href="https://example.com/?a=1&amp;b=2">link</a></p>')
+    return "\n".join(blocks)
+
+
+def make_jobs(count: int, seed: int = 13) -> list:
+    rng = random.Random(seed)
+    return [
+        {
+            "title": f"  Senior   Engineer {i}\n",
+            "company": "Acme",
+            "location": rng.choice(["Remote", "Berlin", "Work from home", "NYC"]),
+            "description": make_description(rng, rng.randint(4, 40)),
+            "link": f"https://example.com/jobs/{i}",
+            "source": "bench"
+        }
+        for i in range(count)
+    ]
+
+
+def clean_with_soup(job: dict) -> dict:
+    """The previous cleaning path: full parse tree per job, then truncate."""
+    description = job.get("description", "").strip()
+    description = BeautifulSoup(description, "html.parser").get_text(separator=" ").strip()
+    location = job.get("location", "").lower()
+    return {
+        "title": " ".join(job.get("title", "").split()),
+        "company": job.get("company", "Unknown"),
+        "location": job.get("location", "Unknown"),
+        "remote": "remote" in location or "work from home" in location,
+        "description": description[:MAX_DESCRIPTION_LENGTH],
+        "applyUrl": job.get("link", job.get("applyUrl", "")),
+        "source": job.get("source", ""),
+        "discoveredAt": datetime.utcnow().isoformat()
+    }
+
+
+def best_of(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.jobs)
+    scraper = JobScraper()
+    total_kb = sum(len(job["description"]) for job in jobs) / 1024
+    print(f"{len(jobs)} jobs, {total_kb:.0f} KiB of HTML descriptions")
+
+    fast = best_of(args.repeat, lambda: scraper.clean_jobs(jobs))
+    print(f"clean_jobs:      {fast * 1000:8.1f} ms  ({len(jobs) / fast:,.0f} jobs/s)")
+
+    if not BS4_AVAILABLE:
+        print("beautifulsoup4 not installed; skipping the BeautifulSoup comparison")
+        return
+
+    slow = best_of(args.repeat, lambda: [clean_with_soup(job) for job in jobs])
+    print(f"BeautifulSoup:   {slow * 1000:8.1f} ms  ({len(jobs) / slow:,.0f} jobs/s)")
+    print(f"speedup:         {slow / fast:8.1f}x")
+
+    mismatches = sum(
+        new["description"] != old["description"]
+        for new, old in zip(scraper.clean_jobs(jobs), map(clean_with_soup, jobs))
+    )
+    print(f"description mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Import Time Benchmark
+Measures the cold import time of each utility module in a fresh interpreter
+
+Usage: python benchmarks/bench_import_time.py [--repeat N] [--budget-ms MS]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+UTILS = Path(__file__).resolve().parents[1] / "src" / "utils"
+
+MODULES = ["ai_service", "job_scraper", "resume_parser"]
+
+# Optional backends that must not be loaded just by importing a module
+HEAVY = ["openai", "google.generativeai", "httpx", "playwright", "lxml", "PyPDF2", "docx", "bs4", "numpy"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+
+def measure(module: str) -> dict:
+    """Import ``module`` in a new interpreter, so nothing is already cached."""
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY)],
+        cwd=UTILS, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="exit with status 1 if a module's median import time exceeds this")
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    args = parser.parse_args()
+
+    print(f"{'module':<16}{'median ms':>10}{'min ms':>9}  heavy imports loaded")
+    over_budget = []
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.repeat)]
+        times = [run["seconds"] * 1000 for run in runs]
+        median = statistics.median(times)
+        print(f"{module:<16}{median:>10.1f}{min(times):>9.1f}  {', '.join(runs[-1]['loaded']) or '-'}")
+        if args.budget_ms is not None and median > args.budget_ms:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"Over the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Job Memory Benchmark
+Compares the memory held by cleaned job dicts and compact Job records
+
+Usage: python benchmarks/bench_job_memory.py [--jobs N]
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "utils"))
+
+from job_scraper import JobScraper  # noqa: E402
+
+LOCATIONS = ["Remote", "Berlin, Germany", "New York, NY", "London, UK", "Work from home", "Toronto"]
+SOURCES = ["RemoteOK", "HackerNews Jobs", "WeWorkRemotely"]
+
+
+def make_raw_jobs(count: int, seed: int = 19) -> list:
+    """Raw feed items; every string is a fresh object, as a parser would produce."""
+    rng = random.Random(seed)
+    return [
+        {
+            "title": f"Senior Engineer {i}",
+            "company": "".join(["Company ", str(rng.randrange(2000))]),
+            "location": "".join([rng.choice(LOCATIONS)]),
+            "description": f"<p>Build reliable services for job {i}.</p><ul><li>Python</li><li>SQL</li></ul>",
+            "link": f"https://example.com/jobs/{i}",
+            "source": "".join([rng.choice(SOURCES)])
+        }
+        for i in range(count)
+    ]
+
+
+def measure(scraper: JobScraper, count: int, as_records: bool):
+    """Memory still held by the cleaned catalog once the raw items are gone."""
+    gc.collect()
+    tracemalloc.start()
+    raw_jobs = make_raw_jobs(count)
+    jobs = scraper.clean_jobs(raw_jobs, as_records=as_records)
+    del raw_jobs
+    gc.collect()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return jobs, held, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200_000)
+    args = parser.parse_args()
+
+    scraper = JobScraper()
+    print(f"{args.jobs:,} jobs")
+    print(f"{'representation':<16}{'held MiB':>10}{'bytes/job':>11}{'peak MiB':>10}{'clean s':>9}")
+
+    results = {}
+    for name, as_records in (("dict", False), ("Job record", True)):
+        raw_jobs = make_raw_jobs(args.jobs)
+        start = time.perf_counter()
+        scraper.clean_jobs(raw_jobs, as_records=as_records)
+        elapsed = time.perf_counter() - start
+        del raw_jobs
+
+        jobs, held, peak = measure(scraper, args.jobs, as_records)
+        results[name] = held
+        print(f"{name:<16}{held / 2**20:>10.1f}{held / len(jobs):>11.0f}{peak / 2**20:>10.1f}{elapsed:>9.2f}")
+        del jobs
+
+    print(f"Job records hold {1 - results['Job record'] / results['dict']:.0%} less memory than dicts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Requirements Extraction Benchmark
+Shows JobScraper.extract_requirements staying linear on pathological descriptions
+
+Usage: python benchmarks/bench_requirements.py [--max-kb N]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "utils"))
+
+from job_scraper import JobScraper  # noqa: E402
+
+# Inputs that defeat section headers: no markers at all, openers that are
+# never terminated, huge whitespace runs, and endless bullet lists
+PATHOLOGICAL = {
+    "no headers": "lorem ipsum dolor sit amet, consectetur adipiscing elit ",
+    "open sections": "requirements must have qualifications you will need ",
+    "whitespace": "requirements:" + " " * 200 + "\n\t",
+    "bullets": "\n- 5+ years of python and distributed systems experience",
+}
+
+
+def legacy_extract_requirements(description: str) -> list:
+    """The previous implementation: lazy DOTALL patterns plus a regex split."""
+    requirements = []
+    patterns = [
+        r'(?:requirements?|qualifications?|what we.re looking for)[:\s]*(.+?)(?:benefits?|what we offer|about us|$)',
+        r'(?:must have|you should have|you will need)[:\s]*(.+?)(?:nice to have|bonus|$)',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, description.lower(), re.DOTALL | re.IGNORECASE)
+        if match:
+            items = re.split(r'[\n•\-\*\d\.]+', match.group(1))
+            requirements.extend([item.strip() for item in items if item.strip() and len(item.strip()) > 10])
+    return requirements[:10]
+
+
+def timed(func, text: str, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-kb", type=int, default=1024)
+    args = parser.parse_args()
+
+    scraper = JobScraper()
+    sizes = []
+    size = 16
+    while size <= args.max_kb:
+        sizes.append(size)
+        size *= 4
+
+    print(f"{'input':<15}{'size':>8}{'new ms':>10}{'new us/KB':>11}{'old ms':>10}{'old us/KB':>11}")
+    for name, unit in PATHOLOGICAL.items():
+        for kb in sizes:
+            text = (unit * (kb * 1024 // len(unit) + 1))[:kb * 1024]
+            new = timed(scraper.extract_requirements, text)
+            old = timed(legacy_extract_requirements, text)
+            print(
+                f"{name:<15}{kb:>6}KB{new * 1000:>10.2f}{new * 1e6 / kb:>11.1f}"
+                f"{old * 1000:>10.2f}{old * 1e6 / kb:>11.1f}"
+            )
+    print("Linear behaviour shows as a flat us/KB column as the input grows.")
+
+    descriptions = [
+        "About us\nWe ship.\nRequirements:\n- 5+ years of Python\n- Strong PostgreSQL and Redis skills\n"
+        "Nice to have: GraphQL\nBenefits\n- Health insurance" * (i % 3 + 1)
+        for i in range(5000)
+    ]
+    start = time.perf_counter()
+    scraper.extract_requirements_batch(descriptions, skills=True)
+    elapsed = time.perf_counter() - start
+    print(f"batch with skill mapping: {len(descriptions)} descriptions in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+Benchmark Corpora
+Deterministic synthetic resumes, RSS feeds, career pages and job descriptions
+
+Every generator takes a seed and builds its output from fixed vocabularies
+with ``random.Random``, so the same arguments always produce byte-identical
+documents. PDF and DOCX files are assembled by hand (a minimal PDF with one
+Helvetica text stream per page, a DOCX zip holding only the parts
+python-docx needs) so no writer library is required.
+"""
+
+import hashlib
+import io
+import random
+import zipfile
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+from xml.sax.saxutils import escape
+
+FIRST_NAMES = ["Ada", "Grace", "Linus", "Margaret", "Alan", "Barbara", "Dennis", "Frances", "Ken", "Radia"]
+LAST_NAMES = ["Lovelace", "Hopper", "Torvalds", "Hamilton", "Turing", "Liskov", "Ritchie", "Allen", "Thompson"]
+SKILLS = [
+    "Python", "JavaScript", "TypeScript", "React", "Node.js", "PostgreSQL", "Redis", "Kubernetes", "Docker",
+    "AWS", "GCP", "Terraform", "Go", "Rust", "Java", "Kotlin", "GraphQL", "Django", "Flask", "FastAPI",
+    "Kafka", "Spark", "Airflow", "Machine Learning", "TensorFlow", "PyTorch", "SQL", "Linux", "CI/CD", "Git"
+]
+ALIASES = ["k8s", "golang", "postgres", "nodejs", "reactjs"]
+TITLES = [
+    "Software Engineer", "Senior Software Engineer", "Backend Developer", "Frontend Developer",
+    "Data Engineer", "DevOps Engineer", "Engineering Manager", "Full Stack Developer", "Data Scientist"
+]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises", "Cyberdyne"]
+DEGREES = ["Bachelor of Science", "Master of Science", "PhD", "Bachelor of Engineering"]
+FIELDS = ["Computer Science", "Software Engineering", "Mathematics", "Electrical Engineering"]
+LOCATIONS = ["Remote", "Berlin, Germany", "New York, NY", "London, UK", "Work from home", "Toronto", "Anywhere"]
+FILLER = (
+    "built shipped designed scaled maintained migrated services pipelines platform customers latency "
+    "reliability team mentoring on-call observability throughput architecture roadmap stakeholders"
+).split()
+
+_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def digest(*parts) -> str:
+    """Short content hash, used to tell whether a corpus changed between runs."""
+    hasher = hashlib.blake2b(digest_size=8)
+    for part in parts:
+        hasher.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(FILLER) for _ in range(words)).capitalize() + "."
+
+
+# Resumes
+
+def resume_text(seed: int, roles: int = 3) -> str:
+    """A plain-text resume with contact details, skills, ``roles`` positions and education."""
+    rng = random.Random(seed)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    handle = f"{first}{last}".lower()
+    skills = rng.sample(SKILLS, rng.randint(6, 14)) + rng.sample(ALIASES, 2)
+    lines = [
+        f"{first} {last}",
+        f"{handle}@example.com | +1 (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        f"linkedin.com/in/{handle} | github.com/{handle}",
+        "",
+        "Summary",
+        f"{rng.choice(TITLES)} with {rng.randint(2, 15)}+ years of experience in software development.",
+        "",
+        "Skills",
+        ", ".join(skills),
+        "",
+        "Experience",
+    ]
+    year = 2024
+    for _ in range(roles):
+        start = year - rng.randint(1, 4)
+        lines.append(f"{rng.choice(TITLES)} - {rng.choice(COMPANIES)} ({start} - {year})")
+        for _ in range(rng.randint(3, 6)):
+            lines.append(f"- {_sentence(rng, rng.randint(8, 18))} Used {rng.choice(SKILLS)}.")
+        lines.append("")
+        year = max(start, 2000)
+    lines.extend([
+        "Education",
+        f"{rng.choice(DEGREES)} in {rng.choice(FIELDS)}, State University, {year - 4}",
+    ])
+    return "\n".join(lines) + "\n"
+
+
+def edge_case_resumes() -> Dict[str, str]:
+    """Plain-text resumes that stress the extractors rather than the happy path."""
+    rng = random.Random(7)
+    return {
+        "empty": "",
+        "whitespace": " \n\t" * 2000,
+        "no-contact": "\n".join(_sentence(rng, 12) for _ in range(200)),
+        "unicode": "Zoë Łukasiewicz — Ingénieure logiciel\nzoe@exämple.com\nSkills: Python, Kubernetes, 数据\n" * 50,
+        "single-line": " ".join(rng.choice(FILLER + SKILLS) for _ in range(20000)),
+        "skill-dense": ", ".join(rng.choice(SKILLS + ALIASES) for _ in range(5000)),
+    }
+
+
+def _pdf_literal(line: str) -> str:
+    line = line.encode("latin-1", "replace").decode("latin-1")
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def pdf_document(text: str, lines_per_page: int = 50) -> bytes:
+    """A minimal uncompressed PDF with ``text`` set in Helvetica, one line per text row."""
+    lines = text.splitlines() or [""]
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+
+    # 1: catalog, 2: page tree, 3: font, then a page and its content stream per page
+    kids = " ".join(f"{4 + 2 * number} 0 R" for number in range(len(pages)))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    for number, page_lines in enumerate(pages):
+        content = "BT /F1 10 Tf 12 TL 50 780 Td " + " ".join(
+            f"({_pdf_literal(line)}) Tj T*" for line in page_lines
+        ) + " ET"
+        stream = content.encode("latin-1")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * number} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+
+def docx_document(text: str) -> bytes:
+    """A minimal DOCX with one paragraph per line of ``text``."""
+    paragraphs = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>' for line in text.splitlines()
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{paragraphs}</w:body></w:document>'
+    )
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, body in (
+            ("[Content_Types].xml", _DOCX_CONTENT_TYPES),
+            ("_rels/.rels", _DOCX_RELS),
+            ("word/document.xml", document),
+        ):
+            # Fixed timestamps keep the archive byte-identical across runs
+            archive.writestr(zipfile.ZipInfo(name, date_time=(2024, 1, 1, 0, 0, 0)), body)
+    return out.getvalue()
+
+
+def resume_corpus(count: int, seed: int = 1) -> List[Tuple[str, bytes, str]]:
+    """``(name, file_content, file_type)`` resumes, cycling through formats and sizes."""
+    corpus = []
+    sizes = {"small": 2, "medium": 8, "large": 40}
+    for index in range(count):
+        # Formats cycle fastest, so every format gets every size
+        size = list(sizes)[index // 3 % len(sizes)]
+        text = resume_text(seed * 1000 + index, roles=sizes[size])
+        kind = ("pdf", "docx", "txt")[index % 3]
+        content = pdf_document(text) if kind == "pdf" else docx_document(text) if kind == "docx" else text.encode()
+        corpus.append((f"{kind}-{size}", content, kind))
+    return corpus
+
+
+def edge_case_corpus() -> List[Tuple[str, bytes, str]]:
+    """``(name, file_content, file_type)`` edge cases, including an empty DOCX and a corrupt PDF."""
+    texts = edge_case_resumes()
+    corpus = [(f"txt-{name}", text.encode("utf-8"), "txt") for name, text in texts.items()]
+    corpus.append(("pdf-unicode", pdf_document(texts["unicode"]), "pdf"))
+    corpus.append(("docx-empty", docx_document(""), "docx"))
+    corpus.append(("pdf-corrupt", b"%PDF-1.4\n" + bytes(range(256)) * 8, "pdf"))
+    return corpus
+
+
+# Job descriptions
+
+def job_description(rng: random.Random, html: bool = True) -> str:
+    """A job posting with about, requirements, nice-to-have and benefits sections."""
+    def bullets(count: int) -> List[str]:
+        return [
+            f"{rng.randint(1, 8)}+ years of {rng.choice(SKILLS)} and {rng.choice(SKILLS)} experience"
+            if rng.random() < 0.5 else f"Strong {rng.choice(SKILLS)} skills; {_sentence(rng, 6).lower()}"
+            for _ in range(count)
+        ]
+
+    sections = [
+        ("About us", [_sentence(rng, rng.randint(15, 40)) for _ in range(rng.randint(1, 3))]),
+        (rng.choice(["Requirements", "Qualifications", "What we're looking for", "You should have"]),
+         bullets(rng.randint(3, 9))),
+        ("Nice to have", bullets(rng.randint(1, 3))),
+        ("Benefits", ["Health insurance", "Remote stipend", "Learning budget"]),
+    ]
+    if not html:
+        return "\n".join(f"{title}:\n" + "\n".join(f"- {item}" for item in items) for title, items in sections)
+    return "\n".join(
+        f"<h3>{escape(title)}</h3><ul>" + "".join(f"<li>{escape(item)}</li>" for item in items) + "</ul>"
+        for title, items in sections
+    )
+
+
+def job_descriptions(count: int, seed: int = 3) -> List[str]:
+    """Plain-text descriptions, with pathological inputs mixed in every 50th slot."""
+    rng = random.Random(seed)
+    pathological = [
+        "lorem ipsum dolor sit amet " * 2000,
+        "requirements must have qualifications you will need " * 1000,
+        "requirements:" + " " * 50000,
+        "Requirements:\n" + "\n- 5+ years of python and distributed systems experience" * 2000,
+        "",
+    ]
+    return [
+        pathological[(index // 50) % len(pathological)] if index % 50 == 49 else job_description(rng, html=False)
+        for index in range(count)
+    ]
+
+
+def raw_jobs(count: int, seed: int = 5) -> List[Dict]:
+    """Feed items as the RSS parser yields them, with HTML descriptions."""
+    rng = random.Random(seed)
+    jobs = []
+    for index in range(count):
+        description = job_description(rng)
+        if index % 100 == 99:
+            # Oversized description with script/style noise and entities
+            description = "<style>p{}</style><script>x<y</script>" + description * 40 + "&amp;&nbsp;&#8212;"
+        jobs.append({
+            "title": f"  {rng.choice(TITLES)} \n",
+            "company": rng.choice(COMPANIES) if index % 7 else "",
+            "location": rng.choice(LOCATIONS),
+            "description": description,
+            "link": f"https://jobs.example.com/{index}",
+            "pubDate": format_datetime(_EPOCH - timedelta(hours=index)),
+            "source": "bench"
+        })
+    return jobs
+
+
+# Feeds and career pages
+
+def rss_feed(count: int, seed: int = 11, tag: str = "feed") -> bytes:
+    """An RSS 2.0 document with ``count`` items, including CDATA, namespaced and empty fields."""
+    rng = random.Random(seed)
+    items = []
+    for index in range(count):
+        description = job_description(rng)
+        if index % 10 == 0:
+            body = f"<![CDATA[{description}]]>"
+        else:
+            body = escape(description)
+        extra = '<atom:link href="https://example.com/self"/>' if index % 25 == 0 else ""
+        title = "" if index % 97 == 96 else escape(f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)} ({index})")
+        items.append(
+            f"<item><title>{title}</title><description>{body}</description>"
+            f"<link>https://example.com/{tag}/{index}</link><guid>{tag}-{index}</guid>{extra}"
+            f"<pubDate>{format_datetime(_EPOCH - timedelta(minutes=index))}</pubDate></item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"><channel>'
+        f"<title>{escape(tag)}</title><link>https://example.com/</link>"
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def career_page(count: int, seed: int = 13) -> bytes:
+    """A company career page with ``count`` job cards matching ``JOB_CARD_SELECTORS``."""
+    rng = random.Random(seed)
+    cards = "".join(
+        f'<div class="job-card" data-id="{index}"><h3 class="job-title">{escape(rng.choice(TITLES))}</h3>'
+        f'<span class="location">{escape(rng.choice(LOCATIONS))}</span>'
+        f'<a href="/careers/{index}">Apply</a><p>{_sentence(rng, 20)}</p></div>'
+        for index in range(count)
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>Careers</title><style>.job-card{margin:1em}</style>"
+        "<script>window.analytics = {};</script></head>"
+        f"<body><nav>Home | About | Careers</nav><main>{cards}</main><footer>&copy; 2024</footer></body></html>"
+    ).encode("utf-8")
+
+
+def skill_pairs(count: int, seed: int = 17) -> List[Tuple[List[str], List[str]]]:
+    """``(resume_skills, job_requirements)`` pairs for match scoring."""
+    rng = random.Random(seed)
+    return [
+        (rng.sample(SKILLS, rng.randint(3, 15)), rng.sample(SKILLS, rng.randint(1, 10)))
+        for _ in range(count)
+    ]
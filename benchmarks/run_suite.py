@@ -0,0 +1,345 @@
+"""
+Benchmark Suite
+Offline benchmarks for the resume parser, job scraper and AI match fallback
+
+Every case runs against deterministic synthetic corpora (corpora.py) and, for
+the network paths, a local stub server (stub_server.py), and reports
+throughput and p50 latency per operation (both from the fastest timed
+pass), p99 latency over all passes and peak traced memory.
+``--update-baseline`` saves the results as the JSON baseline and ``--check``
+exits with status 1 when a case regresses past ``--threshold`` against it:
+throughput lower, or p50 latency or peak memory higher, by that fraction.
+p99 is reported but never checked: with a few dozen ops per case it is
+effectively the slowest op, which one scheduler hiccup decides. Cases
+whose corpus changed since the baseline are reported but not checked.
+
+Usage: python benchmarks/run_suite.py [--quick] [--case SUBSTRING] [--repeat N] [--json PATH]
+       [--baseline PATH] [--update-baseline] [--check] [--threshold FRACTION]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+BENCHMARKS = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARKS.parents[0] / "src" / "utils"))
+sys.path.insert(0, str(BENCHMARKS))
+
+import corpora  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+DEFAULT_BASELINE = BENCHMARKS / "baseline.json"
+
+# Latency differences below this many milliseconds are never a regression
+LATENCY_FLOOR_MS = 0.1
+
+
+class Workload(NamedTuple):
+    """Operations to time: ``call(op)`` runs one and returns a result (awaitable if ``is_async``)."""
+    ops: list
+    call: Callable
+    units: str
+    # Units processed by one op, computed from the op and its result
+    per_op: Callable = lambda op, result: 1
+    corpus: str = ""
+    is_async: bool = False
+
+
+# Cases: each takes (scale, server) and returns a Workload
+
+def _resume_case(kind: Optional[str]):
+    def build(scale: float, server: StubServer) -> Workload:
+        from resume_parser import parse_resume
+        if kind is None:
+            corpus = corpora.edge_case_corpus()
+        else:
+            corpus = [item for item in corpora.resume_corpus(max(3, int(30 * scale))) if item[2] == kind]
+        return Workload(
+            ops=corpus,
+            call=lambda item: parse_resume(item[1], item[2], use_cache=False),
+            units="resumes",
+            corpus=corpora.digest(*(content for _, content, _ in corpus))
+        )
+    return build
+
+
+def _extract_requirements(scale: float, server: StubServer) -> Workload:
+    from job_scraper import JobScraper
+    scraper = JobScraper()
+    descriptions = corpora.job_descriptions(int(2000 * scale))
+    return Workload(
+        ops=descriptions,
+        call=scraper.extract_requirements,
+        units="descriptions",
+        corpus=corpora.digest(*descriptions)
+    )
+
+
+def _clean_job_data(scale: float, server: StubServer) -> Workload:
+    from job_scraper import JobScraper
+    scraper = JobScraper()
+    jobs = corpora.raw_jobs(int(5000 * scale))
+    discovered_at = "2024-01-01T00:00:00"
+    return Workload(
+        ops=jobs,
+        call=lambda job: scraper.clean_job_data(job, discovered_at),
+        units="jobs",
+        corpus=corpora.digest(*(job["description"] for job in jobs))
+    )
+
+
+def _scrape_rss_feed(cached: bool):
+    def build(scale: float, server: StubServer) -> Workload:
+        from feed_cache import FeedCache
+        from job_scraper import JobScraper, create_http_client
+        scraper = JobScraper()
+        items = max(100, int(5000 * scale))
+        url = server.url(f"/feeds/{items}.xml")
+        cache = FeedCache(tempfile.mkdtemp(prefix="bench-feeds-")) if cached else None
+        state = {}
+
+        async def call(_):
+            if "client" not in state:
+                state["client"] = create_http_client()
+            return await scraper.scrape_rss_feed(url, client=state["client"], cache=cache)
+
+        return Workload(
+            ops=list(range(max(2, int(5 * scale)))),
+            call=call,
+            units="items",
+            per_op=lambda op, result: len(result),
+            corpus=corpora.digest(corpora.rss_feed(items, tag=f"feed{items}")),
+            is_async=True
+        )
+    return build
+
+
+def _discover_jobs(scale: float, server: StubServer) -> Workload:
+    from job_scraper import discover_jobs
+    items = max(50, int(1000 * scale))
+    sources = [
+        {"name": f"Feed {number}", "type": "rss", "url": server.url(f"/feeds/{items + number}.xml")}
+        for number in range(4)
+    ]
+    sources += [
+        {"name": "Careers", "type": "career", "url": server.url("/careers/50.html")},
+        {"name": "API", "type": "api", "url": server.url("/api")},
+        {"name": "Broken", "type": "rss", "url": server.url("/error")},
+    ]
+    return Workload(
+        ops=list(range(max(1, int(3 * scale)))),
+        call=lambda _: discover_jobs(sources, concurrent=True, source_timeout=30.0),
+        units="jobs",
+        per_op=lambda op, result: len(result),
+        corpus=corpora.digest(*(corpora.rss_feed(items + number, tag=f"feed{items + number}")
+                                for number in range(4)), corpora.career_page(50)),
+        is_async=True
+    )
+
+
+def _calculate_job_match_fallback(scale: float, server: StubServer) -> Workload:
+    import ai_service
+    from ai_service import AIService, calculate_job_match
+
+    class ProseService(AIService):
+        """Offline provider whose answers are not JSON, forcing the local score."""
+
+        def _detect_provider(self) -> str:
+            return "mock"
+
+        def _generate_mock(self, prompt: str) -> str:
+            return "Strong overlap in backend skills; consider learning Kubernetes."
+
+    ai_service._ai_service = ProseService()
+    pairs = corpora.skill_pairs(int(2000 * scale))
+    return Workload(
+        ops=pairs,
+        call=lambda pair: calculate_job_match(pair[0], pair[1], use_cache=False),
+        units="matches",
+        corpus=corpora.digest(*pairs),
+        is_async=True
+    )
+
+
+CASES: Dict[str, Callable[[float, StubServer], Workload]] = {
+    "parse_resume[pdf]": _resume_case("pdf"),
+    "parse_resume[docx]": _resume_case("docx"),
+    "parse_resume[txt]": _resume_case("txt"),
+    "parse_resume[edge]": _resume_case(None),
+    "extract_requirements": _extract_requirements,
+    "clean_job_data": _clean_job_data,
+    "scrape_rss_feed": _scrape_rss_feed(cached=False),
+    "scrape_rss_feed[304]": _scrape_rss_feed(cached=True),
+    "discover_jobs": _discover_jobs,
+    "calculate_job_match[fallback]": _calculate_job_match_fallback,
+}
+
+
+# Measurement
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+async def _run_passes(workload: Workload, passes: int, latencies: Optional[list]) -> int:
+    """Run every op ``passes`` times, appending each op's duration to ``latencies``."""
+    units = 0
+    for _ in range(passes):
+        for op in workload.ops:
+            start = time.perf_counter()
+            result = workload.call(op)
+            if workload.is_async:
+                result = await result
+            if latencies is not None:
+                latencies.append(time.perf_counter() - start)
+            units += workload.per_op(op, result)
+    return units
+
+
+async def _measure(workload: Workload, repeat: int) -> Dict:
+    # Everything runs in one event loop so pooled connections survive between passes
+    await _run_passes(workload, 1, None)  # warm-up: imports, compiled patterns, connections
+
+    # Throughput and p50 come from the fastest pass: slower passes mostly measure machine noise
+    latencies: List[float] = []
+    throughput = 0.0
+    p50 = None
+    for _ in range(repeat):
+        timings: List[float] = []
+        start = time.perf_counter()
+        units = await _run_passes(workload, 1, timings)
+        elapsed = time.perf_counter() - start
+        if elapsed:
+            throughput = max(throughput, units / elapsed)
+        timings.sort()
+        median = _percentile(timings, 0.50)
+        p50 = median if p50 is None else min(p50, median)
+        latencies.extend(timings)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    await _run_passes(workload, 1, None)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "ops": len(latencies),
+        "units": workload.units,
+        "throughput": throughput,
+        "p50_ms": (p50 or 0.0) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "peak_kib": peak / 1024,
+        "corpus": workload.corpus
+    }
+
+
+def run_case(name: str, scale: float, repeat: int, server: StubServer) -> Dict:
+    """Time ``repeat`` passes over the case's ops, then trace one more pass for peak memory."""
+    workload = CASES[name](scale, server)
+    # Output from the code under test (error prints) would drown the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        return asyncio.run(_measure(workload, repeat))
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """Describe every regression of ``results`` against ``baseline``."""
+    problems = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if base.get("corpus") != result["corpus"]:
+            print(f"  {name}: corpus differs from the baseline, not checked")
+            continue
+        if result["throughput"] < base["throughput"] * (1 - threshold):
+            problems.append(
+                f"{name}: throughput {result['throughput']:.1f} {result['units']}/s "
+                f"< baseline {base['throughput']:.1f}"
+            )
+        if result["p50_ms"] > base["p50_ms"] * (1 + threshold) + LATENCY_FLOOR_MS:
+            problems.append(f"{name}: p50 {result['p50_ms']:.2f} ms > baseline {base['p50_ms']:.2f} ms")
+        if result["peak_kib"] > base["peak_kib"] * (1 + threshold) + 64:
+            problems.append(f"{name}: peak {result['peak_kib']:.0f} KiB > baseline {base['peak_kib']:.0f} KiB")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="a fifth of the corpus sizes, for smoke runs")
+    parser.add_argument("--case", action="append", default=[], help="run only cases containing this text")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes over each corpus")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true", help="exit 1 on a regression against the baseline")
+    # Shared machines vary by a third run to run; tighten this on a quiet, dedicated host
+    parser.add_argument("--threshold", type=float, default=0.5)
+    args = parser.parse_args()
+
+    # Stay offline and uncached regardless of the caller's environment
+    for name in ("FEED_CACHE_DIR", "OPENAI_API_KEY", "GEMINI_API_KEY", "RESUME_CACHE_DB"):
+        os.environ.pop(name, None)
+
+    scale = 0.2 if args.quick else 1.0
+    names = [name for name in CASES if not args.case or any(text in name for text in args.case)]
+    results = {}
+    print(f"{'case':<32}{'ops':>7}{'throughput':>14}  {'unit':<13}{'p50 ms':>9}{'p99 ms':>9}{'peak KiB':>10}")
+    with StubServer() as server:
+        for name in names:
+            result = results[name] = run_case(name, scale, args.repeat, server)
+            print(
+                f"{name:<32}{result['ops']:>7}{result['throughput']:>14.1f}  {result['units'] + '/s':<13}"
+                f"{result['p50_ms']:>9.2f}{result['p99_ms']:>9.2f}{result['peak_kib']:>10.0f}"
+            )
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+            "repeat": args.repeat,
+            "created": datetime.utcnow().isoformat(timespec="seconds")
+        },
+        "cases": results
+    }
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2) + "\n")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        if baseline_path.exists():
+            previous = json.loads(baseline_path.read_text())["cases"]
+            report["cases"] = {**previous, **results}
+        baseline_path.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Baseline written to {baseline_path}")
+        return
+
+    if args.check:
+        if not baseline_path.exists():
+            print(f"No baseline at {baseline_path}; run with --update-baseline first")
+            sys.exit(1)
+        problems = compare(results, json.loads(baseline_path.read_text())["cases"], args.threshold)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {baseline_path.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark Stub Server
+Local HTTP server that serves the synthetic feeds and career pages
+
+Paths:
+    /feeds/<count>.xml      RSS feed with <count> items (ETag, 304 on If-None-Match)
+    /careers/<count>.html   career page with <count> job cards
+    /slow/<seconds>/...     any of the above after a delay
+    /error                  500 Internal Server Error
+"""
+
+import re
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import corpora
+
+_ROUTE = re.compile(r"^/(feeds|careers)/(\d+)\.(xml|html)$")
+_SLOW = re.compile(r"^/slow/([\d.]+)(/.*)$")
+
+
+@lru_cache(maxsize=64)
+def _document(kind: str, count: int) -> tuple:
+    if kind == "feeds":
+        body = corpora.rss_feed(count, tag=f"feed{count}")
+        return body, "application/rss+xml", f'"{corpora.digest(body)}"'
+    body = corpora.career_page(count)
+    return body, "text/html; charset=utf-8", f'"{corpora.digest(body)}"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        slow = _SLOW.match(path)
+        if slow:
+            time.sleep(float(slow.group(1)))
+            path = slow.group(2)
+
+        route = _ROUTE.match(path)
+        if route is None:
+            status = 500 if path == "/error" else 404
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body, content_type, etag = _document(route.group(1), int(route.group(2)))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubServer:
+    """Serves the corpora on an ephemeral localhost port for the duration of a ``with`` block."""
+
+    def __init__(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,157 @@
+"""
+AI Response Cache Utilities
+Prompt-level caching and in-flight deduplication for LLM calls
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """TTL + LRU cache of generated text with single-flight deduplication.
+
+    Keys combine provider, model, max_tokens and the whitespace-normalized
+    prompt. Concurrent requests for a key that is already being generated
+    await the same upstream call instead of issuing their own. When a SQLite
+    path is given, entries are persisted and reloaded on memory misses.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 24 * 3600, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._db = None
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS ai_responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(provider: str, model: str, max_tokens: int, prompt: str) -> str:
+        """Build a cache key from the request parameters."""
+        normalized = " ".join(prompt.split())
+        raw = "\x1f".join([provider, model, str(max_tokens), normalized])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached text, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM ai_responses WHERE key = ? AND expires_at > ?",
+                    (key, now)
+                ).fetchone()
+                if row is not None:
+                    self._remember(key, row[0], row[1])
+                    self.hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: str) -> None:
+        """Store generated text for ``ttl`` seconds."""
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._remember(key, value, expires_at)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO ai_responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at)
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, value: str, expires_at: float) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_create(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[str]],
+        cacheable: Callable[[str], bool] = lambda value: True
+    ) -> str:
+        """Return the cached value or generate it once for all concurrent callers.
+
+        Values rejected by ``cacheable`` are still shared with callers waiting
+        on the same generation but are not stored.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        else:
+            if cacheable(value):
+                self.put(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    def clear(self) -> None:
+        """Drop all stored entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.coalesced = self.evictions = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM ai_responses")
+                self._db.commit()
+
+    def stats(self) -> dict:
+        """Return hit/miss/dedup counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "hitRate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "inFlight": len(self._inflight)
+            }
@@ -0,0 +1,397 @@
+"""
+AI Scheduler Utilities
+Per-provider rate limits, adaptive concurrency, retries and priority lanes
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import random
+import time
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Priority lanes: lower values are served first
+INTERACTIVE = 0
+BACKGROUND = 1
+
+# HTTP statuses worth retrying: timeouts, throttling and server errors
+RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+class AIProviderError(Exception):
+    """A provider call that failed, after any retries.
+
+    ``status_code`` is the HTTP status when the provider returned one (429
+    for throttling), ``retry_after`` the delay the provider asked for, in
+    seconds, and ``retryable`` whether trying again could succeed.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        retryable: Optional[bool] = None
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.retryable = status_code in RETRYABLE_STATUS if retryable is None else retryable
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds from a Retry-After header on the exception's response, if any."""
+    value = getattr(exc, "retry_after", None)
+    if value is None:
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        value = headers.get("retry-after") if headers is not None else None
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def provider_error(exc: BaseException) -> AIProviderError:
+    """Classify any provider SDK exception as an ``AIProviderError``.
+
+    The status is read from ``status_code`` (OpenAI), ``code`` (Google API
+    core) or the attached HTTP response. Timeouts and connection failures
+    have no status but are retryable; anything else without a status is
+    treated as a bug and is not retried.
+    """
+    if isinstance(exc, AIProviderError):
+        return exc
+    status = getattr(exc, "status_code", None)
+    if not isinstance(status, int):
+        status = getattr(exc, "code", None)
+    if not isinstance(status, int):
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if not isinstance(status, int) or not 100 <= status < 600:
+        status = None
+
+    name = type(exc).__name__
+    transient = isinstance(exc, (asyncio.TimeoutError, TimeoutError, ConnectionError)) \
+        or "Timeout" in name or "Connection" in name
+    error = AIProviderError(
+        str(exc) or name,
+        status_code=status,
+        retry_after=_retry_after(exc),
+        retryable=True if transient and status is None else None
+    )
+    error.__cause__ = exc
+    return error
+
+
+class TokenBucket:
+    """Refills ``rate_per_minute`` units per minute up to a burst of ``capacity``.
+
+    Callers reserve before they wait: the balance may go negative, and each
+    reservation sleeps until its share has refilled, so waiters are served
+    in the order they reserved.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float, max_wait: Optional[float] = None) -> Optional[float]:
+        """Take ``amount`` and return how long to wait before using it.
+
+        Returns None, taking nothing, when the wait would exceed ``max_wait``.
+        Requests larger than the burst capacity are charged the capacity.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        wait = max(0.0, (amount - self._tokens) / self.rate)
+        if max_wait is not None and wait > max_wait:
+            return None
+        self._tokens -= amount
+        return wait
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on in-flight requests, with waiters served by priority.
+
+    The limit grows by about one per limit's worth of successful calls
+    (additive increase) and halves on a 429 or when the smoothed latency
+    passes ``latency_target`` (multiplicative decrease). A decrease only
+    happens once per ``cooldown`` seconds, so one burst of 429s from a
+    single window counts as one signal.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        initial_limit: Optional[int] = None,
+        min_limit: int = 1,
+        latency_target: Optional[float] = None,
+        backoff_ratio: float = 0.5,
+        cooldown: float = 1.0
+    ):
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.limit = float(initial_limit or max_limit)
+        self.latency_target = latency_target
+        self.backoff_ratio = backoff_ratio
+        self.cooldown = cooldown
+        self.latency: Optional[float] = None
+        self.in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self._last_decrease = float("-inf")
+
+    @property
+    def current_limit(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    async def acquire(self, priority: int = BACKGROUND, timeout: Optional[float] = None) -> bool:
+        """Take a slot, returning False if none freed up within ``timeout``."""
+        if not self._waiters and self.in_flight < self.current_limit:
+            self.in_flight += 1
+            return True
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        try:
+            await asyncio.wait({future}, timeout=max(timeout, 0.0) if timeout is not None else None)
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            future.cancel()
+            raise
+        if future.done():
+            return True
+        future.cancel()
+        return False
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.current_limit:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+
+    def reset(self) -> None:
+        """Forget waiters and slots bound to a previous event loop."""
+        self._waiters = []
+        self.in_flight = 0
+
+    def on_success(self, latency: float) -> None:
+        self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+        if self.latency_target is not None and self.latency > self.latency_target:
+            self.on_overload()
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / max(self.limit, 1.0))
+            self._wake()
+
+    def on_overload(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.min_limit), self.limit * self.backoff_ratio)
+
+
+class ProviderScheduler:
+    """Admission control for one provider's API calls.
+
+    Every call takes a concurrency slot (interactive lane first, then
+    background, first come first served within a lane), then one request
+    and its estimated tokens from the requests/min and tokens/min buckets.
+    Throttling (429) and transient failures are retried with full-jitter
+    exponential backoff, honouring Retry-After, and a 429 also pauses new
+    calls for the same delay. Nothing is retried past the call's deadline,
+    which bounds queueing, backoff and (for ``run``) the call itself.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: int = 8,
+        initial_concurrency: Optional[int] = None,
+        latency_target: Optional[float] = None,
+        max_retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        deadline: float = 120.0
+    ):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.concurrency = AdaptiveConcurrency(
+            max_concurrency, initial_limit=initial_concurrency, latency_target=latency_target
+        )
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self._paused_until = 0.0
+
+        self.calls = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failures = 0
+
+    @classmethod
+    def from_env(cls, max_concurrency: int) -> "ProviderScheduler":
+        """Build a scheduler from AI_RPM, AI_TPM, AI_MAX_RETRIES, AI_RETRY_BASE_DELAY,
+        AI_RETRY_MAX_DELAY, AI_DEADLINE and AI_LATENCY_TARGET (unset limits are off)."""
+        def number(name: str, default: Optional[float]) -> Optional[float]:
+            value = os.getenv(name)
+            return float(value) if value else default
+
+        return cls(
+            requests_per_minute=number("AI_RPM", None),
+            tokens_per_minute=number("AI_TPM", None),
+            max_concurrency=max_concurrency,
+            latency_target=number("AI_LATENCY_TARGET", None),
+            max_retries=int(number("AI_MAX_RETRIES", 4)),
+            base_delay=number("AI_RETRY_BASE_DELAY", 0.5),
+            max_delay=number("AI_RETRY_MAX_DELAY", 30.0),
+            deadline=number("AI_DEADLINE", 120.0)
+        )
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Full-jitter delay before retry ``attempt`` (0-based), at least ``retry_after``."""
+        delay = random.uniform(0.0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        return max(delay, retry_after or 0.0)
+
+    async def _admit(self, tokens: int, priority: int, end: float) -> None:
+        """Wait for a concurrency slot and rate budget, or raise at the deadline."""
+        if not await self.concurrency.acquire(priority, timeout=end - time.monotonic()):
+            raise AIProviderError("deadline exceeded waiting for a request slot", retryable=False)
+        try:
+            wait = max(0.0, self._paused_until - time.monotonic())
+            for bucket, amount in ((self.requests, 1), (self.tokens, tokens)):
+                if bucket is None or amount <= 0:
+                    continue
+                budget = bucket.reserve(amount, max_wait=end - time.monotonic() - wait)
+                if budget is None:
+                    raise AIProviderError("deadline exceeded waiting for rate limit budget", retryable=False)
+                wait = max(wait, budget)
+            if wait:
+                await asyncio.sleep(wait)
+        except BaseException:
+            self.concurrency.release()
+            raise
+        self.calls += 1
+
+    def _retry_delay(self, error: AIProviderError, attempt: int, end: float) -> float:
+        """Delay before the next attempt, or raise ``error`` if it should not be retried."""
+        if error.status_code == 429:
+            self.throttled += 1
+            self.concurrency.on_overload()
+        delay = self.backoff(attempt, error.retry_after)
+        if not error.retryable or attempt >= self.max_retries or time.monotonic() + delay >= end:
+            self.failures += 1
+            raise error
+        if error.status_code == 429:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        self.retries += 1
+        return delay
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        tokens: int = 0,
+        priority: int = BACKGROUND,
+        deadline: Optional[float] = None
+    ) -> T:
+        """Await ``call()`` under the limits, retrying it until it succeeds or must give up.
+
+        ``tokens`` is the estimated prompt plus completion size. Failures
+        are raised as ``AIProviderError``.
+        """
+        end = time.monotonic() + (deadline or self.deadline)
+        attempt = 0
+        while True:
+            await self._admit(tokens, priority, end)
+            start = time.monotonic()
+            try:
+                result = await asyncio.wait_for(call(), timeout=max(end - start, 0.0))
+            except asyncio.TimeoutError:
+                error = AIProviderError("deadline exceeded waiting for the provider", retryable=False)
+            except Exception as e:
+                error = provider_error(e)
+            else:
+                self.concurrency.on_success(time.monotonic() - start)
+                return result
+            finally:
+                self.concurrency.release()
+
+            await asyncio.sleep(self._retry_delay(error, attempt, end))
+            attempt += 1
+
+    async def stream(
+        self,
+        open_stream: Callable[[], AsyncIterator[T]],
+        tokens: int = 0,
+        priority: int = BACKGROUND,
+        deadline: Optional[float] = None
+    ) -> AsyncIterator[T]:
+        """Yield from ``open_stream()`` under the limits, holding a slot until it ends.
+
+        A stream that fails before its first chunk is retried like ``run``;
+        once chunks have been yielded, a failure is raised as is. The
+        deadline bounds waiting and retries, not the stream's duration.
+        """
+        end = time.monotonic() + (deadline or self.deadline)
+        attempt = 0
+        while True:
+            await self._admit(tokens, priority, end)
+            start = time.monotonic()
+            started = False
+            stream = open_stream()
+            try:
+                async for chunk in stream:
+                    if not started:
+                        started = True
+                        self.concurrency.on_success(time.monotonic() - start)
+                    yield chunk
+                if not started:
+                    self.concurrency.on_success(time.monotonic() - start)
+                return
+            except Exception as e:
+                error = provider_error(e)
+                if started:
+                    self.failures += 1
+                    raise error
+            finally:
+                await stream.aclose()
+                self.concurrency.release()
+
+            await asyncio.sleep(self._retry_delay(error, attempt, end))
+            attempt += 1
+
+    def reset(self) -> None:
+        """Drop loop-bound waiters, e.g. when the event loop changes."""
+        self.concurrency.reset()
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "failures": self.failures,
+            "concurrencyLimit": self.concurrency.current_limit,
+            "inFlight": self.concurrency.in_flight
+        }
+
+
+def estimate_tokens(prompt: str, max_tokens: int) -> int:
+    """Rough tokens/min cost of a request: about four characters per prompt token."""
+    return len(prompt) // 4 + max_tokens
@@ -3,27 +3,123 @@ AI Service Utilities
 Integration with OpenAI and Google Gemini APIs
 """
 
+import asyncio
+import importlib.util
+import json
 import os
-from typing import Optional
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Tuple
 
-# Try to import AI libraries
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+import metrics
+from ai_cache import ResponseCache
+from ai_scheduler import BACKGROUND, INTERACTIVE, AIProviderError, ProviderScheduler, estimate_tokens
 
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
+if TYPE_CHECKING:
+    from job_matcher import JobMatchIndex
+
+
+def _module_available(name: str) -> bool:
+    """Whether ``name`` can be imported, checked without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        # The parent package of a dotted name is missing
+        return False
+
+
+# AI libraries are imported on first use; only their presence is checked here
+OPENAI_AVAILABLE = _module_available("openai")
+GEMINI_AVAILABLE = _module_available("google.generativeai")
+HTTPX_AVAILABLE = _module_available("httpx")
+
+REQUEST_SECONDS = metrics.histogram(
+    "ai_request_seconds", "AI request latency including queueing and retries, by provider and mode",
+    ("provider", "mode")
+)
+FIRST_CHUNK_SECONDS = metrics.histogram(
+    "ai_stream_first_chunk_seconds", "Time until the first chunk of a streamed AI response", ("provider",)
+)
+REQUESTS = metrics.counter(
+    "ai_requests_total", "AI requests by provider and outcome (ok, error)", ("provider", "outcome")
+)
+ERRORS = metrics.counter(
+    "ai_errors_total", "Failed AI requests by provider and HTTP status", ("provider", "status")
+)
+TOKENS = metrics.counter(
+    "ai_tokens_total", "Tokens reported by AI providers (prompt, completion)", ("provider", "kind")
+)
+CACHE_LOOKUPS = metrics.counter(
+    "ai_cache_total", "AI response cache lookups by outcome (hit, miss)", ("provider", "result")
+)
+
+# Default cap on concurrent upstream requests per AIService
+DEFAULT_MAX_IN_FLIGHT = 8
+
+# Pause between chunks of the mock provider's stream, in seconds
+MOCK_STREAM_DELAY = float(os.getenv("AI_MOCK_STREAM_DELAY", 0))
+
+
+def _close_on_shutdown(client) -> AsyncIterator[None]:
+    """Close ``client`` when the running loop shuts down its async generators.
+    
+    The generator is started here and parks at its ``yield``; the loop
+    finalizes it in ``shutdown_asyncgens`` (or ``aclose`` does earlier),
+    so the client is closed on the loop that owns its connections.
+    """
+    async def closer():
+        try:
+            yield
+        finally:
+            await client.aclose()
+    
+    generator = closer()
+    try:
+        # Runs up to the yield and registers the generator with the loop
+        generator.asend(None).send(None)
+    except StopIteration:
+        pass
+    return generator
 
 
 class AIService:
-    """Unified AI service for generating content."""
+    """Unified AI service for generating content.
+    
+    Provider calls never block the event loop: OpenAI uses its async client
+    over a shared keep-alive connection pool, Gemini uses its async API (or a
+    bounded thread pool when unavailable). Calls go through a
+    ``ProviderScheduler``: at most ``max_in_flight`` requests (AI_MAX_IN_FLIGHT)
+    run upstream at once, fewer while the provider throttles or slows down,
+    within the AI_RPM/AI_TPM rate limits, and interactive requests are
+    admitted before background ones. Throttled and transient failures are
+    retried with backoff; a call that still fails raises ``AIProviderError``.
+    Latency, reported token usage, errors and cache hits are recorded in the
+    ``ai_*`` metrics.
     
-    def __init__(self):
+    Responses are cached per provider, model, max_tokens and prompt (sized
+    by AI_CACHE_MAX_ENTRIES/AI_CACHE_TTL, persisted when AI_CACHE_DB is set)
+    and identical concurrent prompts share a single upstream call.
+    """
+    
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        scheduler: Optional[ProviderScheduler] = None
+    ):
+        self.max_in_flight = max_in_flight or int(os.getenv("AI_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT))
+        self.scheduler = scheduler or ProviderScheduler.from_env(self.max_in_flight)
+        self._loop = None
+        self._http_client = None
+        self._client_closer: Optional[AsyncIterator[None]] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.cache = cache if cache is not None else ResponseCache(
+            max_entries=int(os.getenv("AI_CACHE_MAX_ENTRIES", 1024)),
+            ttl=float(os.getenv("AI_CACHE_TTL", 24 * 3600)),
+            db_path=os.getenv("AI_CACHE_DB") or None
+        )
         self.provider = self._detect_provider()
         self._setup_client()
     
@@ -38,41 +134,241 @@ class AIService:
     def _setup_client(self):
         """Set up the AI client."""
         if self.provider == "openai" and OPENAI_AVAILABLE:
-            self.client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            self.model = os.getenv("OPENAI_MODEL", "gpt-4")
+            self.client = self._create_openai_client()
         elif self.provider == "gemini" and GEMINI_AVAILABLE:
+            self.model = "gemini-pro"
+            import google.generativeai as genai
             genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-            self.client = genai.GenerativeModel("gemini-pro")
+            self.client = genai.GenerativeModel(self.model)
         else:
+            self.model = "mock"
             self.client = None
     
-    async def generate_text(self, prompt: str, max_tokens: int = 500) -> str:
-        """Generate text using the configured AI provider."""
+    def _create_openai_client(self):
+        """Create an async OpenAI client on a pooled keep-alive HTTP transport."""
+        import openai
+        if HTTPX_AVAILABLE:
+            import httpx
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_in_flight,
+                    max_keepalive_connections=self.max_in_flight
+                ),
+                timeout=httpx.Timeout(60.0, connect=10.0)
+            )
+        return openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=self._http_client)
+    
+    def _bind_loop(self) -> ProviderScheduler:
+        """Return the scheduler, rebuilding loop-bound state when the loop changes.
+        
+        The pooled HTTP client is tied to the loop it is first used on and
+        closed when that loop shuts down (``asyncio.run`` does so on exit);
+        the next loop gets a fresh client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._loop is not None and self._http_client is not None:
+                # Pooled connections belong to the previous loop
+                self.client = self._create_openai_client()
+            self._loop = loop
+            self.scheduler.reset()
+            if self._http_client is not None:
+                self._client_closer = _close_on_shutdown(self._http_client)
+        return self.scheduler
+    
+    async def aclose(self) -> None:
+        """Release pooled connections and worker threads."""
+        if self._client_closer is not None:
+            await self._client_closer.aclose()
+            self._client_closer = None
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    async def generate_text(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        use_cache: bool = True,
+        priority: int = INTERACTIVE
+    ) -> str:
+        """Generate text using the configured AI provider.
+        
+        Pass ``use_cache=False`` to always request a fresh completion, and
+        ``priority=BACKGROUND`` for work nobody is waiting on. Raises
+        ``AIProviderError`` when the provider fails after retries.
+        """
+        if not use_cache:
+            return await self._generate_uncached(prompt, max_tokens, priority)
+        
+        key = ResponseCache.make_key(self.provider, self.model, max_tokens, prompt)
+        created = False
+        
+        def create():
+            nonlocal created
+            created = True
+            return self._generate_uncached(prompt, max_tokens, priority)
+        
+        text = await self.cache.get_or_create(key, create)
+        CACHE_LOOKUPS.inc(self.provider, "miss" if created else "hit")
+        return text
+    
+    async def stream_text(
+        self,
+        prompt: str,
+        max_tokens: int = 500,
+        use_cache: bool = True,
+        priority: int = INTERACTIVE
+    ) -> AsyncIterator[str]:
+        """Yield the completion in chunks as the provider produces them.
+        
+        A cached response is yielded as a single chunk. Once a stream
+        finishes, its full text is written to the cache, so a later
+        ``generate_text`` or ``stream_text`` for the same prompt is a hit.
+        A stream that fails before its first chunk is retried; a failure
+        after that raises ``AIProviderError``. Streams that fail or are
+        closed early are not cached.
+        """
+        key = ResponseCache.make_key(self.provider, self.model, max_tokens, prompt)
+        if use_cache:
+            cached = self.cache.get(key)
+            CACHE_LOOKUPS.inc(self.provider, "miss" if cached is None else "hit")
+            if cached is not None:
+                yield cached
+                return
+        
+        chunks = []
+        # The whole-text fallback is already recorded by _generate_uncached
+        record = True
+        if self.provider == "openai" and self.client:
+            stream = self._bind_loop().stream(
+                partial(self._stream_openai, prompt, max_tokens),
+                tokens=estimate_tokens(prompt, max_tokens),
+                priority=priority
+            )
+        elif self.provider == "gemini" and self.client and hasattr(self.client, "generate_content_async"):
+            stream = self._bind_loop().stream(
+                partial(self._stream_gemini, prompt),
+                tokens=estimate_tokens(prompt, max_tokens),
+                priority=priority
+            )
+        elif self.provider == "gemini" and self.client:
+            # Without the async API the text arrives whole
+            stream = self._stream_whole(prompt, max_tokens, priority)
+            record = False
+        else:
+            stream = self._stream_mock(prompt)
+        
+        started = time.perf_counter()
+        try:
+            async for chunk in stream:
+                if not chunks:
+                    FIRST_CHUNK_SECONDS.observe(time.perf_counter() - started, self.provider)
+                chunks.append(chunk)
+                yield chunk
+        except AIProviderError as e:
+            if record:
+                self._record_request("stream", started, e)
+            raise
+        finally:
+            await stream.aclose()
+        if record:
+            self._record_request("stream", started)
+        
+        if use_cache and chunks:
+            self.cache.put(key, "".join(chunks))
+    
+    async def _stream_openai(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        """Stream text from OpenAI."""
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            stream=True
+        )
+        async for event in stream:
+            if event.choices and event.choices[0].delta.content:
+                yield event.choices[0].delta.content
+    
+    async def _stream_gemini(self, prompt: str) -> AsyncIterator[str]:
+        """Stream text from Gemini's async API."""
+        response = await self.client.generate_content_async(prompt, stream=True)
+        async for event in response:
+            if event.text:
+                yield event.text
+    
+    async def _stream_whole(self, prompt: str, max_tokens: int, priority: int) -> AsyncIterator[str]:
+        yield await self._generate_uncached(prompt, max_tokens, priority)
+    
+    async def _stream_mock(self, prompt: str) -> AsyncIterator[str]:
+        """Yield the mock response word by word, like a real token stream."""
+        for chunk in re.findall(r"\s*\S+\s*", self._generate_mock(prompt)):
+            await asyncio.sleep(MOCK_STREAM_DELAY)
+            yield chunk
+    
+    async def _generate_uncached(self, prompt: str, max_tokens: int, priority: int = INTERACTIVE) -> str:
+        """Send the prompt to the configured provider through the scheduler."""
         if self.provider == "openai" and self.client:
-            return await self._generate_openai(prompt, max_tokens)
+            call = partial(self._generate_openai, prompt, max_tokens)
         elif self.provider == "gemini" and self.client:
-            return await self._generate_gemini(prompt, max_tokens)
+            call = partial(self._generate_gemini, prompt, max_tokens)
         else:
+            REQUESTS.inc(self.provider, "ok")
             return self._generate_mock(prompt)
+        
+        started = time.perf_counter()
+        try:
+            text = await self._bind_loop().run(call, tokens=estimate_tokens(prompt, max_tokens), priority=priority)
+        except AIProviderError as e:
+            self._record_request("generate", started, e)
+            raise
+        self._record_request("generate", started)
+        return text
+    
+    def _record_request(self, mode: str, started: float, error: Optional[AIProviderError] = None) -> None:
+        REQUEST_SECONDS.observe(time.perf_counter() - started, self.provider, mode)
+        REQUESTS.inc(self.provider, "ok" if error is None else "error")
+        if error is not None:
+            ERRORS.inc(self.provider, error.status_code or "none")
+    
+    def _record_usage(self, prompt_tokens: Optional[int], completion_tokens: Optional[int]) -> None:
+        if prompt_tokens:
+            TOKENS.inc(self.provider, "prompt", amount=prompt_tokens)
+        if completion_tokens:
+            TOKENS.inc(self.provider, "completion", amount=completion_tokens)
     
     async def _generate_openai(self, prompt: str, max_tokens: int) -> str:
         """Generate text using OpenAI."""
-        try:
-            response = self.client.chat.completions.create(
-                model=os.getenv("OPENAI_MODEL", "gpt-4"),
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=max_tokens
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            return f"Error generating content: {str(e)}"
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens
+        )
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            self._record_usage(getattr(usage, "prompt_tokens", None), getattr(usage, "completion_tokens", None))
+        return response.choices[0].message.content
     
     async def _generate_gemini(self, prompt: str, max_tokens: int) -> str:
         """Generate text using Google Gemini."""
-        try:
-            response = self.client.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            return f"Error generating content: {str(e)}"
+        if hasattr(self.client, "generate_content_async"):
+            response = await self.client.generate_content_async(prompt)
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+            response = await asyncio.get_running_loop().run_in_executor(
+                self._executor, partial(self.client.generate_content, prompt)
+            )
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            self._record_usage(
+                getattr(usage, "prompt_token_count", None), getattr(usage, "candidates_token_count", None)
+            )
+        return response.text
     
     def _generate_mock(self, prompt: str) -> str:
         """Generate mock content for testing."""
@@ -80,6 +376,11 @@ class AIService:
             return self._mock_cover_letter()
         elif "social" in prompt.lower() or "post" in prompt.lower():
             return self._mock_social_post()
+        elif "json array" in prompt.lower():
+            return json.dumps([
+                {"index": i, "score": 75, "matchingAreas": ["Python", "JavaScript"], "recommendation": "Good fit"}
+                for i in range(prompt.count("\nPair "))
+            ])
         elif "match" in prompt.lower():
             return '{"score": 75, "matchingAreas": ["Python", "JavaScript"], "recommendation": "Good fit"}'
         return "Generated content placeholder"
@@ -114,8 +415,14 @@ def get_ai_service() -> AIService:
     return _ai_service
 
 
-async def generate_social_post(topic: str, tone: str, platform: str, hashtag_count: int = 3) -> str:
-    """Generate a social media post."""
+async def generate_social_post(
+    topic: str,
+    tone: str,
+    platform: str,
+    hashtag_count: int = 3,
+    use_cache: bool = True
+) -> str:
+    """Generate a social media post. Pass ``use_cache=False`` for a fresh variant."""
     service = get_ai_service()
     
     prompt = f"""Write a {platform} post about: {topic}
@@ -123,10 +430,10 @@ Tone: {tone}
 Include {hashtag_count} relevant hashtags.
 Keep it engaging and shareable."""
     
-    return await service.generate_text(prompt, max_tokens=300)
+    return await service.generate_text(prompt, max_tokens=300, use_cache=use_cache)
 
 
-async def generate_cover_letter(
+def _cover_letter_prompt(
     name: str,
     job_title: str,
     company: str,
@@ -134,9 +441,6 @@ async def generate_cover_letter(
     experience_years: int,
     custom_instructions: str = None
 ) -> str:
-    """Generate a cover letter."""
-    service = get_ai_service()
-    
     prompt = f"""Write a professional cover letter for:
 Name: {name}
 Position: {job_title} at {company}
@@ -147,15 +451,42 @@ Keep it professional, personable, and under 400 words."""
     
     if custom_instructions:
         prompt += f"\n\nAdditional notes: {custom_instructions}"
-    
-    return await service.generate_text(prompt, max_tokens=600)
+    return prompt
 
 
-async def calculate_job_match(resume_skills: list, job_requirements: list) -> dict:
-    """Calculate job match score using AI."""
+async def generate_cover_letter(
+    name: str,
+    job_title: str,
+    company: str,
+    skills: list,
+    experience_years: int,
+    custom_instructions: str = None,
+    use_cache: bool = True
+) -> str:
+    """Generate a cover letter. Pass ``use_cache=False`` for a fresh variant."""
     service = get_ai_service()
-    
-    prompt = f"""Compare these resume skills with job requirements and provide a match analysis.
+    prompt = _cover_letter_prompt(name, job_title, company, skills, experience_years, custom_instructions)
+    return await service.generate_text(prompt, max_tokens=600, use_cache=use_cache)
+
+
+async def stream_cover_letter(
+    name: str,
+    job_title: str,
+    company: str,
+    skills: list,
+    experience_years: int,
+    custom_instructions: str = None,
+    use_cache: bool = True
+) -> AsyncIterator[str]:
+    """Stream a cover letter in chunks as it is generated (see ``AIService.stream_text``)."""
+    service = get_ai_service()
+    prompt = _cover_letter_prompt(name, job_title, company, skills, experience_years, custom_instructions)
+    async for chunk in service.stream_text(prompt, max_tokens=600, use_cache=use_cache):
+        yield chunk
+
+
+def _job_match_prompt(resume_skills: list, job_requirements: list) -> str:
+    return f"""Compare these resume skills with job requirements and provide a match analysis.
 
 Resume Skills: {', '.join(resume_skills)}
 Job Requirements: {', '.join(job_requirements)}
@@ -165,22 +496,248 @@ Return a JSON object with:
 - matchingSkills: array of matching skills
 - missingSkills: array of skills to develop
 - recommendation: brief advice"""
+
+
+def _local_job_match(resume_skills: list, job_requirements: list) -> dict:
+    """Basic substring overlap score used when the AI answer is unusable."""
+    matching = [s for s in resume_skills if any(r.lower() in s.lower() for r in job_requirements)]
+    missing = [r for r in job_requirements if not any(s.lower() in r.lower() for s in resume_skills)]
+    score = int((len(matching) / max(len(job_requirements), 1)) * 100)
     
-    response = await service.generate_text(prompt, max_tokens=300)
+    return {
+        "score": score,
+        "matchingSkills": matching,
+        "missingSkills": missing,
+        "recommendation": "Good potential match" if score >= 60 else "Consider upskilling"
+    }
+
+
+async def calculate_job_match(resume_skills: list, job_requirements: list, use_cache: bool = True) -> dict:
+    """Calculate job match score using AI, in the background lane."""
+    return await _match_with(get_ai_service(), resume_skills, job_requirements, use_cache)
+
+
+async def _match_with(service: AIService, resume_skills: list, job_requirements: list, use_cache: bool) -> dict:
+    """Score one pair on ``service``, falling back to a local score."""
+    prompt = _job_match_prompt(resume_skills, job_requirements)
     
     # Try to parse as JSON, fallback to default
     try:
-        import json
+        response = await service.generate_text(prompt, max_tokens=300, use_cache=use_cache, priority=BACKGROUND)
         return json.loads(response)
-    except:
-        # Calculate basic match
-        matching = [s for s in resume_skills if any(r.lower() in s.lower() for r in job_requirements)]
-        missing = [r for r in job_requirements if not any(s.lower() in r.lower() for s in resume_skills)]
-        score = int((len(matching) / max(len(job_requirements), 1)) * 100)
+    except AIProviderError as e:
+        print(f"Error in job match: {e}")
+    except (TypeError, ValueError):
+        pass
+    # Calculate basic match
+    return _local_job_match(resume_skills, job_requirements)
+
+
+class MatchBatcher:
+    """Coalesces concurrent job-match requests into batched LLM prompts.
+    
+    Requests arriving within ``max_wait`` seconds of the first pending one
+    (or until ``max_batch_size`` are pending) are sent as a single prompt
+    asking for a JSON array with one analysis per pair, and each caller's
+    awaitable receives its own entry. Entries missing from a response that
+    does not parse, is not an array or has the wrong shape are retried one
+    by one on the same service, falling back to a local score. When the
+    provider fails outright (``AIProviderError``), the whole batch gets
+    local scores instead; any other error is raised to the callers.
+    
+    A batch holding a single request is sent as an ordinary match prompt,
+    so it shares the per-pair response cache.
+    """
+    
+    def __init__(
+        self,
+        service: Optional[AIService] = None,
+        max_batch_size: int = 10,
+        max_wait: float = 0.02,
+        use_cache: bool = True
+    ):
+        self.service = service
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.use_cache = use_cache
+        self._pending: List[Tuple[list, list, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
         
-        return {
-            "score": score,
-            "matchingSkills": matching,
-            "missingSkills": missing,
-            "recommendation": "Good potential match" if score >= 60 else "Consider upskilling"
-        }
+        self.batches = 0
+        self.fallbacks = 0
+    
+    async def match(self, resume_skills: list, job_requirements: list) -> dict:
+        """Queue one resume/job pair and wait for its analysis."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((list(resume_skills), list(job_requirements), future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+    
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending[:self.max_batch_size], self._pending[self.max_batch_size:]
+        if self._pending:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush)
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, batch: List[Tuple[list, list, asyncio.Future]]) -> None:
+        batch = [item for item in batch if not item[2].done()]
+        if not batch:
+            return
+        self.batches += 1
+        
+        if len(batch) == 1:
+            resume_skills, job_requirements, future = batch[0]
+            await self._resolve_single(resume_skills, job_requirements, future)
+            return
+        
+        service = self.service or get_ai_service()
+        results: List[Optional[dict]] = [None] * len(batch)
+        try:
+            response = await service.generate_text(
+                _batch_match_prompt([(skills, requirements) for skills, requirements, _ in batch]),
+                max_tokens=min(300 * len(batch), 4000),
+                use_cache=self.use_cache,
+                priority=BACKGROUND
+            )
+            results = _parse_batch_matches(response, len(batch))
+        except AIProviderError as e:
+            # Retrying pair by pair would only add load to a failing provider
+            print(f"Error in batched job match: {e}")
+            results = [_local_job_match(skills, requirements) for skills, requirements, _ in batch]
+        except (TypeError, ValueError):
+            # Unusable answer; every pair is retried on its own below
+            pass
+        except Exception as e:
+            # A bug, not a bad answer: fail the callers instead of hiding it
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        retries = []
+        for (resume_skills, job_requirements, future), result in zip(batch, results):
+            if result is None:
+                self.fallbacks += 1
+                retries.append(self._resolve_single(resume_skills, job_requirements, future))
+            elif not future.done():
+                future.set_result(result)
+        if retries:
+            await asyncio.gather(*retries)
+    
+    async def _resolve_single(self, resume_skills: list, job_requirements: list, future: asyncio.Future) -> None:
+        service = self.service or get_ai_service()
+        try:
+            result = await _match_with(service, resume_skills, job_requirements, self.use_cache)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(result)
+
+
+def _batch_match_prompt(pairs: List[Tuple[list, list]]) -> str:
+    """One prompt for several pairs; shared resume skills are listed once."""
+    shared = all(skills == pairs[0][0] for skills, _ in pairs)
+    lines = ["Compare resume skills with the requirements of each job below and provide a match analysis.", ""]
+    if shared:
+        lines.append(f"Resume Skills: {', '.join(pairs[0][0])}")
+    for number, (skills, requirements) in enumerate(pairs):
+        lines.append("")
+        lines.append(f"Pair {number}:")
+        if not shared:
+            lines.append(f"Resume Skills: {', '.join(skills)}")
+        lines.append(f"Job Requirements: {', '.join(requirements)}")
+    lines.append("")
+    lines.append(f"""Return only a JSON array of {len(pairs)} objects, one per pair in the same order, each with:
+- index: the pair number
+- score: number (0-100)
+- matchingSkills: array of matching skills
+- missingSkills: array of skills to develop
+- recommendation: brief advice""")
+    return "\n".join(lines)
+
+
+def _parse_batch_matches(response: str, count: int) -> List[Optional[dict]]:
+    """Map a batched response back to pairs; None marks entries to retry."""
+    results: List[Optional[dict]] = [None] * count
+    start, end = response.find("["), response.rfind("]")
+    if start == -1 or end <= start:
+        return results
+    try:
+        entries = json.loads(response[start:end + 1])
+    except ValueError:
+        return results
+    if not isinstance(entries, list):
+        return results
+    
+    for position, entry in enumerate(entries):
+        if not isinstance(entry, dict) or "score" not in entry:
+            continue
+        index = entry.pop("index", position)
+        if isinstance(index, int) and 0 <= index < count and results[index] is None:
+            results[index] = entry
+    return results
+
+
+# Singleton instance
+_match_batcher: Optional[MatchBatcher] = None
+
+
+def get_match_batcher() -> MatchBatcher:
+    """Get or create the shared match batcher (AI_MATCH_BATCH_SIZE / AI_MATCH_BATCH_WAIT)."""
+    global _match_batcher
+    if _match_batcher is None:
+        _match_batcher = MatchBatcher(
+            max_batch_size=int(os.getenv("AI_MATCH_BATCH_SIZE", 10)),
+            max_wait=float(os.getenv("AI_MATCH_BATCH_WAIT", 0.02))
+        )
+    return _match_batcher
+
+
+async def rank_job_matches(
+    resume_skills: list,
+    jobs: list,
+    top_k: int = 10,
+    explain: bool = True,
+    index: Optional["JobMatchIndex"] = None
+) -> list:
+    """Rank a job catalog for a profile, calling the AI only for the shortlist.
+    
+    Every job is scored locally in one vectorized pass over its
+    ``requirements``; only the ``top_k`` best get an AI analysis for a
+    narrative ``recommendation``, sent through the shared ``MatchBatcher``
+    so the shortlist costs a few batched prompts rather than one each. Pass a prebuilt ``index`` whose
+    job ids are positions in ``jobs`` to reuse it across profiles.
+    """
+    if index is None:
+        from job_matcher import JobMatchIndex
+        from resume_parser import ResumeParser
+        index = JobMatchIndex(matcher=ResumeParser.default_matcher())
+        index.add_jobs((position, job.get("requirements", [])) for position, job in enumerate(jobs))
+    
+    matches = index.top_matches(resume_skills, k=top_k)
+    
+    if explain and matches:
+        batcher = get_match_batcher()
+        analyses = await asyncio.gather(*(
+            batcher.match(resume_skills, jobs[match["jobId"]].get("requirements", []))
+            for match in matches
+        ))
+        for match, analysis in zip(matches, analyses):
+            match["recommendation"] = analysis.get("recommendation", "")
+    
+    for match in matches:
+        match["job"] = jobs[match["jobId"]]
+    return matches
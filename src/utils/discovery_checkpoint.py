@@ -0,0 +1,140 @@
+"""
+Discovery Checkpoint Utilities
+Persistent per-source seen-sets for incremental (delta) job discovery
+"""
+
+import hashlib
+import json
+import os
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+
+def _digest(value: str) -> str:
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def posting_key(job: Dict) -> str:
+    """Stable identity of a raw posting: its GUID or apply URL, else title + company."""
+    identity = job.get("guid") or job.get("link") or job.get("applyUrl")
+    if identity:
+        identity = identity.strip().split("#", 1)[0]
+    else:
+        identity = "\x1f".join([job.get("title", ""), job.get("company", "")])
+    return _digest(identity)
+
+
+def content_hash(job: Dict) -> str:
+    """Hash of the fields that make a posting worth re-processing when edited."""
+    return _digest("\x1f".join(
+        str(job.get(field) or "") for field in ("title", "company", "location", "description")
+    ))
+
+
+def _timestamp(pub_date: Optional[str]) -> Optional[float]:
+    if not pub_date:
+        return None
+    try:
+        return parsedate_to_datetime(pub_date).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class SourceDelta:
+    """Tracks one source during one run and decides which postings to emit."""
+
+    def __init__(self, checkpoint: "DiscoveryCheckpoint", name: str):
+        self.checkpoint = checkpoint
+        self.name = name
+        state = checkpoint.sources.get(name, {})
+        self._seen: Dict[str, str] = state.get("seen", {})
+        self._watermark: Optional[float] = state.get("watermark")
+        self._observed: Dict[str, str] = {}
+        self._newest = self._watermark
+        self.skipped = 0
+
+    def is_new(self, job: Dict) -> bool:
+        """Record a raw posting; True if it is new or changed since the last run.
+
+        A posting the seen-set does not know about but whose pubDate is older
+        than the source's watermark (the newest pubDate of the last run) is
+        treated as already seen, which lets the seen-set be pruned to the
+        postings the source still lists.
+        """
+        key = posting_key(job)
+        digest = content_hash(job)
+        self._observed[key] = digest
+
+        published = _timestamp(job.get("pubDate"))
+        if published is not None and (self._newest is None or published > self._newest):
+            self._newest = published
+
+        previous = self._seen.get(key)
+        if previous == digest:
+            self.skipped += 1
+            return False
+        if previous is None and published is not None and self._watermark is not None \
+                and published < self._watermark:
+            self.skipped += 1
+            return False
+        return True
+
+    def commit(self, complete: bool = True) -> None:
+        """Fold this run's observations into the checkpoint.
+
+        After a complete fetch the seen-set is replaced by what the source
+        listed this run; after a partial one (timeout, error) it is merged so
+        nothing already known is forgotten.
+        """
+        if complete and self._observed:
+            seen = self._observed
+        else:
+            seen = dict(self._seen)
+            seen.update(self._observed)
+        self.checkpoint.sources[self.name] = {"seen": seen, "watermark": self._newest}
+
+
+class DiscoveryCheckpoint:
+    """JSON file of compact per-source hash maps plus a pubDate watermark.
+
+    Each source maps 64-bit hashes of posting GUIDs/apply URLs to 64-bit
+    hashes of their content, so an unchanged posting can be recognised
+    before it is cleaned or matched. Call ``save`` once a run is done.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.sources: Dict[str, Dict] = {}
+        if path:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.sources = json.load(f).get("sources", {})
+            except (OSError, ValueError):
+                self.sources = {}
+
+    def begin(self, source_name: str) -> SourceDelta:
+        """Start tracking a source for the current run."""
+        return SourceDelta(self, source_name)
+
+    def reset(self, source_name: Optional[str] = None) -> None:
+        """Forget one source (or all), so its next run emits everything."""
+        if source_name is None:
+            self.sources.clear()
+        else:
+            self.sources.pop(source_name, None)
+
+    def save(self) -> None:
+        """Atomically write the checkpoint to ``path`` (no-op without one)."""
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "sources": self.sources}, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    def stats(self) -> dict:
+        """Return the number of tracked postings per source."""
+        return {name: len(state.get("seen", {})) for name, state in self.sources.items()}
@@ -0,0 +1,111 @@
+"""
+Feed Cache Utilities
+Persistent HTTP validators and parsed items for job feeds
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+
+class FeedCache:
+    """On-disk cache of feed responses, two JSON files per feed URL.
+
+    A small entry keeps the ETag/Last-Modified validators and the time the
+    feed was last confirmed current; the parsed items are stored next to it
+    and only read when they are served. A scraper can send a conditional
+    GET, skip parsing entirely on a 304 (rewriting just the entry), or skip
+    the request when the feed was refreshed less than
+    ``min_refresh_interval`` seconds ago.
+    """
+
+    def __init__(self, directory: str, min_refresh_interval: float = 0.0):
+        self.directory = directory
+        self.min_refresh_interval = min_refresh_interval
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str, suffix: str = "") -> str:
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{name}{suffix}.json")
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the stored entry (validators and ``fetchedAt``) for a feed URL, or None."""
+        try:
+            with open(self._path(url), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # An entry without its items file cannot answer a 304
+        if not os.path.exists(self._path(url, ".items")):
+            return None
+        return entry
+
+    def items(self, url: str) -> Optional[List[Dict]]:
+        """Load the items stored for a feed URL, or None when they are unreadable."""
+        try:
+            with open(self._path(url, ".items"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(
+        self,
+        url: str,
+        items: List[Dict],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Store freshly fetched items together with their validators."""
+        # Items first, so an entry never outlives the items it validates
+        self._write(self._path(url, ".items"), items)
+        self._write(self._path(url), {
+            "url": url,
+            "etag": etag,
+            "lastModified": last_modified,
+            "fetchedAt": time.time()
+        })
+
+    def touch(self, url: str, entry: Dict) -> None:
+        """Mark an entry as confirmed current (e.g. after a 304); the items are not rewritten."""
+        entry["fetchedAt"] = time.time()
+        self._write(self._path(url), entry)
+
+    def discard(self, url: str) -> None:
+        """Forget a feed, so its next fetch is unconditional."""
+        for path in (self._path(url), self._path(url, ".items")):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _write(self, path: str, data) -> None:
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def is_fresh(self, entry: Dict, min_refresh_interval: Optional[float] = None) -> bool:
+        """Whether an entry is recent enough to skip the request entirely."""
+        interval = self.min_refresh_interval if min_refresh_interval is None else min_refresh_interval
+        return interval > 0 and time.time() - entry.get("fetchedAt", 0) < interval
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """Request headers that let the server answer 304 Not Modified."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("lastModified"):
+                headers["If-Modified-Since"] = entry["lastModified"]
+        return headers
+
+
+def default_feed_cache() -> Optional[FeedCache]:
+    """Feed cache configured by FEED_CACHE_DIR / FEED_MIN_REFRESH_SECONDS, if any."""
+    directory = os.getenv("FEED_CACHE_DIR")
+    if not directory:
+        return None
+    return FeedCache(directory, float(os.getenv("FEED_MIN_REFRESH_SECONDS", 0)))
@@ -0,0 +1,258 @@
+"""
+Job Deduplication Utilities
+MinHash signatures with LSH banding for near-duplicate postings across sources
+"""
+
+import random
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from zlib import crc32
+
+# Try to import numpy
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+NUM_PERMUTATIONS = 64
+_MERSENNE_PRIME = (1 << 31) - 1
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+# Copies of each title/company word in the shingle set
+FIELD_WEIGHT = 4
+# Minimum Jaccard similarity of two normalized titles for the same role
+TITLE_THRESHOLD = 0.8
+_TITLE_ABBREVIATIONS = {
+    'sr': 'senior', 'jr': 'junior', 'eng': 'engineer', 'engr': 'engineer',
+    'dev': 'developer', 'mgr': 'manager'
+}
+_TITLE_NOISE = {'remote', 'hybrid', 'onsite', 'worldwide', 'anywhere'}
+
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+del _rng
+
+if NUMPY_AVAILABLE:
+    _PERM_A = np.array([a for a, _ in _PERMUTATIONS], dtype=np.uint64)
+    _PERM_B = np.array([b for _, b in _PERMUTATIONS], dtype=np.uint64)
+
+
+def _company_words(job: Dict) -> frozenset:
+    company = job.get('company') or ''
+    return frozenset(_TOKEN_PATTERN.findall(company.lower())) if company != 'Unknown' else frozenset()
+
+
+def title_key(job: Dict) -> frozenset:
+    """Normalized title words used to decide whether two titles are the same role.
+
+    Common abbreviations are expanded and work arrangement words ("remote",
+    "hybrid") are dropped, so "Sr. Backend Engineer (Remote)" and "Senior
+    Backend Engineer" get the same key.
+    """
+    title = job.get('title') or ''
+    if title == 'Unknown':
+        return frozenset()
+    words = (_TITLE_ABBREVIATIONS.get(word, word) for word in _TOKEN_PATTERN.findall(title.lower()))
+    return frozenset(word for word in words if word not in _TITLE_NOISE)
+
+
+def _field_tokens(job: Dict) -> List[str]:
+    """Normalized title words (see ``title_key``) and company words, prefixed with their field."""
+    company = _company_words(job)
+    tokens = ['t:' + word for word in sorted(title_key(job) - company)]
+    tokens.extend('c:' + word for word in sorted(company))
+    return tokens
+
+
+def _description_shingles(job: Dict) -> Set[str]:
+    tokens = _TOKEN_PATTERN.findall((job.get('description') or '').lower())
+    result = {f'{first} {second}' for first, second in zip(tokens, tokens[1:])}
+    if len(tokens) == 1:
+        result.add(tokens[0])
+    return result
+
+
+def _weighted(fields: List[str], description: Set[str]) -> Set[str]:
+    # Each title/company word is repeated (word#0, word#1, ...) FIELD_WEIGHT times
+    return description.union(f'{token}#{copy}' for token in fields for copy in range(FIELD_WEIGHT))
+
+
+def shingles(job: Dict) -> Set[str]:
+    """Weighted shingles: title and company words plus description word bigrams.
+
+    Each title and company word counts ``FIELD_WEIGHT`` times as much as a
+    description bigram, so a different title or company moves the
+    similarity well below what shared boilerplate alone would give.
+    """
+    return _weighted(_field_tokens(job), _description_shingles(job))
+
+
+def titles_match(first: frozenset, second: frozenset, threshold: float = TITLE_THRESHOLD) -> bool:
+    """True if two ``title_key`` sets have a Jaccard similarity of at least ``threshold``."""
+    if not first or not second:
+        return first == second
+    return len(first & second) / len(first | second) >= threshold
+
+
+def minhash(features: Iterable[str]) -> Tuple[int, ...]:
+    """MinHash signature of a shingle set (see ``shingles``)."""
+    # crc32 is stable across processes, unlike the salted built-in hash()
+    hashes = [crc32(shingle.encode('utf-8')) for shingle in features]
+    if not hashes:
+        return (_MERSENNE_PRIME,) * NUM_PERMUTATIONS
+
+    if NUMPY_AVAILABLE:
+        values = np.array(hashes, dtype=np.uint64)[:, None]
+        # a < 2**31 and values < 2**32, so the product fits in 64 bits
+        permuted = (values * _PERM_A + _PERM_B) % _MERSENNE_PRIME
+        return tuple(permuted.min(axis=0).tolist())
+
+    return tuple(
+        min((a * value + b) % _MERSENNE_PRIME for value in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+class JobDeduplicator:
+    """Incremental near-duplicate detection over a growing job catalog.
+
+    Every job gets a MinHash signature over its weighted title/company
+    words and description bigrams (see ``shingles``). The signature is cut
+    into ``bands`` bands and each band is indexed, so a new job is only
+    compared with the records that share a whole band with it, never the
+    whole catalog. With 64 hashes in 16 bands of 4, pairs with a Jaccard
+    similarity of 0.7 become candidates about 99% of the time, and pairs at
+    0.3 only about 12% of the time. Candidates count as duplicates when
+    their estimated similarity is at least ``threshold`` and their titles
+    are near-duplicates (``titles_match`` at ``title_threshold``), so
+    different roles at one company are never merged however much text
+    their descriptions share. An identical apply URL is always a
+    duplicate; jobs with fewer than ``min_shingles`` shingles are too short
+    to compare reliably and are only matched that way.
+
+    Duplicates are merged into the first (canonical) record. Its
+    ``applyUrls`` and ``sources`` lists collect every source's link, and
+    placeholder fields ("Unknown") are filled in from the later copies.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.7,
+        bands: int = 16,
+        min_shingles: int = 8,
+        title_threshold: float = TITLE_THRESHOLD
+    ):
+        if NUM_PERMUTATIONS % bands:
+            raise ValueError("bands must divide the number of permutations")
+        self.threshold = threshold
+        self.min_shingles = min_shingles
+        self.title_threshold = title_threshold
+        self.bands = bands
+        self._rows = NUM_PERMUTATIONS // bands
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(bands)]
+        self._by_url: Dict[str, int] = {}
+        self._signatures: List[Optional[Tuple[int, ...]]] = []
+        # Title key and company words of every canonical record
+        self._titles: List[Tuple[frozenset, frozenset]] = []
+        self.jobs: List[Dict] = []
+        self.merged = 0
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        rows = self._rows
+        return [signature[band * rows:(band + 1) * rows] for band in range(self.bands)]
+
+    def find(self, job: Dict) -> Optional[Dict]:
+        """Return the canonical record ``job`` duplicates, or None."""
+        index = self._find(job, self._signature(job))
+        return self.jobs[index] if index is not None else None
+
+    def _signature(self, job: Dict) -> Optional[Tuple[int, ...]]:
+        fields = _field_tokens(job)
+        description = _description_shingles(job)
+        if len(fields) + len(description) < self.min_shingles:
+            return None
+        return minhash(_weighted(fields, description))
+
+    def _find(self, job: Dict, signature: Optional[Tuple[int, ...]]) -> Optional[int]:
+        url = job.get('applyUrl')
+        if url and url in self._by_url:
+            return self._by_url[url]
+        if signature is None:
+            return None
+
+        candidates = set()
+        for buckets, key in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(buckets.get(key, ()))
+
+        title, company = title_key(job), _company_words(job)
+        best = None
+        best_similarity = self.threshold
+        for index in sorted(candidates):
+            # Company names are ignored in titles ("Acme: Backend Engineer"), whichever side knows them
+            other_title, other_company = self._titles[index]
+            names = company | other_company
+            if not titles_match(title - names, other_title - names, self.title_threshold):
+                continue
+            other = self._signatures[index]
+            similarity = sum(x == y for x, y in zip(signature, other)) / NUM_PERMUTATIONS
+            if similarity >= best_similarity and (best is None or similarity > best_similarity):
+                best, best_similarity = index, similarity
+        return best
+
+    def add(self, job: Dict) -> Tuple[Dict, bool]:
+        """Add a cleaned job, returning ``(canonical record, is_new)``."""
+        signature = self._signature(job)
+        index = self._find(job, signature)
+        if index is not None:
+            canonical = self.jobs[index]
+            self._merge(canonical, job, index)
+            self.merged += 1
+            return canonical, False
+
+        # Copy as the same type, so compact Job records stay records
+        canonical = job.copy()
+        canonical['applyUrls'] = [job['applyUrl']] if job.get('applyUrl') else []
+        canonical['sources'] = [job['source']] if job.get('source') else []
+        index = len(self.jobs)
+        self.jobs.append(canonical)
+        self._signatures.append(signature)
+        self._titles.append((title_key(job), _company_words(job)))
+        if signature is not None:
+            for buckets, key in zip(self._buckets, self._band_keys(signature)):
+                buckets.setdefault(key, []).append(index)
+        if canonical['applyUrls']:
+            self._by_url[canonical['applyUrls'][0]] = index
+        return canonical, True
+
+    def _merge(self, canonical: Dict, job: Dict, index: int) -> None:
+        url = job.get('applyUrl')
+        if url and url not in canonical['applyUrls']:
+            canonical['applyUrls'].append(url)
+            self._by_url[url] = index
+        source = job.get('source')
+        if source and source not in canonical['sources']:
+            canonical['sources'].append(source)
+        for field in ('company', 'location'):
+            if canonical.get(field) in (None, '', 'Unknown') and job.get(field) not in (None, '', 'Unknown'):
+                canonical[field] = job[field]
+        self._titles[index] = (self._titles[index][0], _company_words(canonical))
+        canonical['remote'] = canonical.get('remote') or job.get('remote', False)
+
+    def dedupe(self, jobs: Iterable[Dict]) -> List[Dict]:
+        """Add jobs and return the canonical records first seen among them."""
+        return [canonical for canonical, is_new in map(self.add, jobs) if is_new]
+
+    def stats(self) -> dict:
+        """Return catalog size and merge counters."""
+        return {
+            "jobs": len(self.jobs),
+            "merged": self.merged,
+            "urls": len(self._by_url)
+        }
@@ -0,0 +1,204 @@
+"""
+Job Matching Utilities
+Vectorized skill-overlap scoring of profiles against a whole job catalog
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from skill_matcher import SkillMatcher, normalize_text
+
+# Try to import numpy
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class JobMatchIndex:
+    """Score resume skills against every job's requirements in one pass.
+
+    Skills and requirements are mapped onto a shared vocabulary. With a
+    ``SkillMatcher``, free-text requirements such as "5+ years of Python" are
+    reduced to the skills they mention so they line up with resume skills;
+    otherwise each string is its own (normalized) term.
+
+    Job requirements are stored as a CSR-style term array; with NumPy a query
+    gathers the profile's term mask over it and sums per job with
+    ``np.add.reduceat``, so scoring a profile costs one vectorized pass over
+    all requirement terms. Without NumPy, jobs are stored as integer bitsets.
+
+    The score mirrors ``calculate_job_match``: the percentage of a job's
+    requirements covered by the profile.
+    """
+
+    def __init__(self, matcher: Optional[SkillMatcher] = None):
+        self.matcher = matcher
+        self._vocab: Dict[str, int] = {}
+        self._labels: List[str] = []
+        self._job_ids: List[Hashable] = []
+        self._job_terms: List[List[int]] = []
+        self._compiled = None
+
+    def __len__(self) -> int:
+        return len(self._job_ids)
+
+    def _keys(self, values: Iterable[str]) -> List[Tuple[str, str]]:
+        """Map raw strings to (normalized term, display label) pairs."""
+        keys = []
+        for value in values:
+            labels = self.matcher.scan(value).get("skills") if self.matcher is not None else None
+            if labels:
+                keys.extend((normalize_text(label), label) for label in labels)
+            else:
+                term = normalize_text(value)
+                if term:
+                    keys.append((term, value.strip()))
+        return keys
+
+    def _term_ids(self, values: Iterable[str], grow: bool) -> List[int]:
+        ids = []
+        for term, label in self._keys(values):
+            term_id = self._vocab.get(term)
+            if term_id is None:
+                if not grow:
+                    continue
+                term_id = len(self._labels)
+                self._vocab[term] = term_id
+                self._labels.append(label)
+            if term_id not in ids:
+                ids.append(term_id)
+        return ids
+
+    def add_job(self, job_id: Hashable, requirements: Iterable[str]) -> None:
+        """Add one job's requirements to the index."""
+        self._job_ids.append(job_id)
+        self._job_terms.append(self._term_ids(requirements, grow=True))
+        self._compiled = None
+
+    def add_jobs(self, jobs: Iterable[Tuple[Hashable, Iterable[str]]]) -> None:
+        """Add many ``(job_id, requirements)`` pairs."""
+        for job_id, requirements in jobs:
+            self.add_job(job_id, requirements)
+
+    def _compile(self):
+        if self._compiled is not None:
+            return self._compiled
+
+        if NUMPY_AVAILABLE:
+            lengths = np.fromiter((len(t) for t in self._job_terms), dtype=np.int64, count=len(self._job_terms))
+            indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=indptr[1:])
+            # A trailing sentinel term (never in any profile) keeps every row
+            # start a valid reduceat offset even when the last jobs are empty
+            indices = np.fromiter(
+                (term_id for terms in self._job_terms for term_id in terms),
+                dtype=np.int64,
+                count=int(indptr[-1])
+            )
+            indices = np.append(indices, len(self._labels))
+            self._compiled = (indices, indptr[:-1], lengths)
+        else:
+            self._compiled = [_bitset(terms) for terms in self._job_terms]
+        return self._compiled
+
+    def scores(self, profiles: Sequence[Sequence[str]]) -> list:
+        """Return match scores (0-100) for each profile against every job.
+
+        With NumPy this is a ``len(profiles) x len(jobs)`` float32 array,
+        otherwise a list of lists.
+        """
+        profile_ids = [self._term_ids(skills, grow=False) for skills in profiles]
+        compiled = self._compile()
+
+        if not NUMPY_AVAILABLE:
+            return [
+                [
+                    100.0 * _popcount(bits & mask) / max(_popcount(bits), 1)
+                    for bits in compiled
+                ]
+                for mask in (_bitset(ids) for ids in profile_ids)
+            ]
+
+        indices, starts, lengths = compiled
+        result = np.zeros((len(profile_ids), len(lengths)), dtype=np.float32)
+        if not len(lengths):
+            return result
+
+        masks = np.zeros((len(profile_ids), len(self._labels) + 1), dtype=np.float32)
+        for row, ids in enumerate(profile_ids):
+            masks[row, ids] = 1.0
+
+        # Keep the gathered block around a few million cells per step
+        step = max(1, 4_000_000 // len(indices))
+        for first in range(0, len(profile_ids), step):
+            hits = masks[first:first + step][:, indices]
+            counts = np.add.reduceat(hits, starts, axis=1)
+            counts[:, lengths == 0] = 0.0
+            result[first:first + step] = counts
+        result *= 100.0 / np.maximum(lengths, 1).astype(np.float32)
+        return result
+
+    def top_matches(self, resume_skills: Sequence[str], k: int = 10, min_score: float = 0) -> List[Dict]:
+        """Return the ``k`` best matching jobs for one profile."""
+        return self.top_matches_batch([resume_skills], k=k, min_score=min_score)[0]
+
+    def top_matches_batch(
+        self,
+        profiles: Sequence[Sequence[str]],
+        k: int = 10,
+        min_score: float = 0
+    ) -> List[List[Dict]]:
+        """Return the ``k`` best matching jobs for each profile.
+
+        Each match is ``{"jobId", "score", "matchingSkills", "missingSkills"}``;
+        skill lists are only materialized for the shortlisted jobs.
+        """
+        all_scores = self.scores(profiles)
+        results = []
+        for row, skills in enumerate(profiles):
+            profile_terms = set(self._term_ids(skills, grow=False))
+            shortlist = _top_k(all_scores[row], k)
+            matches = []
+            for job_index in shortlist:
+                score = float(all_scores[row][job_index])
+                if score < min_score:
+                    continue
+                terms = self._job_terms[job_index]
+                matches.append({
+                    "jobId": self._job_ids[job_index],
+                    "score": int(score),
+                    "matchingSkills": [self._labels[t] for t in terms if t in profile_terms],
+                    "missingSkills": [self._labels[t] for t in terms if t not in profile_terms]
+                })
+            results.append(matches)
+        return results
+
+
+def _bitset(ids: Iterable[int]) -> int:
+    bits = 0
+    for term_id in ids:
+        bits |= 1 << term_id
+    return bits
+
+
+def _popcount(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+def _top_k(scores, k: int) -> List[int]:
+    """Indices of the ``k`` highest scores, best first, ties by position."""
+    size = len(scores)
+    if k <= 0 or not size:
+        return []
+    if NUMPY_AVAILABLE and isinstance(scores, np.ndarray):
+        if k < size:
+            kth = np.partition(scores, size - k)[size - k]
+            above = np.flatnonzero(scores > kth)
+            tied = np.flatnonzero(scores == kth)[:k - len(above)]
+            candidates = np.concatenate([above, tied])
+        else:
+            candidates = np.arange(size)
+        order = np.lexsort((candidates, -scores[candidates]))
+        return candidates[order].tolist()
+    return sorted(range(size), key=lambda i: (-scores[i], i))[:k]
@@ -0,0 +1,167 @@
+"""
+Job Record Utilities
+Compact slotted representation of cleaned jobs for large in-memory catalogs
+"""
+
+import sys
+from collections.abc import MutableMapping
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, Optional
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+@lru_cache(maxsize=256)
+def to_timestamp(value: Optional[str]) -> int:
+    """Convert a naive UTC ISO timestamp to integer microseconds since the epoch.
+
+    Cached, so a batch stamped with one time parses it once and all its
+    records share one int object.
+    """
+    if not value:
+        return 0
+    delta = datetime.fromisoformat(value) - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def from_timestamp(value: int) -> str:
+    """Inverse of ``to_timestamp``; returns the same string ``isoformat`` produced."""
+    return (_EPOCH + timedelta(microseconds=value)).isoformat() if value else ""
+
+
+def _intern(value) -> str:
+    return sys.intern(value) if type(value) is str else value
+
+
+class Job(MutableMapping):
+    """A cleaned job stored in slots instead of a dict.
+
+    Compared with the dict ``clean_job_data`` returns, there is no per-job
+    hash table: company, location and source are interned, so thousands of
+    jobs from one source share a single string, and discoveredAt is an
+    integer of microseconds. The record still behaves like the dict (same
+    camelCase keys, ``job['title']``, ``job.get``, ``dict(job)``). The ISO
+    string and any dict are only built when asked for. Extra keys such as
+    ``applyUrls`` (set by deduplication) go into a small overflow dict that
+    only exists once used.
+
+    ``json.dumps`` does not accept a record; serialize ``to_dict()`` instead.
+    """
+
+    __slots__ = (
+        "title", "company", "location", "remote", "description",
+        "apply_url", "source", "discovered_at", "_extra"
+    )
+
+    KEYS = (
+        "title", "company", "location", "remote", "description",
+        "applyUrl", "source", "discoveredAt"
+    )
+
+    def __init__(
+        self,
+        title: str = "",
+        company: str = "Unknown",
+        location: str = "Unknown",
+        remote: bool = False,
+        description: str = "",
+        apply_url: str = "",
+        source: str = "",
+        discovered_at: int = 0,
+        extra: Optional[Dict] = None
+    ):
+        self.title = title
+        self.company = _intern(company)
+        self.location = _intern(location)
+        self.remote = remote
+        self.description = description
+        self.apply_url = apply_url
+        self.source = _intern(source)
+        self.discovered_at = discovered_at
+        self._extra = extra or None
+
+    @classmethod
+    def from_dict(cls, job: Dict) -> "Job":
+        """Build a record from a cleaned job dict."""
+        extra = {key: value for key, value in job.items() if key not in _JOB_ATTRIBUTES}
+        return cls(
+            title=job.get("title", ""),
+            company=job.get("company", "Unknown"),
+            location=job.get("location", "Unknown"),
+            remote=bool(job.get("remote", False)),
+            description=job.get("description", ""),
+            apply_url=job.get("applyUrl", ""),
+            source=job.get("source", ""),
+            discovered_at=to_timestamp(job.get("discoveredAt")),
+            extra=extra
+        )
+
+    def __getitem__(self, key: str):
+        attribute = _JOB_ATTRIBUTES.get(key)
+        if attribute is not None:
+            if attribute == "discovered_at":
+                return from_timestamp(self.discovered_at)
+            return getattr(self, attribute)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value) -> None:
+        attribute = _JOB_ATTRIBUTES.get(key)
+        if attribute is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+        elif attribute == "discovered_at":
+            self.discovered_at = to_timestamp(value)
+        elif attribute in ("company", "location", "source"):
+            setattr(self, attribute, _intern(value))
+        else:
+            setattr(self, attribute, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key in _JOB_ATTRIBUTES:
+            raise TypeError(f"cannot delete job field {key!r}")
+        if self._extra is None or key not in self._extra:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.KEYS
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return len(self.KEYS) + (len(self._extra) if self._extra else 0)
+
+    def __contains__(self, key) -> bool:
+        return key in _JOB_ATTRIBUTES or (self._extra is not None and key in self._extra)
+
+    def __repr__(self) -> str:
+        return f"Job(title={self.title!r}, company={self.company!r}, applyUrl={self.apply_url!r})"
+
+    def __reduce__(self):
+        # Rebuild through __init__ so unpickled records share interned strings
+        return Job, (
+            self.title, self.company, self.location, self.remote, self.description,
+            self.apply_url, self.source, self.discovered_at, self._extra
+        )
+
+    def copy(self) -> "Job":
+        """Shallow copy, like ``dict.copy``."""
+        return Job(
+            self.title, self.company, self.location, self.remote, self.description,
+            self.apply_url, self.source, self.discovered_at,
+            dict(self._extra) if self._extra else None
+        )
+
+    def to_dict(self) -> Dict:
+        """Materialize the dict ``clean_job_data`` would have returned."""
+        return dict(self)
+
+
+_JOB_ATTRIBUTES = dict(zip(Job.KEYS, (
+    "title", "company", "location", "remote", "description",
+    "apply_url", "source", "discovered_at"
+)))
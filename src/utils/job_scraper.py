@@ -4,115 +4,617 @@ For discovering jobs from various sources
 """
 
 import asyncio
-from typing import List, Dict, Optional
+import importlib.util
+import time
+from contextlib import AsyncExitStack
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, List, Dict, Optional, Union
 from datetime import datetime
+from html.entities import html5 as html5_entities
+from html.parser import HTMLParser
 import re
+import xml.etree.ElementTree as ElementTree
 
-# Try to import web scraping libraries
-try:
-    from playwright.async_api import async_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+import metrics
+from discovery_checkpoint import DiscoveryCheckpoint
+from feed_cache import FeedCache, default_feed_cache
+from job_record import Job, to_timestamp
+from job_store import JobStore
+from skill_matcher import SkillMatcher
 
-try:
-    from bs4 import BeautifulSoup
-    BS4_AVAILABLE = True
-except ImportError:
-    BS4_AVAILABLE = False
-
-try:
+if TYPE_CHECKING:
     import httpx
-    HTTPX_AVAILABLE = True
-except ImportError:
-    HTTPX_AVAILABLE = False
+    from job_dedup import JobDeduplicator
+
+# Web scraping libraries are imported on first use; only their presence is checked here
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec("playwright") is not None
+HTTPX_AVAILABLE = importlib.util.find_spec("httpx") is not None
+LXML_AVAILABLE = importlib.util.find_spec("lxml") is not None
+
+SOURCE_SECONDS = metrics.histogram(
+    "scraper_source_seconds", "Time spent on each job source by phase (fetch, parse, clean)", ("source", "phase")
+)
+SOURCE_ITEMS = metrics.counter("scraper_source_items_total", "Raw items received from each job source", ("source",))
+SOURCE_JOBS = metrics.counter("scraper_source_jobs_total", "Cleaned jobs produced by each job source", ("source",))
+SOURCE_ERRORS = metrics.counter(
+    "scraper_source_errors_total", "Job source fetches that failed or timed out", ("source", "reason")
+)
+FEED_CACHE_RESULTS = metrics.counter(
+    "scraper_feed_cache_total", "RSS feed requests by cache outcome (fresh, not_modified, fetched)", ("result",)
+)
+
+# Timings and error count of the source _fetch_source is working on, filled
+# in by the scraping methods it calls (None while metrics are off)
+_source_stats: ContextVar[Optional[Dict]] = ContextVar("source_stats", default=None)
+
+
+# Generic job listing selectors (customize per site)
+JOB_CARD_SELECTORS = [
+    '.job-listing',
+    '.job-card',
+    '.career-listing',
+    '[data-job]',
+    '.position',
+    '.opening'
+]
+
+# Collects every job card of the first matching selector in one round trip
+EXTRACT_JOB_CARDS_JS = """
+(selectors) => {
+    const text = (card, selector) => {
+        const el = card.querySelector(selector);
+        return el ? el.innerText : '';
+    };
+    for (const selector of selectors) {
+        const cards = document.querySelectorAll(selector);
+        if (!cards.length) continue;
+        return Array.from(cards, (card) => {
+            const link = card.querySelector('a');
+            return {
+                title: text(card, 'h2, h3, .title, .job-title'),
+                location: text(card, '.location, .job-location'),
+                link: link ? link.getAttribute('href') : null
+            };
+        });
+    }
+    return [];
+}
+"""
+
+
+class BrowserPool:
+    """Long-lived headless Chromium shared across many career page scrapes.
+    
+    Browser contexts are created once and reused, at most ``max_pages`` pages
+    are open at a time, and images, fonts and media are never downloaded.
+    ``timeout`` bounds navigation; once the DOM is loaded a page gets only
+    ``selector_timeout`` seconds to render a job card, so pages without any
+    release their slot quickly.
+    Use it as an async context manager around a whole discovery run::
+    
+        async with BrowserPool(max_pages=4) as pool:
+            jobs = await scraper.scrape_career_page(url, pool=pool)
+    """
+    
+    BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+    
+    def __init__(
+        self,
+        max_pages: int = 4,
+        headless: bool = True,
+        timeout: float = 30.0,
+        selector_timeout: float = 3.0
+    ):
+        self.max_pages = max_pages
+        self.headless = headless
+        self.timeout = timeout
+        self.selector_timeout = selector_timeout
+        self._playwright = None
+        self._browser = None
+        self._contexts: Optional[asyncio.Queue] = None
+    
+    async def __aenter__(self) -> "BrowserPool":
+        from playwright.async_api import async_playwright
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+            self._contexts = asyncio.Queue()
+            for _ in range(self.max_pages):
+                context = await self._browser.new_context()
+                context.set_default_timeout(self.timeout * 1000)
+                await context.route("**/*", self._block_heavy_resources)
+                self._contexts.put_nowait(context)
+        except Exception:
+            await self.close()
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the browser and stop Playwright."""
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+    
+    async def _block_heavy_resources(self, route) -> None:
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def extract_job_cards(self, url: str) -> List[Dict]:
+        """Load ``url`` in a pooled context and return its raw job cards."""
+        context = await self._contexts.get()
+        try:
+            page = await context.new_page()
+            try:
+                await page.goto(url, wait_until='domcontentloaded')
+                try:
+                    await page.wait_for_selector(
+                        ', '.join(JOB_CARD_SELECTORS), timeout=self.selector_timeout * 1000
+                    )
+                except Exception:
+                    # No job cards rendered in time; extract whatever is there
+                    pass
+                return await page.evaluate(EXTRACT_JOB_CARDS_JS, JOB_CARD_SELECTORS)
+            finally:
+                await page.close()
+        finally:
+            self._contexts.put_nowait(context)
+
+
+# Descriptions are truncated to this many characters when cleaned
+MAX_DESCRIPTION_LENGTH = 2000
+
+_ASCII_SPACES = ' \n\t\f\r'
+# Elements BeautifulSoup closes as soon as they open
+_VOID_ELEMENTS = frozenset((
+    'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'command', 'embed', 'frame', 'hr', 'image', 'img',
+    'input', 'isindex', 'keygen', 'link', 'menuitem', 'meta', 'nextid', 'param', 'source', 'spacer',
+    'track', 'wbr'
+))
+# Text inside these is not a plain string to BeautifulSoup, so get_text skips it
+_HIDDEN_TEXT_ELEMENTS = frozenset(('script', 'style', 'template', 'rt', 'rp'))
+_PRESERVE_WHITESPACE_ELEMENTS = frozenset(('pre', 'textarea'))
+# Elements whose content some html.parser versions read as raw text
+_RAW_TEXT_ELEMENTS = frozenset((
+    'script', 'style', 'textarea', 'title', 'iframe', 'noembed', 'noframes', 'noscript', 'plaintext', 'xmp'
+))
+# Markup every tokenizer reads the same way: plain tags, comments without
+# "--" inside and complete character references
+_SIMPLE_TOKEN = re.compile(r'''
+    <(?P<start>[a-zA-Z][a-zA-Z0-9]*)
+        (?:[ \t\n\r\f]+[a-zA-Z_:][-a-zA-Z0-9_:.]*
+            (?:[ \t\n\r\f]*=[ \t\n\r\f]*(?:"[^"]*"|'[^']*'|[^\s"'=<>`]+))?)*
+        [ \t\n\r\f]*(?P<empty>/?)>
+  | </(?P<end>[a-zA-Z][a-zA-Z0-9]*)[ \t\n\r\f]*>
+  | <!--(?!-?>)(?:[^-]|-(?!-))*-->
+  | &(?:(?P<entity>[a-zA-Z][a-zA-Z0-9]*)|\#(?P<charref>[0-9]+|[xX][0-9a-fA-F]+));
+''', re.VERBOSE)
+_MARKUP_START = re.compile('[<&]')
+
+
+class _TextLimitReached(Exception):
+    pass
+
+
+class _NotSimpleMarkup(Exception):
+    pass
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the strings BeautifulSoup's ``get_text`` would, without a tree.
+    
+    Tokenizing is left to ``html.parser``, the parser BeautifulSoup uses
+    here, so malformed markup such as an unclosed comment or a ``<`` that
+    never becomes a tag turns into the same text. Only the part of tree
+    building that decides which strings exist is reproduced: adjacent data
+    forms one string, whitespace-only strings collapse, and text inside
+    script, style, template and ruby annotations is skipped.
+    """
+    
+    def __init__(self, limit: Optional[int] = None):
+        super().__init__(convert_charrefs=False)
+        self.limit = limit
+        self.parts: List[str] = []
+        self._size = 0
+        self._data: List[str] = []
+        self._open: List[str] = []
+        self._hidden = 0
+        self._preserve = 0
+        self._closed_voids: List[str] = []
+    
+    def feed_simple(self, html: str) -> None:
+        """Tokenize ``html`` directly, raising ``_NotSimpleMarkup`` at anything unusual.
+        
+        Covers the markup job descriptions are made of, several times faster
+        than ``feed``; anything else needs html.parser's error recovery.
+        """
+        pos = 0
+        while True:
+            found = _MARKUP_START.search(html, pos)
+            if found is None:
+                break
+            start = found.start()
+            if start > pos:
+                self._data.append(html[pos:start])
+            token = _SIMPLE_TOKEN.match(html, start)
+            if token is None:
+                raise _NotSimpleMarkup
+            tag, end_tag, entity, charref = token.group('start', 'end', 'entity', 'charref')
+            if tag is not None:
+                tag = tag.lower()
+                if tag in _RAW_TEXT_ELEMENTS:
+                    raise _NotSimpleMarkup
+                if token.group('empty'):
+                    self.handle_startendtag(tag, [])
+                else:
+                    self.handle_starttag(tag, [])
+            elif end_tag is not None:
+                self.handle_endtag(end_tag.lower())
+            elif entity is not None:
+                self.handle_entityref(entity)
+            elif charref is not None:
+                self.handle_charref(charref)
+            else:
+                self.handle_comment(None)
+            pos = token.end()
+        if pos < len(html):
+            self._data.append(html[pos:])
+    
+    def end_data(self, cdata: bool = False) -> None:
+        """Turn the pending data into a string, as BeautifulSoup's ``endData`` does."""
+        if not self._data:
+            return
+        data = ''.join(self._data)
+        self._data = []
+        if not self._preserve and not data.strip(_ASCII_SPACES):
+            data = '\n' if '\n' in data else ' '
+        if cdata or not self._hidden:
+            self._add(data)
+    
+    def _add(self, text: str) -> None:
+        self.parts.append(text)
+        if self.limit is None:
+            return
+        if not self._size:
+            # Leading whitespace is stripped from the result
+            text = text.lstrip()
+            if not text:
+                return
+        # Count the joining space in front of every string but the first
+        self._size += len(text) + (1 if self._size else 0)
+        content = text.rstrip()
+        # Stop once a non-space character lies past the limit, so trailing
+        # whitespace can no longer shorten the result
+        if content and self._size - len(text) + len(content) > self.limit:
+            raise _TextLimitReached
+    
+    def _push(self, tag: str) -> None:
+        self.end_data()
+        self._open.append(tag)
+        if tag in _HIDDEN_TEXT_ELEMENTS:
+            self._hidden += 1
+        if tag in _PRESERVE_WHITESPACE_ELEMENTS:
+            self._preserve += 1
+    
+    def _pop_to(self, tag: str) -> None:
+        self.end_data()
+        if tag not in self._open:
+            return
+        while True:
+            name = self._open.pop()
+            if name in _HIDDEN_TEXT_ELEMENTS:
+                self._hidden -= 1
+            if name in _PRESERVE_WHITESPACE_ELEMENTS:
+                self._preserve -= 1
+            if name == tag:
+                return
+    
+    def handle_starttag(self, tag, attrs):
+        self._push(tag)
+        if tag in _VOID_ELEMENTS:
+            self._pop_to(tag)
+            self._closed_voids.append(tag)
+    
+    def handle_startendtag(self, tag, attrs):
+        self._push(tag)
+        self._pop_to(tag)
+    
+    def handle_endtag(self, tag):
+        if tag in self._closed_voids:
+            # A redundant end tag for a void element that is already closed
+            self._closed_voids.remove(tag)
+        else:
+            self._pop_to(tag)
+    
+    def handle_data(self, data):
+        self._data.append(data)
+    
+    def handle_entityref(self, name):
+        self._data.append(html5_entities.get(name + ';', '&' + name))
+    
+    def handle_charref(self, name):
+        number = int(name[1:], 16) if name[0] in 'xX' else int(name)
+        if number == 0 or number > 0x10FFFF or 0xD800 <= number <= 0xDFFF:
+            self._data.append('\ufffd')
+            return
+        if 0x80 <= number <= 0x9F:
+            # Windows-1252 bytes written as character references
+            try:
+                self._data.append(bytes((number,)).decode('cp1252'))
+                return
+            except UnicodeDecodeError:
+                pass
+        self._data.append(chr(number))
+    
+    def unknown_decl(self, data):
+        self.end_data()
+        if data.upper().startswith('CDATA['):
+            self._data.append(data[6:])
+            self.end_data(cdata=True)
+    
+    def handle_comment(self, data):
+        self.end_data()
+    
+    def handle_decl(self, decl):
+        self.end_data()
+    
+    def handle_pi(self, data):
+        self.end_data()
+
+
+def html_to_text(html: str, limit: Optional[int] = None) -> str:
+    """Convert an HTML fragment to plain text, stopping once ``limit`` chars exist.
+    
+    Matches ``BeautifulSoup(html, 'html.parser').get_text(separator=' ')``
+    followed by strip and truncation: text nodes are joined with a space,
+    entities are decoded, and comments, script and style contents are
+    dropped. Plain markup is tokenized directly and anything else by
+    html.parser, neither building a tree, and it stops as soon as the
+    budget is filled.
+    """
+    if '<' not in html and '&' not in html:
+        text = html.strip()
+        return text[:limit] if limit is not None else text
+    
+    parser = _TextExtractor(limit)
+    try:
+        try:
+            parser.feed_simple(html)
+        except _NotSimpleMarkup:
+            parser = _TextExtractor(limit)
+            try:
+                parser.feed(html)
+                parser.close()
+            except AssertionError:
+                # html.parser rejects a few malformed declarations outright
+                # (so does BeautifulSoup); keep the text read up to there
+                pass
+        parser.end_data()
+    except _TextLimitReached:
+        pass
+    text = ' '.join(parser.parts).strip()
+    return text[:limit] if limit is not None else text
+
+
+def _local_name(tag) -> str:
+    """Strip any ``{namespace}`` prefix from an element tag."""
+    if not isinstance(tag, str):
+        return ''
+    return tag.rsplit('}', 1)[-1]
+
+
+class RssItemParser:
+    """Incremental RSS parser that turns fed bytes into job dicts.
+    
+    Uses lxml's pull parser when available and the standard library's
+    otherwise. Every finished ``<item>`` is converted in a single pass over
+    its children and then detached from the tree, so only the item being
+    parsed is held in memory.
+    """
+    
+    # guid is the feed's stable item identity (delta checkpoints key on it)
+    FIELDS = ('title', 'description', 'link', 'guid', 'pubDate')
+    
+    def __init__(self, feed_url: str):
+        self.feed_url = feed_url
+        if LXML_AVAILABLE:
+            from lxml import etree as lxml_etree
+            self._parser = lxml_etree.XMLPullParser(
+                events=('start', 'end'), resolve_entities=False, no_network=True
+            )
+        else:
+            self._parser = ElementTree.XMLPullParser(events=('start', 'end'))
+        self._stack = []
+    
+    def feed(self, data: bytes) -> List[Dict]:
+        """Feed a chunk of the document and return the items it completed."""
+        self._parser.feed(data)
+        return self._drain()
+    
+    def close(self) -> List[Dict]:
+        """Finish parsing and return any remaining items."""
+        self._parser.close()
+        return self._drain()
+    
+    def _drain(self) -> List[Dict]:
+        jobs = []
+        for event, element in self._parser.read_events():
+            if event == 'start':
+                self._stack.append(element)
+                continue
+            
+            self._stack.pop()
+            if _local_name(element.tag) != 'item':
+                continue
+            
+            # Plain RSS children only: namespaced ones such as atom:link are skipped
+            job = dict.fromkeys(self.FIELDS, '')
+            seen = set()
+            for child in element:
+                if child.tag in job and child.tag not in seen:
+                    seen.add(child.tag)
+                    job[child.tag] = child.text or ''
+            job['source'] = self.feed_url
+            jobs.append(job)
+            
+            # Detach the finished item so the tree never grows
+            element.clear()
+            if self._stack:
+                self._stack[-1].remove(element)
+        return jobs
 
 
 class JobScraper:
     """Scrape jobs from various sources."""
     
-    def __init__(self):
+    def __init__(self, skill_matcher: Optional[SkillMatcher] = None):
         self.jobs = []
+        # Maps requirements onto the skill vocabulary; defaults to the resume parser's
+        self.skill_matcher = skill_matcher
     
-    async def scrape_rss_feed(self, feed_url: str) -> List[Dict]:
-        """Scrape jobs from an RSS feed."""
+    async def scrape_rss_feed(
+        self,
+        feed_url: str,
+        client: Optional["httpx.AsyncClient"] = None,
+        cache: Optional[FeedCache] = None,
+        min_refresh_interval: Optional[float] = None
+    ) -> List[Dict]:
+        """Scrape jobs from an RSS feed.
+        
+        Collects :meth:`iter_rss_feed` into a list; see there for ``client``,
+        ``cache`` and ``min_refresh_interval``.
+        """
+        return [
+            job async for job in self.iter_rss_feed(
+                feed_url, client=client, cache=cache, min_refresh_interval=min_refresh_interval
+            )
+        ]
+    
+    async def iter_rss_feed(
+        self,
+        feed_url: str,
+        client: Optional["httpx.AsyncClient"] = None,
+        cache: Optional[FeedCache] = None,
+        min_refresh_interval: Optional[float] = None
+    ) -> AsyncIterator[Dict]:
+        """Stream jobs from an RSS feed while it downloads.
+        
+        The response body is fed chunk by chunk into an incremental XML
+        parser and each ``<item>`` is yielded, then freed, as soon as it is
+        complete, so memory stays flat for large feeds and callers can start
+        cleaning before the download finishes.
+        
+        Pass a shared ``client`` to reuse pooled keep-alive connections across
+        feeds; otherwise a client is opened for this feed only.
+        
+        With a ``cache``, the request is skipped while the cached copy is
+        younger than ``min_refresh_interval`` seconds (the cache's default if
+        None), and otherwise sent as a conditional GET; on 304 Not Modified the
+        cached items are returned without parsing anything.
+        """
         if not HTTPX_AVAILABLE:
-            return []
+            return
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(feed_url, timeout=30)
-                response.raise_for_status()
+            entry = cache.get(feed_url) if cache is not None else None
+            if entry is not None and cache.is_fresh(entry, min_refresh_interval):
+                items = cache.items(feed_url)
+                if items is not None:
+                    FEED_CACHE_RESULTS.inc("fresh")
+                    for job in items:
+                        yield job
+                    return
+                # Unreadable items; fetch the feed in full
+                entry = None
+            
+            headers = FeedCache.conditional_headers(entry)
+            async with AsyncExitStack() as stack:
+                if client is None:
+                    import httpx
+                    client = await stack.enter_async_context(httpx.AsyncClient())
+                response = await stack.enter_async_context(
+                    client.stream("GET", feed_url, headers=headers, timeout=30)
+                )
                 
-                if BS4_AVAILABLE:
-                    soup = BeautifulSoup(response.text, 'xml')
-                    items = soup.find_all('item')
-                    
-                    jobs = []
-                    for item in items:
-                        job = {
-                            'title': item.find('title').text if item.find('title') else '',
-                            'description': item.find('description').text if item.find('description') else '',
-                            'link': item.find('link').text if item.find('link') else '',
-                            'pubDate': item.find('pubDate').text if item.find('pubDate') else '',
-                            'source': feed_url
-                        }
-                        jobs.append(job)
-                    
-                    return jobs
+                if response.status_code == 304 and entry is not None:
+                    items = cache.items(feed_url)
+                    if items is None:
+                        cache.discard(feed_url)
+                        raise ValueError("cached items are unreadable; the feed is refetched next time")
+                    FEED_CACHE_RESULTS.inc("not_modified")
+                    cache.touch(feed_url, entry)
+                    for job in items:
+                        yield job
+                    return
                 
-                return []
+                response.raise_for_status()
+                parser = RssItemParser(feed_url)
+                stats = _source_stats.get()
+                # The cache needs the full item list; without one nothing is kept
+                collected = [] if cache is not None else None
+                async for chunk in response.aiter_bytes():
+                    start = time.perf_counter() if stats is not None else 0.0
+                    parsed = parser.feed(chunk)
+                    if stats is not None:
+                        stats["parse"] += time.perf_counter() - start
+                    for job in parsed:
+                        if collected is not None:
+                            collected.append(dict(job))
+                        yield job
+                for job in parser.close():
+                    if collected is not None:
+                        collected.append(dict(job))
+                    yield job
+                
+                if cache is not None:
+                    FEED_CACHE_RESULTS.inc("fetched")
+                    cache.put(
+                        feed_url,
+                        collected,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified")
+                    )
         except Exception as e:
             print(f"Error scraping RSS feed: {e}")
-            return []
+            _count_source_error()
     
-    async def scrape_career_page(self, url: str) -> List[Dict]:
-        """Scrape jobs from a company career page using Playwright."""
+    async def scrape_career_page(self, url: str, pool: Optional["BrowserPool"] = None) -> List[Dict]:
+        """Scrape jobs from a company career page using Playwright.
+        
+        Pass a running ``BrowserPool`` to reuse its browser; otherwise a
+        single-page pool is started for this URL only.
+        """
         if not PLAYWRIGHT_AVAILABLE:
             return self._mock_career_page_jobs(url)
         
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-                
-                await page.goto(url, wait_until='networkidle')
-                
-                # Generic job listing selectors (customize per site)
-                job_selectors = [
-                    '.job-listing',
-                    '.job-card',
-                    '.career-listing',
-                    '[data-job]',
-                    '.position',
-                    '.opening'
-                ]
-                
-                jobs = []
-                for selector in job_selectors:
-                    elements = await page.query_selector_all(selector)
-                    if elements:
-                        for element in elements:
-                            title = await element.query_selector('h2, h3, .title, .job-title')
-                            location = await element.query_selector('.location, .job-location')
-                            link = await element.query_selector('a')
-                            
-                            job = {
-                                'title': await title.inner_text() if title else '',
-                                'location': await location.inner_text() if location else '',
-                                'link': await link.get_attribute('href') if link else url,
-                                'source': url
-                            }
-                            
-                            if job['title']:
-                                jobs.append(job)
-                        break
-                
-                await browser.close()
-                return jobs
-                
+            if pool is None:
+                async with BrowserPool(max_pages=1) as own_pool:
+                    cards = await own_pool.extract_job_cards(url)
+            else:
+                cards = await pool.extract_job_cards(url)
+            
+            return [
+                {
+                    'title': card['title'],
+                    'location': card['location'],
+                    'link': card['link'] or url,
+                    'source': url
+                }
+                for card in cards
+                if card['title']
+            ]
         except Exception as e:
             print(f"Error scraping career page: {e}")
+            _count_source_error()
             return self._mock_career_page_jobs(url)
     
     def _mock_career_page_jobs(self, url: str) -> List[Dict]:
@@ -138,52 +640,157 @@ class JobScraper:
             }
         ]
     
-    def clean_job_data(self, job: Dict) -> Dict:
-        """Clean and normalize job data."""
+    def clean_job_data(
+        self,
+        job: Dict,
+        discovered_at: Optional[str] = None,
+        as_record: bool = False
+    ) -> Union[Dict, Job]:
+        """Clean and normalize job data.
+        
+        ``discovered_at`` lets callers stamp a whole batch with one timestamp.
+        With ``as_record`` a compact :class:`Job` is returned instead of a dict;
+        it is not JSON serializable, so call ``to_dict()`` before ``json.dumps``.
+        """
         # Clean title
-        title = job.get('title', '').strip()
-        title = re.sub(r'\s+', ' ', title)  # Normalize whitespace
+        title = ' '.join(job.get('title', '').split())  # Normalize whitespace
         
         # Clean description
-        description = job.get('description', '').strip()
-        if BS4_AVAILABLE:
-            soup = BeautifulSoup(description, 'html.parser')
-            description = soup.get_text(separator=' ').strip()
+        description = html_to_text(job.get('description', ''), limit=MAX_DESCRIPTION_LENGTH)
         
         # Detect remote
         location = job.get('location', '').lower()
         remote = 'remote' in location or 'work from home' in location
         
+        if as_record:
+            return Job(
+                title,
+                job.get('company', 'Unknown'),
+                job.get('location', 'Unknown'),
+                remote,
+                description,
+                job.get('link', job.get('applyUrl', '')),
+                job.get('source', ''),
+                to_timestamp(discovered_at or datetime.utcnow().isoformat())
+            )
+        
         return {
             'title': title,
             'company': job.get('company', 'Unknown'),
             'location': job.get('location', 'Unknown'),
             'remote': remote,
-            'description': description[:2000],  # Truncate long descriptions
+            'description': description,
             'applyUrl': job.get('link', job.get('applyUrl', '')),
             'source': job.get('source', ''),
-            'discoveredAt': datetime.utcnow().isoformat()
+            'discoveredAt': discovered_at or datetime.utcnow().isoformat()
         }
     
-    def extract_requirements(self, description: str) -> List[str]:
-        """Extract job requirements from description."""
-        requirements = []
+    def clean_jobs(self, jobs: Iterable[Dict], as_records: bool = False) -> List[Union[Dict, Job]]:
+        """Clean a batch of jobs, stamping them all with one discovery time.
         
-        # Common patterns for requirements
-        patterns = [
-            r'(?:requirements?|qualifications?|what we.re looking for)[:\s]*(.+?)(?:benefits?|what we offer|about us|$)',
-            r'(?:must have|you should have|you will need)[:\s]*(.+?)(?:nice to have|bonus|$)',
-        ]
+        With ``as_records`` the jobs are :class:`Job` records (see
+        :meth:`clean_job_data`).
+        """
+        discovered_at = datetime.utcnow().isoformat()
+        clean = self.clean_job_data
+        return [clean(job, discovered_at, as_records) for job in jobs]
+    
+    def extract_requirements(self, description: str, skills: bool = False) -> List[str]:
+        """Extract job requirements from description.
         
-        for pattern in patterns:
-            match = re.search(pattern, description.lower(), re.DOTALL | re.IGNORECASE)
-            if match:
-                req_text = match.group(1)
-                # Split by bullets, numbers, or newlines
-                items = re.split(r'[\n•\-\*\d\.]+', req_text)
-                requirements.extend([item.strip() for item in items if item.strip() and len(item.strip()) > 10])
+        Returns up to 10 lowercased requirement lines, or with ``skills=True``
+        the skill vocabulary terms mentioned anywhere in the requirement
+        sections.
+        """
+        sections = _requirement_sections(description.lower())
+        if skills:
+            return self._requirement_skills(sections)
         
+        requirements = []
+        for section in sections:
+            items = (item.strip() for item in _REQUIREMENT_ITEM_BREAK.split(section))
+            requirements.extend(item for item in items if len(item) > 10)
         return requirements[:10]  # Limit to 10 requirements
+    
+    def extract_requirements_batch(self, descriptions: Iterable[str], skills: bool = False) -> List[List[str]]:
+        """Extract requirements for many descriptions (see ``extract_requirements``)."""
+        extract = self.extract_requirements
+        return [extract(description, skills) for description in descriptions]
+    
+    def _requirement_skills(self, sections: List[str]) -> List[str]:
+        if self.skill_matcher is None:
+            from resume_parser import ResumeParser
+            self.skill_matcher = ResumeParser.default_matcher()
+        found = {}
+        # Whole sections, so short items ("; aws") count too; the matcher
+        # collapses whitespace, so "machine\tlearning" is still one skill
+        for section in sections:
+            for label in self.skill_matcher.scan(section).get('skills', []):
+                found[label] = None
+        return list(found)
+
+
+# Section markers for requirement extraction, found together in one scan.
+# A plain alternation (no groups) lets the regex engine skip ahead on its
+# first characters; each match is then classified by prefix: "start" opens a
+# requirements section that runs to the next "end" marker, "must" opens a
+# must-have section that runs to the next "bonus" marker
+_REQUIREMENT_MARKERS = re.compile(
+    r"requirements?|qualifications?|what we.re looking for"
+    r"|must have|you should have|you will need"
+    r"|benefits?|what we offer|about us"
+    r"|nice to have|bonus"
+)
+_MARKER_KINDS = (
+    ('requirement', 'start'), ('qualification', 'start'), ('what we offer', 'end'),
+    ('what we', 'start'), ('must', 'must'), ('you', 'must'), ('benefit', 'end'),
+    ('about', 'end'), ('nice', 'bonus'), ('bonus', 'bonus')
+)
+_SECTION_LEAD = re.compile(r'[:\s]*')
+# Bullets, numbered items, inline dashes, semicolons and sentence ends
+_REQUIREMENT_ITEM_BREAK = re.compile(
+    r'(?:\n|^)[ \t]*(?:[-*\u2022\u00b7\u25aa]|\d{1,2}[.)])?'
+    r'|\s[-*]\s|[\u2022;]|\.(?=\s|$)',
+    re.MULTILINE
+)
+
+
+@lru_cache(maxsize=256)
+def _marker_kind(marker: str) -> str:
+    return next(kind for prefix, kind in _MARKER_KINDS if marker.startswith(prefix))
+
+
+def _requirement_sections(lower: str) -> List[str]:
+    """Return the requirement and must-have sections of a lowercased description.
+    
+    All markers are found in a single left-to-right scan that stops as soon
+    as both sections are closed: each section starts at the first opener of
+    its kind and ends at the first matching terminator after it (or at the
+    end of the text), so the cost is linear in the length of the description.
+    """
+    begins: Dict[str, int] = {}
+    stops: Dict[str, int] = {}
+    for match in _REQUIREMENT_MARKERS.finditer(lower):
+        kind = _marker_kind(match.group())
+        if kind in ('start', 'must'):
+            if kind not in begins:
+                begins[kind] = _SECTION_LEAD.match(lower, match.end()).end()
+            continue
+        opener = 'start' if kind == 'end' else 'must'
+        # The section holds at least one character before its terminator
+        if opener in begins and opener not in stops and match.start() > begins[opener]:
+            stops[opener] = match.start()
+            if len(stops) == 2:
+                break
+    
+    sections = []
+    for opener in ('start', 'must'):
+        if opener in begins:
+            begin = begins[opener]
+            stop = stops.get(opener, len(lower))
+            if stop > begin:
+                sections.append(lower[begin:stop])
+    return sections
 
 
 # Job sources configuration
@@ -209,31 +816,210 @@ JOB_SOURCES = [
 ]
 
 
-async def discover_jobs(sources: List[Dict] = None) -> List[Dict]:
-    """Discover jobs from configured sources."""
+def create_http_client(max_connections: int = 8) -> "httpx.AsyncClient":
+    """Create a pooled keep-alive HTTP client to share across one discovery run."""
+    import httpx
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        timeout=httpx.Timeout(30.0, connect=10.0),
+        follow_redirects=True
+    )
+
+
+def _count_source_error() -> None:
+    stats = _source_stats.get()
+    if stats is not None:
+        stats["errors"] += 1
+
+
+async def _fetch_source(
+    scraper: JobScraper,
+    source: Dict,
+    client: Optional["httpx.AsyncClient"],
+    timeout: Optional[float],
+    pool: Optional[BrowserPool] = None,
+    feed_cache: Optional[FeedCache] = None,
+    checkpoint: Optional[DiscoveryCheckpoint] = None,
+    as_records: bool = False
+) -> List[Union[Dict, Job]]:
+    """Fetch and clean jobs for one source, giving up after its timeout.
+    
+    RSS items are cleaned as they stream in, so a feed that times out still
+    contributes the jobs parsed before the deadline. With a ``checkpoint``
+    only postings that are new or changed since the last run are cleaned.
+    
+    Records per-source fetch, parse and clean times, item counts and errors
+    in the ``scraper_source_*`` metrics.
+    """
+    jobs: List[Dict] = []
+    name = source['name']
+    delta = checkpoint.begin(name) if checkpoint is not None else None
+    stats = {"parse": 0.0, "clean": 0.0, "errors": 0} if metrics.is_enabled() else None
+    received = 0
+    
+    discovered_at = datetime.utcnow().isoformat()
+    
+    def add(job: Dict) -> None:
+        nonlocal received
+        received += 1
+        if delta is not None and not delta.is_new(job):
+            return
+        job['source'] = name
+        if stats is None:
+            jobs.append(scraper.clean_job_data(job, discovered_at, as_records))
+            return
+        start = time.perf_counter()
+        jobs.append(scraper.clean_job_data(job, discovered_at, as_records))
+        stats["clean"] += time.perf_counter() - start
+    
+    async def fetch() -> None:
+        if source['type'] == 'rss':
+            async for job in scraper.iter_rss_feed(
+                source['url'],
+                client=client,
+                cache=feed_cache,
+                min_refresh_interval=source.get('minRefreshInterval')
+            ):
+                add(job)
+        elif source['type'] == 'career':
+            for job in await scraper.scrape_career_page(source['url'], pool=pool):
+                add(job)
+        else:
+            # API or other types
+            for job in scraper._mock_career_page_jobs(source['url']):
+                add(job)
+    
+    complete = False
+    token = _source_stats.set(stats)
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(fetch(), source.get('timeout', timeout))
+        complete = True
+    except asyncio.TimeoutError:
+        print(f"Timed out fetching source {name}")
+        SOURCE_ERRORS.inc(name, "timeout")
+    except Exception as e:
+        print(f"Error with source {name}: {e}")
+        SOURCE_ERRORS.inc(name, "error")
+    finally:
+        _source_stats.reset(token)
+    if delta is not None:
+        delta.commit(complete)
+    
+    if stats is not None:
+        elapsed = time.perf_counter() - started
+        SOURCE_SECONDS.observe(max(elapsed - stats["parse"] - stats["clean"], 0.0), name, "fetch")
+        SOURCE_SECONDS.observe(stats["parse"], name, "parse")
+        SOURCE_SECONDS.observe(stats["clean"], name, "clean")
+        if stats["errors"]:
+            SOURCE_ERRORS.inc(name, "error", amount=stats["errors"])
+        SOURCE_ITEMS.inc(name, amount=received)
+        SOURCE_JOBS.inc(name, amount=len(jobs))
+    return jobs
+
+
+async def discover_jobs(
+    sources: List[Dict] = None,
+    concurrent: bool = False,
+    max_concurrency: int = 8,
+    source_timeout: Optional[float] = 60.0,
+    client: Optional["httpx.AsyncClient"] = None,
+    browser_pool: Optional[BrowserPool] = None,
+    feed_cache: Optional[FeedCache] = None,
+    dedupe: bool = False,
+    deduplicator: Optional["JobDeduplicator"] = None,
+    checkpoint: Optional[DiscoveryCheckpoint] = None,
+    store: Optional[JobStore] = None,
+    as_records: bool = False
+) -> List[Union[Dict, Job]]:
+    """Discover jobs from configured sources.
+    
+    All sources share one pooled HTTP client (``client`` or one created for
+    the run). With ``concurrent=True`` sources are fetched in parallel, at
+    most ``max_concurrency`` at a time. A source that fails or exceeds its
+    timeout (``source['timeout']`` or ``source_timeout`` seconds) never
+    fails the run: it contributes the jobs parsed before the error or
+    deadline (RSS items stream in, so that can be part of a feed), and the
+    jobs from the other sources are still returned.
+    
+    Career pages are rendered in ``browser_pool``, or in one ``BrowserPool``
+    started for the run when any career source is configured.
+    
+    RSS feeds go through ``feed_cache`` (default: FEED_CACHE_DIR, if set) so
+    unchanged feeds cost a 304 or nothing at all; a source may set its own
+    ``minRefreshInterval`` in seconds.
+    
+    With ``dedupe=True`` the same posting found on several sources is
+    returned once, as a canonical record whose ``applyUrls``/``sources``
+    list every copy. Pass a long-lived ``deduplicator`` (which implies
+    ``dedupe``) to also drop postings already in its catalog from earlier
+    runs (their canonical records are updated).
+    
+    With a ``checkpoint`` the run is a delta: only postings that are new or
+    changed since the checkpoint's last run are cleaned and returned, and
+    the checkpoint is saved afterwards.
+    
+    The jobs returned are also upserted into ``store``, if given, so they
+    can be searched later without refetching.
+    
+    With ``as_records`` jobs are returned as compact :class:`Job` records,
+    which behave like the dicts but take a fraction of the memory. They are
+    not JSON serializable: convert them with ``job.to_dict()`` where they
+    leave the process (``json.dumps``, an HTTP response).
+    """
     if sources is None:
         sources = [s for s in JOB_SOURCES if s.get('enabled', True)]
     
     scraper = JobScraper()
-    all_jobs = []
+    if feed_cache is None:
+        feed_cache = default_feed_cache()
     
-    for source in sources:
-        try:
-            if source['type'] == 'rss':
-                jobs = await scraper.scrape_rss_feed(source['url'])
-            elif source['type'] == 'career':
-                jobs = await scraper.scrape_career_page(source['url'])
-            else:
-                # API or other types
-                jobs = scraper._mock_career_page_jobs(source['url'])
+    async with AsyncExitStack() as stack:
+        if client is None and HTTPX_AVAILABLE:
+            client = await stack.enter_async_context(create_http_client(max_concurrency))
+        
+        if browser_pool is None and PLAYWRIGHT_AVAILABLE and any(s['type'] == 'career' for s in sources):
+            try:
+                browser_pool = await stack.enter_async_context(
+                    BrowserPool(max_pages=max_concurrency if concurrent else 1)
+                )
+            except Exception as e:
+                print(f"Error starting browser pool: {e}")
+        
+        if concurrent:
+            semaphore = asyncio.Semaphore(max_concurrency)
             
-            # Clean and add source info
-            for job in jobs:
-                job['source'] = source['name']
-                cleaned = scraper.clean_job_data(job)
-                all_jobs.append(cleaned)
-                
-        except Exception as e:
-            print(f"Error with source {source['name']}: {e}")
+            async def fetch(source: Dict) -> List[Dict]:
+                async with semaphore:
+                    return await _fetch_source(
+                        scraper, source, client, source_timeout, browser_pool, feed_cache, checkpoint,
+                        as_records
+                    )
+            
+            results = await asyncio.gather(*(fetch(source) for source in sources))
+        else:
+            results = [
+                await _fetch_source(
+                    scraper, source, client, source_timeout, browser_pool, feed_cache, checkpoint,
+                    as_records
+                )
+                for source in sources
+            ]
+    
+    all_jobs = []
+    for jobs in results:
+        all_jobs.extend(jobs)
+    
+    if checkpoint is not None:
+        checkpoint.save()
+    
+    if deduplicator is None and dedupe:
+        from job_dedup import JobDeduplicator
+        deduplicator = JobDeduplicator()
+    if deduplicator is not None:
+        all_jobs = deduplicator.dedupe(all_jobs)
+    
+    if store is not None:
+        store.upsert_jobs(all_jobs)
     
     return all_jobs
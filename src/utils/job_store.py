@@ -0,0 +1,294 @@
+"""
+Job Store Utilities
+Persistent SQLite catalog of discovered jobs with full-text search
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Fields stored in their own columns; any other job fields (applyUrls,
+# sources, requirements, ...) are kept in a JSON column
+_FIELDS = {
+    "title", "company", "location", "remote", "description", "applyUrl", "source", "discoveredAt"
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_key TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL DEFAULT '',
+    company TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    remote INTEGER NOT NULL DEFAULT 0,
+    description TEXT NOT NULL DEFAULT '',
+    apply_url TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL DEFAULT '',
+    discovered_at TEXT NOT NULL DEFAULT '',
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_source ON jobs (source);
+CREATE INDEX IF NOT EXISTS jobs_remote ON jobs (remote);
+CREATE INDEX IF NOT EXISTS jobs_discovered_at ON jobs (discovered_at);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5 (
+    title, company, description, content='jobs', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, title, company, description)
+    VALUES (new.id, new.title, new.company, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+    VALUES ('delete', old.id, old.title, old.company, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, description ON jobs
+WHEN old.title IS NOT new.title OR old.company IS NOT new.company OR old.description IS NOT new.description
+BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, description)
+    VALUES ('delete', old.id, old.title, old.company, old.description);
+    INSERT INTO jobs_fts (rowid, title, company, description)
+    VALUES (new.id, new.title, new.company, new.description);
+END;
+"""
+
+# Re-upserting an unchanged job is a no-op: no row write, no FTS churn.
+# discovered_at keeps the time the job was first seen.
+_UPSERT = """
+INSERT INTO jobs (job_key, title, company, location, remote, description, apply_url, source, discovered_at, extra)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (job_key) DO UPDATE SET
+    title = excluded.title,
+    company = excluded.company,
+    location = excluded.location,
+    remote = excluded.remote,
+    description = excluded.description,
+    apply_url = excluded.apply_url,
+    source = excluded.source,
+    extra = excluded.extra
+WHERE jobs.title IS NOT excluded.title
+    OR jobs.company IS NOT excluded.company
+    OR jobs.location IS NOT excluded.location
+    OR jobs.remote IS NOT excluded.remote
+    OR jobs.description IS NOT excluded.description
+    OR jobs.source IS NOT excluded.source
+    OR jobs.extra IS NOT excluded.extra
+"""
+
+_SELECT = "SELECT jobs.title, jobs.company, jobs.location, jobs.remote, jobs.description, " \
+          "jobs.apply_url, jobs.source, jobs.discovered_at, jobs.extra FROM jobs"
+
+
+def job_key(job: Dict) -> str:
+    """Natural key of a job: its apply URL, else title and company."""
+    return job.get("applyUrl") or "\x1f".join([job.get("title", ""), job.get("company", "")])
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query that ANDs its words.
+
+    Every word is quoted so punctuation and FTS operators in user input are
+    matched literally; a trailing ``*`` keeps prefix search (``pyth*``).
+    """
+    terms = []
+    for word in text.split():
+        prefix = word.endswith("*") and len(word) > 1
+        word = word.rstrip("*") if prefix else word
+        quoted = '"' + word.replace('"', '""') + '"'
+        terms.append(quoted + "*" if prefix else quoted)
+    return " ".join(terms)
+
+
+class JobStore:
+    """SQLite catalog of cleaned jobs with FTS5 search and paginated queries.
+
+    Jobs are keyed by apply URL and written with bulk upserts in a single
+    transaction. An external-content FTS5 table over title, company and
+    description is kept in sync by triggers, and source, remote and
+    discoveredAt have their own indexes, so searches are index lookups
+    rather than scans. If the SQLite build lacks FTS5, text search falls
+    back to LIKE filters.
+    """
+
+    def __init__(self, db_path: str = ":memory:"):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        if db_path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        try:
+            self._db.executescript(_FTS_SCHEMA)
+            self.fts_available = True
+        except sqlite3.OperationalError:
+            self.fts_available = False
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "JobStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def upsert_jobs(self, jobs: Iterable[Dict]) -> int:
+        """Insert or update jobs in one transaction; returns rows written."""
+        rows = []
+        for job in jobs:
+            extra = {key: value for key, value in job.items() if key not in _FIELDS}
+            rows.append((
+                job_key(job),
+                job.get("title") or "",
+                job.get("company") or "",
+                job.get("location") or "",
+                1 if job.get("remote") else 0,
+                job.get("description") or "",
+                job.get("applyUrl") or "",
+                job.get("source") or "",
+                job.get("discoveredAt") or "",
+                json.dumps(extra, separators=(",", ":"), sort_keys=True) if extra else None
+            ))
+        with self._lock, self._db:
+            return self._db.executemany(_UPSERT, rows).rowcount
+
+    def delete_jobs(self, apply_urls: Iterable[str]) -> int:
+        """Delete jobs by apply URL (or key); returns rows deleted."""
+        with self._lock, self._db:
+            return self._db.executemany(
+                "DELETE FROM jobs WHERE job_key = ?", ((url,) for url in apply_urls)
+            ).rowcount
+
+    def get(self, apply_url: str) -> Optional[Dict]:
+        """Return one job by apply URL (or key), or None."""
+        with self._lock:
+            row = self._db.execute(f"{_SELECT} WHERE job_key = ?", (apply_url,)).fetchone()
+        return self._to_job(row) if row else None
+
+    def _where(
+        self,
+        query: Optional[str],
+        source: Optional[str],
+        remote: Optional[bool],
+        since: Optional[str]
+    ) -> Tuple[str, str, List]:
+        """Build the FROM/JOIN, WHERE and ORDER BY parts for a search."""
+        join = ""
+        clauses = []
+        params: List = []
+        order = "jobs.discovered_at DESC, jobs.id DESC"
+        if query and query.strip():
+            if self.fts_available:
+                join = " JOIN jobs_fts ON jobs_fts.rowid = jobs.id"
+                clauses.append("jobs_fts MATCH ?")
+                params.append(fts_query(query))
+                order = "jobs_fts.rank, jobs.id"
+            else:
+                for word in query.split():
+                    pattern = f"%{word.rstrip('*')}%"
+                    clauses.append("(jobs.title LIKE ? OR jobs.company LIKE ? OR jobs.description LIKE ?)")
+                    params.extend([pattern, pattern, pattern])
+        if source is not None:
+            clauses.append("jobs.source = ?")
+            params.append(source)
+        if remote is not None:
+            clauses.append("jobs.remote = ?")
+            params.append(1 if remote else 0)
+        if since is not None:
+            clauses.append("jobs.discovered_at >= ?")
+            params.append(since)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return join + where, order, params
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        source: Optional[str] = None,
+        remote: Optional[bool] = None,
+        since: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[Dict]:
+        """Return one page of jobs, best text match first (newest first without a query).
+
+        ``since`` is an ISO timestamp compared with ``discoveredAt``.
+        """
+        condition, order, params = self._where(query, source, remote, since)
+        sql = f"{_SELECT}{condition} ORDER BY {order} LIMIT ? OFFSET ?"
+        with self._lock:
+            rows = self._db.execute(sql, [*params, limit, offset]).fetchall()
+        return [self._to_job(row) for row in rows]
+
+    def count(
+        self,
+        query: Optional[str] = None,
+        source: Optional[str] = None,
+        remote: Optional[bool] = None,
+        since: Optional[str] = None
+    ) -> int:
+        """Number of jobs matching the same filters as ``search``."""
+        condition, _, params = self._where(query, source, remote, since)
+        with self._lock:
+            return self._db.execute(f"SELECT COUNT(*) FROM jobs{condition}", params).fetchone()[0]
+
+    def iter_jobs(
+        self,
+        query: Optional[str] = None,
+        source: Optional[str] = None,
+        remote: Optional[bool] = None,
+        since: Optional[str] = None,
+        batch_size: int = 500
+    ) -> Iterator[Dict]:
+        """Stream every matching job, reading ``batch_size`` rows at a time."""
+        condition, order, params = self._where(query, source, remote, since)
+        cursor = self._db.cursor()
+        try:
+            with self._lock:
+                cursor.execute(f"{_SELECT}{condition} ORDER BY {order}", params)
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield self._to_job(row)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _to_job(row: tuple) -> Dict:
+        job = {
+            "title": row[0],
+            "company": row[1],
+            "location": row[2],
+            "remote": bool(row[3]),
+            "description": row[4],
+            "applyUrl": row[5],
+            "source": row[6],
+            "discoveredAt": row[7]
+        }
+        if row[8]:
+            job.update(json.loads(row[8]))
+        return job
+
+
+# Singleton instance
+_job_store: Optional[JobStore] = None
+
+
+def get_job_store() -> JobStore:
+    """Get or create the job store singleton at JOB_STORE_DB (default jobs.db)."""
+    global _job_store
+    if _job_store is None:
+        _job_store = JobStore(os.getenv("JOB_STORE_DB", "jobs.db"))
+    return _job_store
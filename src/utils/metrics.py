@@ -0,0 +1,250 @@
+"""
+Metrics Utilities
+In-process counters and latency histograms with snapshot and Prometheus export
+"""
+
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+# Upper bounds, in seconds, of the default latency buckets
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Recording is on unless METRICS_ENABLED is 0/false/no; set_enabled switches it at runtime
+_enabled = os.getenv("METRICS_ENABLED", "1").lower() not in ("0", "false", "no", "off")
+
+_NULL_TIMER = nullcontext()
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn recording on or off for every metric. Values already recorded are kept."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values: Dict[tuple, object] = {}
+
+    def _key(self, values: tuple) -> tuple:
+        # Label values are kept as given and only turned into strings on export
+        if len(values) != len(self.labels):
+            raise ValueError(f"{self.name} expects labels {self.labels}, got {values}")
+        return values
+
+    def _label_dict(self, key: tuple) -> Dict[str, str]:
+        return dict(zip(self.labels, map(str, key)))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    """A monotonically increasing count, one per combination of label values."""
+
+    kind = "counter"
+
+    def inc(self, *labels, amount: float = 1.0) -> None:
+        """Add ``amount`` to the series for ``labels`` (positional, in declaration order)."""
+        if not _enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[Dict]:
+        with self._lock:
+            items = list(self._values.items())
+        return [{"labels": self._label_dict(key), "value": value} for key, value in items]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values (latencies, in seconds) in fixed buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels) -> None:
+        """Record one value for ``labels``."""
+        if not _enabled:
+            return
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                # Per-bucket counts (the last one is +Inf), then sum and count
+                series = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, *labels):
+        """Context manager that observes the wall time of its block."""
+        return _Timer(self, labels) if _enabled else _NULL_TIMER
+
+    def count(self, *labels) -> int:
+        series = self._values.get(self._key(labels))
+        return series[2] if series else 0
+
+    def _samples(self) -> List[Dict]:
+        with self._lock:
+            items = [(key, list(series[0]), series[1], series[2]) for key, series in self._values.items()]
+        samples = []
+        for key, counts, total, count in items:
+            cumulative = 0
+            buckets = {}
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts):
+                cumulative += bucket_count
+                buckets[_format_bound(bound)] = cumulative
+            samples.append({
+                "labels": self._label_dict(key),
+                "count": count,
+                "sum": total,
+                "buckets": buckets
+            })
+        return samples
+
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: Histogram, labels: tuple):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.histogram.observe(time.perf_counter() - self.start, *self.labels)
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == math.inf else repr(float(bound))
+
+
+# Every metric created through counter() / histogram(), by name
+_registry: Dict[str, _Metric] = {}
+_registry_lock = threading.Lock()
+
+
+def _register(cls, name: str, documentation: str, labels: Sequence[str], **kwargs) -> _Metric:
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = _registry[name] = cls(name, documentation, labels, **kwargs)
+        elif not isinstance(metric, cls) or metric.labels != tuple(labels):
+            raise ValueError(f"metric {name} is already registered with a different type or labels")
+        return metric
+
+
+def counter(name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+    """Get or create the counter ``name``."""
+    return _register(Counter, name, documentation, labels)
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labels: Sequence[str] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS
+) -> Histogram:
+    """Get or create the histogram ``name``."""
+    return _register(Histogram, name, documentation, labels, buckets=buckets)
+
+
+def get_metric(name: str) -> Optional[Union[Counter, Histogram]]:
+    return _registry.get(name)
+
+
+def snapshot() -> Dict[str, Dict]:
+    """Current value of every metric as plain data.
+
+    Counters report ``value`` per label set; histograms report ``count``,
+    ``sum`` and cumulative ``buckets`` keyed by upper bound.
+    """
+    with _registry_lock:
+        metrics = sorted(_registry.values(), key=lambda metric: metric.name)
+    return {
+        metric.name: {
+            "type": metric.kind,
+            "help": metric.documentation,
+            "labels": list(metric.labels),
+            "samples": metric._samples()
+        }
+        for metric in metrics
+    }
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(labels: Dict[str, str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels.items())
+    if extra is not None:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_prometheus() -> str:
+    """Every metric in the Prometheus text exposition format (version 0.0.4)."""
+    lines = []
+    for name, metric in snapshot().items():
+        lines.append(f"# HELP {name} {metric['help'].replace(chr(92), chr(92) * 2).replace(chr(10), ' ')}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for sample in metric["samples"]:
+            labels = sample["labels"]
+            if metric["type"] == "counter":
+                lines.append(f"{name}{_label_text(labels)} {_number(sample['value'])}")
+                continue
+            for bound, count in sample["buckets"].items():
+                lines.append(f"{name}_bucket{_label_text(labels, ('le', bound))} {count}")
+            lines.append(f"{name}_sum{_label_text(labels)} {_number(sample['sum'])}")
+            lines.append(f"{name}_count{_label_text(labels)} {sample['count']}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def reset() -> None:
+    """Clear recorded values; the metrics themselves stay registered."""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    for metric in metrics:
+        metric.reset()
@@ -0,0 +1,140 @@
+"""
+Resume Cache Utilities
+Content-addressed cache for parsed resumes
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+class ResumeCache:
+    """Two-tier cache of resume parse results keyed by content hash.
+
+    The memory tier is an LRU bounded by the total size of the cached entries
+    (stored as JSON, so every lookup returns an independent copy). When a
+    SQLite path is given, entries are also written through to disk and memory
+    misses fall back to it, so results survive restarts and can be shared by
+    several worker processes.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, db_path: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._db = None
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS parsed_resumes ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(file_content: bytes, *parts: object) -> str:
+        """Build a key from the SHA-256 of the file plus any version parts."""
+        digest = hashlib.sha256(file_content).hexdigest()
+        return ":".join([digest, *(str(part) for part in parts)])
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a copy of the cached result, or None on a miss."""
+        with self._lock:
+            encoded = self._entries.get(key)
+            if encoded is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return json.loads(encoded)
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM parsed_resumes WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._remember(key, row[0])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return json.loads(row[0])
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: dict) -> None:
+        """Store a parse result in memory and, if configured, on disk."""
+        encoded = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            self._remember(key, encoded)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO parsed_resumes (key, value, created_at) VALUES (?, ?, ?)",
+                    (key, encoded, time.time())
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, encoded: str) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        if len(encoded) > self.max_bytes:
+            return
+
+        self._entries[key] = encoded
+        self._size += len(encoded)
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.disk_hits = self.evictions = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM parsed_resumes")
+                self._db.commit()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current memory usage."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "diskHits": self.disk_hits,
+                "evictions": self.evictions,
+                "hitRate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._size
+            }
+
+
+# Singleton instance
+_resume_cache: Optional[ResumeCache] = None
+
+
+def get_resume_cache() -> ResumeCache:
+    """Get or create the resume cache singleton.
+
+    Sized by RESUME_CACHE_MAX_BYTES; RESUME_CACHE_DB enables the SQLite tier.
+    """
+    global _resume_cache
+    if _resume_cache is None:
+        _resume_cache = ResumeCache(
+            max_bytes=int(os.getenv("RESUME_CACHE_MAX_BYTES", 32 * 1024 * 1024)),
+            db_path=os.getenv("RESUME_CACHE_DB") or None
+        )
+    return _resume_cache
@@ -3,22 +3,227 @@ Resume Parsing Utilities
 Extract information from PDF and DOCX resumes
 """
 
+import importlib.util
+import io
+import os
 import re
-from typing import Optional
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from collections.abc import Mapping
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
-# Try to import parsing libraries
-try:
-    import PyPDF2
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
+import metrics
+from resume_cache import ResumeCache, get_resume_cache
+from skill_matcher import SkillMatcher, load_taxonomy
 
-try:
-    from docx import Document
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+# Parsing libraries are imported on first use; only their presence is checked here
+PDF_AVAILABLE = importlib.util.find_spec("PyPDF2") is not None
+DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
+
+TEXT_SECONDS = metrics.histogram(
+    "resume_text_seconds", "Time spent extracting resume text, by file type", ("file_type",)
+)
+EXTRACTOR_SECONDS = metrics.histogram(
+    "resume_extractor_seconds", "Time spent in each resume field extractor", ("extractor",)
+)
+
+# Slice size used when streaming plain-text resumes
+PLAIN_TEXT_CHUNK_SIZE = 16384
+
+# Bump whenever extraction logic changes the shape or content of results
+PARSER_VERSION = "3"
+
+# Precompiled extraction patterns. Experience and profile URL patterns expect
+# lowercased text.
+EMAIL_PATTERNS = (
+    re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'),
+)
+PHONE_PATTERNS = (
+    re.compile(r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}'),
+    re.compile(r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'),
+)
+EXPERIENCE_PATTERNS = (
+    re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?experience'),
+    re.compile(r'experience[:\s]*(\d+)\+?\s*years?'),
+    re.compile(r'(\d+)\+?\s*years?\s*(?:in|of)\s*(?:software|development|engineering)'),
+)
+YEAR_PATTERN = re.compile(r'20[0-2]\d')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[\w-]+')
+GITHUB_PATTERN = re.compile(r'github\.com/[\w-]+')
+
+
+def _first_match(patterns, text: str) -> Optional[str]:
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(0)
+    return None
+
+
+def _profile_url(pattern, lower: str) -> Optional[str]:
+    match = pattern.search(lower)
+    return f"https://{match.group(0)}" if match else None
+
+
+def _experience_years(lower: str) -> int:
+    for pattern in EXPERIENCE_PATTERNS:
+        match = pattern.search(lower)
+        if match:
+            return int(match.group(1))
+    
+    # Estimate from date ranges
+    years = [int(y) for y in YEAR_PATTERN.findall(lower)]
+    if years:
+        return max(years) - min(years)
+    
+    return 0
+
+
+_UNSET = object()
+
+
+class ParsedResume(Mapping):
+    """Resume parse result whose fields are computed on first access.
+    
+    The text is lowercased once and shared by every extractor; skills, job
+    titles and education come from a single matcher scan that is only run if
+    one of them is read. It behaves as a read-only mapping with the same keys
+    as the dict returned by ``ResumeParser.parse``, and ``to_dict()`` produces
+    exactly that dict.
+    """
+    
+    __slots__ = (
+        "text", "_parser", "_lower", "_matches", "_experience_years",
+        "_education", "_email", "_phone", "_linkedin", "_github"
+    )
+    
+    KEYS = (
+        "skills", "jobTitles", "experienceYears", "education",
+        "email", "phone", "linkedin", "github", "rawTextLength"
+    )
+    
+    def __init__(self, text: str, parser: "ResumeParser"):
+        self.text = text
+        self._parser = parser
+        self._lower = None
+        self._matches = None
+        self._experience_years = _UNSET
+        self._education = _UNSET
+        self._email = _UNSET
+        self._phone = _UNSET
+        self._linkedin = _UNSET
+        self._github = _UNSET
+    
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+    
+    @property
+    def matches(self) -> Dict[str, List[str]]:
+        if self._matches is None:
+            with EXTRACTOR_SECONDS.time("terms"):
+                normalized = " ".join(self.lower.split())
+                self._matches = self._parser.matcher.scan(normalized, normalized=True)
+        return self._matches
+    
+    @property
+    def skills(self) -> list:
+        return self.matches.get("skills", [])
+    
+    @property
+    def job_titles(self) -> list:
+        return self.matches.get("titles", [])
+    
+    @property
+    def experience_years(self) -> int:
+        if self._experience_years is _UNSET:
+            with EXTRACTOR_SECONDS.time("experience"):
+                self._experience_years = _experience_years(self.lower)
+        return self._experience_years
+    
+    @property
+    def education(self) -> list:
+        if self._education is _UNSET:
+            with EXTRACTOR_SECONDS.time("education"):
+                self._education = self._parser._education_from_matches(self.matches)
+        return self._education
+    
+    @property
+    def email(self) -> Optional[str]:
+        if self._email is _UNSET:
+            with EXTRACTOR_SECONDS.time("email"):
+                self._email = _first_match(EMAIL_PATTERNS, self.text)
+        return self._email
+    
+    @property
+    def phone(self) -> Optional[str]:
+        if self._phone is _UNSET:
+            with EXTRACTOR_SECONDS.time("phone"):
+                self._phone = _first_match(PHONE_PATTERNS, self.text)
+        return self._phone
+    
+    @property
+    def linkedin(self) -> Optional[str]:
+        if self._linkedin is _UNSET:
+            with EXTRACTOR_SECONDS.time("linkedin"):
+                self._linkedin = _profile_url(LINKEDIN_PATTERN, self.lower)
+        return self._linkedin
+    
+    @property
+    def github(self) -> Optional[str]:
+        if self._github is _UNSET:
+            with EXTRACTOR_SECONDS.time("github"):
+                self._github = _profile_url(GITHUB_PATTERN, self.lower)
+        return self._github
+    
+    @property
+    def raw_text_length(self) -> int:
+        return len(self.text)
+    
+    def __getitem__(self, key: str):
+        attribute = _PARSED_RESUME_ATTRIBUTES.get(key)
+        if attribute is None:
+            raise KeyError(key)
+        return getattr(self, attribute)
+    
+    def __iter__(self):
+        return iter(self.KEYS)
+    
+    def __len__(self) -> int:
+        return len(self.KEYS)
+    
+    def to_dict(self) -> dict:
+        """Evaluate every field and return the classic parse result dict."""
+        return {
+            "skills": list(self.skills),
+            "jobTitles": list(self.job_titles),
+            "experienceYears": self.experience_years,
+            "education": list(self.education),
+            "email": self.email,
+            "phone": self.phone,
+            "linkedin": self.linkedin,
+            "github": self.github,
+            "rawTextLength": self.raw_text_length
+        }
+
+
+_PARSED_RESUME_ATTRIBUTES = {
+    "skills": "skills",
+    "jobTitles": "job_titles",
+    "experienceYears": "experience_years",
+    "education": "education",
+    "email": "email",
+    "phone": "phone",
+    "linkedin": "linkedin",
+    "github": "github",
+    "rawTextLength": "raw_text_length"
+}
 
 
 class ResumeParser:
@@ -36,6 +241,17 @@ class ResumeParser:
         "git", "linux", "sql", "nosql", "data analysis"
     ]
     
+    # Common alternative spellings and the skill they stand for
+    SKILL_ALIASES = [
+        ("k8s", "kubernetes"),
+        ("golang", "go"),
+        ("postgres", "postgresql"),
+        ("nodejs", "node.js"),
+        ("reactjs", "react"),
+        ("vuejs", "vue"),
+        ("nextjs", "next.js"),
+    ]
+    
     # Common job titles
     JOB_TITLES = [
         "software engineer", "senior software engineer", "staff engineer", "principal engineer",
@@ -47,188 +263,515 @@ class ResumeParser:
         "qa engineer", "test engineer", "automation engineer", "security engineer"
     ]
     
-    def __init__(self):
+    # Degree keywords and the label they map to
+    DEGREES = [
+        ("phd", "Ph.D."),
+        ("doctorate", "Ph.D."),
+        ("master's", "Master's"),
+        ("masters", "Master's"),
+        ("mba", "MBA"),
+        ("m.s.", "M.S."),
+        ("ms in", "M.S."),
+        ("bachelor's", "Bachelor's"),
+        ("bachelors", "Bachelor's"),
+        ("b.s.", "B.S."),
+        ("bs in", "B.S."),
+        ("b.a.", "B.A."),
+        ("ba in", "B.A."),
+    ]
+    
+    # Fields of study, in order of preference when pairing with a degree
+    EDUCATION_FIELDS = [
+        "computer science", "software engineering", "information technology",
+        "data science", "machine learning", "electrical engineering",
+        "mathematics", "physics", "business administration", "economics"
+    ]
+    
+    def __init__(self, matcher: Optional[SkillMatcher] = None):
         self.text = ""
+        self.matcher = matcher if matcher is not None else self.default_matcher()
+    
+    @classmethod
+    def build_matcher(cls, taxonomy_path: Optional[str] = None) -> SkillMatcher:
+        """Compile the built-in vocabulary, optionally extended from a taxonomy file."""
+        matcher = SkillMatcher()
+        for skill in cls.TECH_SKILLS:
+            matcher.add("skills", skill, cls._format_skill(skill))
+        for alias, skill in cls.SKILL_ALIASES:
+            matcher.add("skills", alias, cls._format_skill(skill))
+        for title in cls.JOB_TITLES:
+            matcher.add("titles", title, title.title())
+        for key, degree in cls.DEGREES:
+            matcher.add("degrees", key, degree)
+        for field in cls.EDUCATION_FIELDS:
+            matcher.add("fields", field, field.title())
+        if taxonomy_path:
+            load_taxonomy(taxonomy_path, matcher)
+        matcher.compile()
+        return matcher
+    
+    @classmethod
+    def default_matcher(cls) -> SkillMatcher:
+        """Return the shared matcher for the built-in vocabulary of this class."""
+        if "_default_matcher" not in cls.__dict__:
+            cls._default_matcher = cls.build_matcher()
+        return cls._default_matcher
     
-    def parse_pdf(self, file_content: bytes) -> str:
+    @staticmethod
+    def _format_skill(skill: str) -> str:
+        """Capitalize a skill name for display."""
+        if skill == "c++":
+            return "C++"
+        if skill == "c#":
+            return "C#"
+        return skill.title() if len(skill) > 3 else skill.upper()
+    
+    def parse_pdf(self, file_content: bytes, max_pages: Optional[int] = None) -> str:
         """Extract text from PDF file."""
         if not PDF_AVAILABLE:
             return ""
-        
-        try:
-            import io
-            reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text
-        except Exception as e:
-            return f"Error parsing PDF: {str(e)}"
+        return self.extract_text(file_content, "pdf", max_pages=max_pages)
     
     def parse_docx(self, file_content: bytes) -> str:
         """Extract text from DOCX file."""
         if not DOCX_AVAILABLE:
             return ""
+        return self.extract_text(file_content, "docx")
+    
+    def iter_text(
+        self,
+        file_content: bytes,
+        file_type: str,
+        max_pages: Optional[int] = None
+    ) -> Iterator[str]:
+        """Yield resume text incrementally.
         
-        try:
-            import io
+        PDFs are yielded page by page (at most ``max_pages`` pages), DOCX files
+        paragraph by paragraph and plain text in fixed-size slices. Pages that
+        are never requested are never extracted.
+        """
+        file_type = file_type.lower()
+        if file_type == "pdf":
+            if not PDF_AVAILABLE:
+                return
+            import PyPDF2
+            reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+            for page in islice(reader.pages, max_pages):
+                yield (page.extract_text() or "") + "\n"
+        elif file_type in ["docx", "doc"]:
+            if not DOCX_AVAILABLE:
+                return
+            from docx import Document
             doc = Document(io.BytesIO(file_content))
-            text = ""
             for para in doc.paragraphs:
-                text += para.text + "\n"
-            return text
+                yield para.text + "\n"
+        else:
+            try:
+                text = file_content.decode("utf-8")
+            except UnicodeDecodeError:
+                return
+            for start in range(0, len(text), PLAIN_TEXT_CHUNK_SIZE):
+                yield text[start:start + PLAIN_TEXT_CHUNK_SIZE]
+    
+    def extract_text(
+        self,
+        file_content: bytes,
+        file_type: str,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        stop_when: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """Extract resume text, stopping early once a budget is reached.
+        
+        Extraction stops after ``max_pages`` PDF pages, after ``max_chars``
+        characters, or as soon as ``stop_when`` returns True for a chunk (see
+        :meth:`enough_signal`). Chunks are joined once at the end.
+        """
+        kind = file_type.lower()
+        with TEXT_SECONDS.time(kind if kind in ("pdf", "docx", "doc") else "text"):
+            return self._extract_text(file_content, file_type, max_pages, max_chars, stop_when)
+    
+    def _extract_text(
+        self,
+        file_content: bytes,
+        file_type: str,
+        max_pages: Optional[int],
+        max_chars: Optional[int],
+        stop_when: Optional[Callable[[str], bool]]
+    ) -> str:
+        parts = []
+        size = 0
+        try:
+            for chunk in self.iter_text(file_content, file_type, max_pages):
+                if max_chars is not None and size + len(chunk) >= max_chars:
+                    parts.append(chunk[:max_chars - size])
+                    break
+                parts.append(chunk)
+                size += len(chunk)
+                if stop_when is not None and stop_when(chunk):
+                    break
         except Exception as e:
-            return f"Error parsing DOCX: {str(e)}"
+            kind = "PDF" if file_type.lower() == "pdf" else "DOCX"
+            return f"Error parsing {kind}: {str(e)}"
+        return "".join(parts)
     
-    def extract_skills(self, text: str) -> list:
-        """Extract skills from resume text."""
-        text_lower = text.lower()
-        found_skills = []
+    def enough_signal(self, min_skills: int = 8) -> Callable[[str], bool]:
+        """Build a ``stop_when`` predicate for :meth:`extract_text`.
+        
+        It reports True once an email address and at least ``min_skills``
+        distinct skills have been seen across the chunks fed to it.
+        """
+        skills = set()
+        email_found = False
         
-        for skill in self.TECH_SKILLS:
-            if skill in text_lower:
-                # Capitalize properly
-                formatted = skill.title() if len(skill) > 3 else skill.upper()
-                if skill == "c++":
-                    formatted = "C++"
-                elif skill == "c#":
-                    formatted = "C#"
-                found_skills.append(formatted)
+        def check(chunk: str) -> bool:
+            nonlocal email_found
+            email_found = email_found or self.extract_email(chunk) is not None
+            skills.update(self.extract_skills(chunk))
+            return email_found and len(skills) >= min_skills
         
-        return list(set(found_skills))
+        return check
+    
+    def match_terms(self, text: str) -> Dict[str, List[str]]:
+        """Find skills, titles, degrees and fields of study in a single scan."""
+        return self.matcher.scan(text)
+    
+    def extract_skills(self, text: str) -> list:
+        """Extract skills from resume text."""
+        return self.match_terms(text).get("skills", [])
     
     def extract_job_titles(self, text: str) -> list:
         """Extract job titles from resume text."""
-        text_lower = text.lower()
-        found_titles = []
-        
-        for title in self.JOB_TITLES:
-            if title in text_lower:
-                found_titles.append(title.title())
-        
-        return list(set(found_titles))
+        return self.match_terms(text).get("titles", [])
     
     def extract_experience_years(self, text: str) -> int:
         """Extract years of experience from resume text."""
-        patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-            r'experience[:\s]*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s*(?:in|of)\s*(?:software|development|engineering)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                return int(match.group(1))
-        
-        # Estimate from date ranges
-        year_pattern = r'20[0-2]\d'
-        years = re.findall(year_pattern, text)
-        if years:
-            years = [int(y) for y in years]
-            return max(years) - min(years)
-        
-        return 0
+        return _experience_years(text.lower())
     
     def extract_education(self, text: str) -> list:
         """Extract education from resume text."""
-        education = []
-        text_lower = text.lower()
-        
-        degrees = [
-            ("phd", "Ph.D."),
-            ("doctorate", "Ph.D."),
-            ("master's", "Master's"),
-            ("masters", "Master's"),
-            ("mba", "MBA"),
-            ("m.s.", "M.S."),
-            ("ms in", "M.S."),
-            ("bachelor's", "Bachelor's"),
-            ("bachelors", "Bachelor's"),
-            ("b.s.", "B.S."),
-            ("bs in", "B.S."),
-            ("b.a.", "B.A."),
-            ("ba in", "B.A."),
-        ]
-        
-        fields = [
-            "computer science", "software engineering", "information technology",
-            "data science", "machine learning", "electrical engineering",
-            "mathematics", "physics", "business administration", "economics"
-        ]
+        return self._education_from_matches(self.match_terms(text))
+    
+    def _education_from_matches(self, matches: Dict[str, List[str]]) -> list:
+        """Pair each degree found with the preferred field of study found."""
+        found_fields = set(matches.get("fields", []))
+        field = next(
+            (f.title() for f in self.EDUCATION_FIELDS if f.title() in found_fields),
+            None
+        )
         
-        for key, degree in degrees:
-            if key in text_lower:
-                for field in fields:
-                    if field in text_lower:
-                        education.append(f"{degree} in {field.title()}")
-                        break
-                else:
-                    education.append(degree)
+        education = []
+        for degree in matches.get("degrees", []):
+            entry = f"{degree} in {field}" if field else degree
+            if entry not in education:
+                education.append(entry)
         
-        return list(set(education))
+        return education
     
     def extract_email(self, text: str) -> Optional[str]:
         """Extract email from resume text."""
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        match = re.search(email_pattern, text)
-        return match.group(0) if match else None
+        return _first_match(EMAIL_PATTERNS, text)
     
     def extract_phone(self, text: str) -> Optional[str]:
         """Extract phone number from resume text."""
-        phone_patterns = [
-            r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',
-            r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'
-        ]
-        
-        for pattern in phone_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(0)
-        return None
+        return _first_match(PHONE_PATTERNS, text)
     
     def extract_linkedin(self, text: str) -> Optional[str]:
         """Extract LinkedIn URL from resume text."""
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        match = re.search(linkedin_pattern, text.lower())
-        return f"https://{match.group(0)}" if match else None
+        return _profile_url(LINKEDIN_PATTERN, text.lower())
     
     def extract_github(self, text: str) -> Optional[str]:
         """Extract GitHub URL from resume text."""
-        github_pattern = r'github\.com/[\w-]+'
-        match = re.search(github_pattern, text.lower())
-        return f"https://{match.group(0)}" if match else None
-    
-    def parse(self, file_content: bytes, file_type: str) -> dict:
-        """Parse resume and extract all information."""
-        # Extract text based on file type
-        if file_type.lower() == "pdf":
-            text = self.parse_pdf(file_content)
-        elif file_type.lower() in ["docx", "doc"]:
-            text = self.parse_docx(file_content)
-        else:
-            # Try to decode as plain text
-            try:
-                text = file_content.decode("utf-8")
-            except:
-                text = ""
-        
+        return _profile_url(GITHUB_PATTERN, text.lower())
+    
+    def cache_key(
+        self,
+        file_content: bytes,
+        file_type: str,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ) -> str:
+        """Cache key for a parse: file hash, parser/taxonomy version and budgets."""
+        return ResumeCache.make_key(
+            file_content, file_type.lower(), PARSER_VERSION, self.matcher.version, max_pages, max_chars
+        )
+    
+    def parse_text(self, text: str) -> "ParsedResume":
+        """Wrap already extracted text in a lazily evaluated result."""
         self.text = text
+        return ParsedResume(text, self)
+    
+    def parse_lazy(
+        self,
+        file_content: bytes,
+        file_type: str,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ) -> "ParsedResume":
+        """Extract the text now but compute each field only when first accessed."""
+        text = self.extract_text(file_content, file_type, max_pages=max_pages, max_chars=max_chars)
+        return self.parse_text(text)
+    
+    def parse(
+        self,
+        file_content: bytes,
+        file_type: str,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ) -> dict:
+        """Parse resume and extract all information.
         
-        return {
-            "skills": self.extract_skills(text),
-            "jobTitles": self.extract_job_titles(text),
-            "experienceYears": self.extract_experience_years(text),
-            "education": self.extract_education(text),
-            "email": self.extract_email(text),
-            "phone": self.extract_phone(text),
-            "linkedin": self.extract_linkedin(text),
-            "github": self.extract_github(text),
-            "rawTextLength": len(text)
-        }
+        ``max_pages`` and ``max_chars`` bound how much of a large upload is
+        read; by default the whole document is parsed.
+        """
+        return self.parse_lazy(file_content, file_type, max_pages=max_pages, max_chars=max_chars).to_dict()
+
 
 
-def parse_resume(file_content: bytes, file_type: str) -> dict:
-    """Convenience function to parse a resume."""
+def parse_resume(
+    file_content: bytes,
+    file_type: str,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    use_cache: bool = True
+) -> dict:
+    """Convenience function to parse a resume.
+    
+    Results are looked up in the shared resume cache first, so re-uploads of
+    the same file are not parsed again. Pass ``use_cache=False`` to bypass it.
+    """
     parser = ResumeParser()
-    return parser.parse(file_content, file_type)
+    if not use_cache:
+        return parser.parse(file_content, file_type, max_pages=max_pages, max_chars=max_chars)
+    
+    cache = get_resume_cache()
+    key = parser.cache_key(file_content, file_type, max_pages, max_chars)
+    result = cache.get(key)
+    if result is None:
+        result = parser.parse(file_content, file_type, max_pages=max_pages, max_chars=max_chars)
+        cache.put(key, result)
+    return result
+
+
+# Parser reused by every task that runs in a batch worker process
+_worker_parser: Optional[ResumeParser] = None
+
+
+def _init_batch_worker() -> None:
+    """Build the parser (and its compiled matcher) once per worker process."""
+    global _worker_parser
+    _worker_parser = ResumeParser()
+
+
+def _parse_batch_chunk(chunk: List[Tuple[int, bytes, str]]) -> List[Tuple[int, dict]]:
+    """Parse a chunk of resumes, isolating failures to the item that raised."""
+    parser = _worker_parser if _worker_parser is not None else ResumeParser()
+    results = []
+    for index, file_content, file_type in chunk:
+        try:
+            results.append((index, parser.parse(file_content, file_type)))
+        except Exception as e:
+            results.append((index, {"error": f"Error parsing resume: {str(e)}"}))
+    return results
+
+
+def _terminate_pool(executor: ProcessPoolExecutor) -> None:
+    """Shut a pool down without waiting, killing workers stuck on a task."""
+    workers = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in workers:
+        if process.is_alive():
+            process.terminate()
+
+
+def _chunk_errors(chunk: List[Tuple[int, bytes, str]], message: str) -> List[Tuple[int, dict]]:
+    return [(index, {"error": message}) for index, _, _ in chunk]
+
+
+def _parse_isolated(
+    chunk: List[Tuple[int, bytes, str]],
+    timeout: Optional[float]
+) -> List[Tuple[int, dict]]:
+    """Re-run a chunk suspected of crashing its worker in a private process."""
+    executor = ProcessPoolExecutor(max_workers=1, initializer=_init_batch_worker)
+    future = executor.submit(_parse_batch_chunk, chunk)
+    try:
+        return future.result(timeout=timeout * len(chunk) if timeout else None)
+    except BrokenProcessPool:
+        return _chunk_errors(chunk, "Error parsing resume: worker process crashed")
+    except FutureTimeoutError:
+        return _chunk_errors(chunk, "Error parsing resume: timed out")
+    except Exception as e:
+        return _chunk_errors(chunk, f"Error parsing resume: {str(e)}")
+    finally:
+        if future.done():
+            executor.shutdown()
+        else:
+            _terminate_pool(executor)
+
+
+def parse_resume_batch(
+    items: Iterable[Tuple[bytes, str]],
+    max_workers: Optional[int] = None,
+    chunk_size: int = 4,
+    ordered: bool = True,
+    timeout: Optional[float] = None,
+    use_cache: bool = True
+) -> Iterator[Tuple[int, dict]]:
+    """Parse many resumes across a process pool.
+    
+    ``items`` is consumed lazily as ``(file_content, file_type)`` pairs and
+    yields ``(index, result)`` tuples, where ``index`` is the position in the
+    input. With ``ordered=True`` results come back in input order, otherwise
+    as soon as each chunk completes.
+    
+    Items are submitted in chunks of ``chunk_size`` with at most two chunks
+    queued per worker, so memory stays bounded for very large imports. A
+    failing item yields ``{"error": ...}`` instead of stopping the batch: an
+    exception only affects its own item, a crashed worker causes the affected
+    items to be retried one by one until the culprit is found, and an item
+    still running after ``timeout`` seconds is abandoned and its worker
+    replaced.
+    
+    Items already in the resume cache are answered without being sent to a
+    worker, and successful results are added to it.
+    
+    ``max_workers`` defaults to the CPU count; 0 or 1 parses in-process.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    chunk_size = max(1, chunk_size)
+    cache = get_resume_cache() if use_cache else None
+    key_parser = ResumeParser()
+    keys: Dict[int, str] = {}
+    
+    def cached(index: int, file_content: bytes, file_type: str) -> Optional[dict]:
+        if cache is None:
+            return None
+        key = key_parser.cache_key(file_content, file_type)
+        result = cache.get(key)
+        if result is None:
+            keys[index] = key
+        return result
+    
+    def remember(results: List[Tuple[int, dict]]) -> None:
+        for index, result in results:
+            key = keys.pop(index, None)
+            if key is not None and "error" not in result:
+                cache.put(key, result)
+    
+    if max_workers <= 1:
+        _init_batch_worker()
+        for index, (file_content, file_type) in enumerate(items):
+            result = cached(index, file_content, file_type)
+            if result is None:
+                results = _parse_batch_chunk([(index, file_content, file_type)])
+                remember(results)
+                result = results[0][1]
+            yield index, result
+        return
+    
+    source = enumerate(items)
+    exhausted = False
+    hits: List[Tuple[int, dict]] = []
+    retry: List[List[Tuple[int, bytes, str]]] = []
+    pending: Dict = {}  # future -> (chunk, deadline)
+    buffered: Dict[int, dict] = {}
+    next_index = 0
+    max_pending = max_workers * 2
+    
+    def new_pool() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker)
+    
+    def submit(chunk):
+        deadline = time.monotonic() + timeout * len(chunk) if timeout else None
+        pending[executor.submit(_parse_batch_chunk, chunk)] = (chunk, deadline)
+    
+    executor = new_pool()
+    try:
+        while True:
+            while len(pending) < max_pending and len(hits) < max_pending * chunk_size and (
+                retry or not exhausted
+            ):
+                if retry:
+                    submit(retry.pop())
+                    continue
+                chunk = []
+                for index, (file_content, file_type) in source:
+                    result = cached(index, file_content, file_type)
+                    if result is not None:
+                        hits.append((index, result))
+                        continue
+                    chunk.append((index, file_content, file_type))
+                    if len(chunk) >= chunk_size:
+                        break
+                else:
+                    exhausted = True
+                if chunk:
+                    submit(chunk)
+            
+            if not pending and not hits:
+                break
+            
+            done = set()
+            if pending:
+                wait_for = 0 if hits else None
+                deadlines = [deadline for _, deadline in pending.values() if deadline]
+                if deadlines and not hits:
+                    wait_for = max(0.0, min(deadlines) - time.monotonic())
+                done, _ = wait(list(pending), timeout=wait_for, return_when=FIRST_COMPLETED)
+            
+            results, hits = hits, []
+            broken = False
+            for future in done:
+                chunk, _ = pending.pop(future)
+                try:
+                    results.extend(future.result())
+                except BrokenProcessPool:
+                    # Any in-flight chunk can see the crash, so only a crash
+                    # reproduced in isolation is blamed on the item itself.
+                    broken = True
+                    if len(chunk) > 1:
+                        retry.extend([item] for item in chunk)
+                    else:
+                        results.extend(_parse_isolated(chunk, timeout))
+                except Exception as e:
+                    results.extend(_chunk_errors(chunk, f"Error parsing resume: {str(e)}"))
+            
+            if pending and not done and not results:
+                # Abandon chunks past their deadline and recycle the stuck pool
+                now = time.monotonic()
+                for future, (chunk, deadline) in list(pending.items()):
+                    del pending[future]
+                    if deadline and deadline <= now and len(chunk) > 1:
+                        retry.extend([item] for item in chunk)
+                    elif deadline and deadline <= now:
+                        results.extend(_chunk_errors(chunk, "Error parsing resume: timed out"))
+                    else:
+                        retry.append(chunk)
+                broken = True
+            
+            if broken:
+                for future, (chunk, _) in list(pending.items()):
+                    del pending[future]
+                    retry.append(chunk)
+                _terminate_pool(executor)
+                executor = new_pool()
+            
+            if cache is not None:
+                remember(results)
+            
+            if not ordered:
+                yield from results
+                continue
+            
+            for index, result in results:
+                buffered[index] = result
+            while next_index in buffered:
+                yield next_index, buffered.pop(next_index)
+                next_index += 1
+    finally:
+        if pending:
+            _terminate_pool(executor)
+        else:
+            executor.shutdown()
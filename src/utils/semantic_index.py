@@ -0,0 +1,254 @@
+"""
+Semantic Index Utilities
+Offline hashed-feature vectors and cosine top-k retrieval for jobs and resumes
+"""
+
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
+from zlib import crc32
+
+from skill_matcher import SkillMatcher, normalize_text
+
+# Try to import numpy
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+DEFAULT_DIMENSIONS = 256
+# Size of the hashed document-frequency table used by fit_idf
+IDF_BUCKETS = 1 << 20
+SKILL_WEIGHT = 2.0
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+
+def _hashed(feature: str, dimensions: int, weight: float = 1.0) -> Tuple[int, float]:
+    """Column and signed weight of a feature (crc32 is stable across processes)."""
+    value = crc32(feature.encode("utf-8"))
+    return value % dimensions, weight if value & 0x80000000 else -weight
+
+
+@lru_cache(maxsize=200_000)
+def _token_features(token: str, dimensions: int) -> Tuple[Tuple[int, float], ...]:
+    """Signed hashed features of a word: the word itself plus its character trigrams.
+
+    The trigrams share one unit of weight, so a word counts about twice as
+    much as a lone misspelling of it while still matching its variants.
+    """
+    features = [_hashed(token, dimensions)]
+    if len(token) > 3:
+        padded = f"<{token}>"
+        grams = [padded[i:i + 3] for i in range(len(padded) - 2)]
+        weight = 1.0 / len(grams)
+        features.extend(_hashed("#" + gram, dimensions, weight) for gram in grams)
+    return tuple(features)
+
+
+def job_text(job: Mapping) -> str:
+    """Text to embed for a cleaned job (see ``JobScraper.clean_job_data``)."""
+    parts = [job.get("title") or "", job.get("company") or "", job.get("description") or ""]
+    requirements = job.get("requirements")
+    if requirements:
+        parts.extend(requirements)
+    return "\n".join(parts)
+
+
+def resume_text(resume: Mapping) -> str:
+    """Text to embed for a parsed resume (see ``ResumeParser.parse``)."""
+    parts = [
+        *(resume.get("jobTitles") or []),
+        *(resume.get("skills") or []),
+        *(resume.get("education") or [])
+    ]
+    return "\n".join(parts)
+
+
+class SemanticIndex:
+    """In-memory vector index with cosine top-k search and no network calls.
+
+    Text is turned into a signed hashed bag of words and character trigrams
+    (so "postgres" still lands near "postgresql"), with sublinear term
+    frequency and, after ``fit_idf``, inverse document frequency weights.
+    With a ``SkillMatcher``, every skill a text mentions also adds a feature
+    for its canonical label, so taxonomy aliases such as "k8s" and
+    "Kubernetes" share a feature.
+
+    Vectors are L2-normalized float32 rows of one preallocated matrix that
+    grows by doubling. Deleting an item moves the last row into its slot, so
+    the live rows are always contiguous, and a batch of queries is a single
+    matrix product followed by a partial sort. Without NumPy, rows are plain
+    lists and queries fall back to pure Python.
+    """
+
+    def __init__(
+        self,
+        dimensions: int = DEFAULT_DIMENSIONS,
+        matcher: Optional[SkillMatcher] = None,
+        initial_capacity: int = 1024
+    ):
+        self.dimensions = dimensions
+        self.matcher = matcher
+        self._idf = None
+        self._ids: List[Hashable] = []
+        self._rows: Dict[Hashable, int] = {}
+        if NUMPY_AVAILABLE:
+            self._matrix = np.zeros((max(initial_capacity, 1), dimensions), dtype=np.float32)
+        else:
+            self._matrix = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, item_id: Hashable) -> bool:
+        return item_id in self._rows
+
+    def fit_idf(self, texts: Iterable[str]) -> None:
+        """Learn inverse document frequencies from a sample corpus.
+
+        Fit before adding items; vectors already in the index keep the
+        weights they were built with.
+        """
+        counts = Counter()
+        documents = 0
+        for text in texts:
+            documents += 1
+            tokens = set(_TOKEN_PATTERN.findall(text.lower()))
+            counts.update(crc32(token.encode("utf-8")) % IDF_BUCKETS for token in tokens)
+        self._idf = (documents, counts)
+
+    def _token_idf(self, token: str) -> float:
+        if self._idf is None:
+            return 1.0
+        documents, counts = self._idf
+        frequency = counts.get(crc32(token.encode("utf-8")) % IDF_BUCKETS, 0)
+        return math.log((documents + 1) / (frequency + 1)) + 1.0
+
+    def _features(self, text: str) -> Dict[int, float]:
+        # Lowercased with whitespace collapsed, as the skill matcher expects
+        lower = normalize_text(text)
+        vector: Dict[int, float] = {}
+        for token, count in Counter(_TOKEN_PATTERN.findall(lower)).items():
+            weight = (1.0 + math.log(count)) * self._token_idf(token)
+            for index, value in _token_features(token, self.dimensions):
+                vector[index] = vector.get(index, 0.0) + value * weight
+
+        if self.matcher is not None:
+            for label in self.matcher.scan(lower, normalized=True).get("skills", []):
+                index, value = _hashed("skill:" + label.lower(), self.dimensions, SKILL_WEIGHT)
+                vector[index] = vector.get(index, 0.0) + value
+        return vector
+
+    def vectorize(self, texts: Sequence[str]):
+        """Return L2-normalized vectors for ``texts`` (a float32 array with NumPy)."""
+        if not NUMPY_AVAILABLE:
+            return [self._vector_list(text) for text in texts]
+
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            features = self._features(text)
+            if features:
+                vectors[row, list(features)] = list(features.values())
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+    def _vector_list(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+        for index, value in self._features(text).items():
+            vector[index] = value
+        norm = math.sqrt(sum(value * value for value in vector))
+        return [value / norm for value in vector] if norm else vector
+
+    def add(self, item_id: Hashable, text: str) -> None:
+        """Add or replace one item."""
+        self.add_many([(item_id, text)])
+
+    def add_many(self, items: Iterable[Tuple[Hashable, str]]) -> None:
+        """Add or replace many ``(item_id, text)`` pairs."""
+        items = list(items)
+        if not items:
+            return
+        vectors = self.vectorize([text for _, text in items])
+        for (item_id, _), vector in zip(items, vectors):
+            row = self._rows.get(item_id)
+            if row is None:
+                row = len(self._ids)
+                self._ids.append(item_id)
+                self._rows[item_id] = row
+                self._reserve(row + 1)
+                if not NUMPY_AVAILABLE:
+                    self._matrix.append(vector)
+                    continue
+            self._matrix[row] = vector
+
+    def add_jobs(self, jobs: Iterable[Mapping], key: str = "applyUrl") -> None:
+        """Index cleaned jobs under ``job[key]``."""
+        self.add_many((job[key], job_text(job)) for job in jobs)
+
+    def _reserve(self, size: int) -> None:
+        if not NUMPY_AVAILABLE or size <= len(self._matrix):
+            return
+        grown = np.zeros((max(size, 2 * len(self._matrix)), self.dimensions), dtype=np.float32)
+        grown[:len(self._matrix)] = self._matrix
+        self._matrix = grown
+
+    def remove(self, item_id: Hashable) -> bool:
+        """Delete an item, returning False if it was not indexed."""
+        row = self._rows.pop(item_id, None)
+        if row is None:
+            return False
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+            self._matrix[row] = self._matrix[last]
+        self._ids.pop()
+        if NUMPY_AVAILABLE:
+            self._matrix[last] = 0.0
+        else:
+            self._matrix.pop()
+        return True
+
+    def query(self, text: str, k: int = 10) -> List[Tuple[Hashable, float]]:
+        """Return up to ``k`` ``(item_id, cosine similarity)`` pairs, best first."""
+        return self.query_batch([text], k=k)[0]
+
+    def query_batch(self, texts: Sequence[str], k: int = 10) -> List[List[Tuple[Hashable, float]]]:
+        """Run several queries with a single matrix product."""
+        size = len(self._ids)
+        if not texts:
+            return []
+        if not size or k <= 0:
+            return [[] for _ in texts]
+        queries = self.vectorize(texts)
+
+        if not NUMPY_AVAILABLE:
+            results = []
+            for query in queries:
+                scores = [sum(a * b for a, b in zip(row, query)) for row in self._matrix]
+                best = sorted(range(size), key=lambda i: (-scores[i], i))[:k]
+                results.append([(self._ids[i], scores[i]) for i in best])
+            return results
+
+        scores = queries @ self._matrix[:size].T
+        k = min(k, size)
+        if k < size:
+            candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            candidates = np.broadcast_to(np.arange(size), (len(texts), size))
+        results = []
+        for row, columns in enumerate(candidates):
+            values = scores[row, columns]
+            order = np.lexsort((columns, -values))
+            results.append([(self._ids[columns[i]], float(values[i])) for i in order])
+        return results
+
+    def query_resume(self, resume: Mapping, k: int = 10) -> List[Tuple[Hashable, float]]:
+        """Return the jobs most similar to a parsed resume."""
+        return self.query(resume_text(resume), k=k)
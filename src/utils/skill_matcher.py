@@ -0,0 +1,181 @@
+"""
+Skill Matching Utilities
+Single-pass, word-boundary aware matching of skills, titles and degrees
+"""
+
+import csv
+import hashlib
+import json
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase text and collapse every whitespace run to a single space."""
+    return " ".join(text.lower().split())
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over a labelled vocabulary.
+
+    Every term belongs to a category (e.g. "skills", "titles") and maps to a
+    display label, so aliases such as "k8s" and "kubernetes" can both resolve
+    to "Kubernetes". The text is scanned once regardless of vocabulary size and
+    a hit only counts when it is not glued to a neighbouring letter or digit,
+    so "go" does not match inside "google" nor "sql" inside "mysql".
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, Optional[str]]] = ()):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._own: List[List[int]] = [[]]
+        self._out: List[List[int]] = [[]]
+        self._terms: List[Tuple[int, str, str]] = []  # (length, category, label)
+        self._seen: Dict[Tuple[str, str], int] = {}
+        self._compiled = True
+        self._version: Optional[str] = None
+
+        for category, term, label in entries:
+            self.add(category, term, label)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    @property
+    def version(self) -> str:
+        """Stable fingerprint of the vocabulary, for cache keys."""
+        if self._version is None:
+            digest = hashlib.sha1()
+            for term, index in sorted(self._seen.items()):
+                _, _, label = self._terms[index]
+                digest.update(f"{term[0]}\x1f{term[1]}\x1f{label}\x1e".encode("utf-8"))
+            self._version = digest.hexdigest()[:12]
+        return self._version
+
+    def add(self, category: str, term: str, label: Optional[str] = None) -> None:
+        """Add a term to the vocabulary. The label defaults to the term itself."""
+        normalized = normalize_text(term)
+        if not normalized or (category, normalized) in self._seen:
+            return
+
+        state = 0
+        for ch in normalized:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._own.append([])
+                self._goto[state][ch] = next_state
+            state = next_state
+
+        index = len(self._terms)
+        self._terms.append((len(normalized), category, label if label is not None else term))
+        self._seen[(category, normalized)] = index
+        self._own[state].append(index)
+        self._compiled = False
+        self._version = None
+
+    def compile(self) -> None:
+        """Build failure links. Called lazily on the first scan after changes."""
+        self._out = [list(own) for own in self._own]
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+        self._compiled = True
+
+    def finditer(self, text: str, normalized: bool = False) -> Iterator[Tuple[int, int, str, str]]:
+        """Yield (start, end, category, label) for every boundary-aligned hit.
+
+        Offsets refer to the normalized text. Pass ``normalized=True`` when the
+        caller already ran :func:`normalize_text` to avoid doing it twice.
+        """
+        if not self._compiled:
+            self.compile()
+        if not normalized:
+            text = normalize_text(text)
+
+        goto, fail, out, terms = self._goto, self._fail, self._out, self._terms
+        size = len(text)
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            end = pos + 1
+            if end < size and _is_word_char(text[end]):
+                continue
+            for index in out[state]:
+                length, category, label = terms[index]
+                start = end - length
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                yield start, end, category, label
+
+    def scan(self, text: str, normalized: bool = False) -> Dict[str, List[str]]:
+        """Return the distinct labels found per category, in order of appearance."""
+        found: Dict[str, Dict[str, None]] = {}
+        for _, _, category, label in self.finditer(text, normalized):
+            found.setdefault(category, {})[label] = None
+        return {category: list(labels) for category, labels in found.items()}
+
+
+def load_taxonomy(path: str, matcher: Optional[SkillMatcher] = None) -> SkillMatcher:
+    """Load a skill/title taxonomy file into a matcher.
+
+    Two formats are supported:
+
+    * ``.json`` - ``{"skills": {"Kubernetes": ["k8s", "kube"]}, "titles": ["sre"]}``;
+      a category maps either labels to alias lists or holds a plain term list.
+    * anything else - tab separated ``category<TAB>label[<TAB>alias,alias]`` lines;
+      blank lines and lines starting with ``#`` are ignored.
+
+    The label itself is always matched in addition to its aliases.
+    """
+    matcher = matcher if matcher is not None else SkillMatcher()
+
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for category, terms in data.items():
+            if isinstance(terms, dict):
+                for label, aliases in terms.items():
+                    matcher.add(category, label, label)
+                    for alias in aliases or []:
+                        matcher.add(category, alias, label)
+            else:
+                for term in terms:
+                    matcher.add(category, term)
+        return matcher
+
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.reader(f, delimiter="\t"):
+            if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+                continue
+            if len(row) < 2:
+                continue
+            category, label = row[0].strip(), row[1].strip()
+            matcher.add(category, label, label)
+            if len(row) > 2:
+                for alias in row[2].split(","):
+                    matcher.add(category, alias.strip(), label)
+    return matcher
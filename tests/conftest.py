@@ -0,0 +1,9 @@
+"""
+Test Configuration
+Makes the flat src/utils modules importable by their bare names
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "utils"))
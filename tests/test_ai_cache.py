@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+import pytest
+
+from ai_cache import ResponseCache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_generation():
+    cache = ResponseCache()
+    calls = 0
+
+    async def generate():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "generated"
+
+    results = await asyncio.gather(*(cache.get_or_create("key", generate) for _ in range(5)))
+
+    assert results == ["generated"] * 5
+    assert calls == 1
+    assert cache.coalesced == 4
+    assert cache.get("key") == "generated"
+
+
+@pytest.mark.asyncio
+async def test_failed_generation_reaches_every_waiter_and_is_not_cached():
+    cache = ResponseCache()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("provider down")
+
+    results = await asyncio.gather(
+        *(cache.get_or_create("key", fail) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.get("key") is None
+    assert cache.stats()["inFlight"] == 0
+
+
+def test_entries_expire_after_ttl():
+    cache = ResponseCache(ttl=0.05)
+    cache.put("key", "value")
+    assert cache.get("key") == "value"
+
+    time.sleep(0.06)
+
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    cache.get("a")
+    cache.put("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1" and cache.get("c") == "3"
+    assert cache.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_values_rejected_by_cacheable_are_shared_but_not_stored():
+    cache = ResponseCache()
+
+    async def generate():
+        return "partial"
+
+    value = await cache.get_or_create("key", generate, cacheable=lambda text: False)
+
+    assert value == "partial"
+    assert cache.get("key") is None
+
+
+def test_entries_persist_in_sqlite(tmp_path):
+    path = str(tmp_path / "responses.db")
+    ResponseCache(db_path=path).put("key", "value")
+
+    assert ResponseCache(db_path=path).get("key") == "value"
+
+
+def test_key_ignores_whitespace_but_not_request_parameters():
+    key = ResponseCache.make_key("openai", "gpt-4", 300, "Write  a\ncover letter")
+
+    assert key == ResponseCache.make_key("openai", "gpt-4", 300, "Write a cover letter")
+    assert key != ResponseCache.make_key("openai", "gpt-4", 600, "Write a cover letter")
+    assert key != ResponseCache.make_key("gemini", "gpt-4", 300, "Write a cover letter")
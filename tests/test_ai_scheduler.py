@@ -0,0 +1,140 @@
+import asyncio
+import time
+
+import pytest
+
+from ai_scheduler import BACKGROUND, INTERACTIVE, AIProviderError, ProviderScheduler, provider_error
+
+
+class StatusError(Exception):
+    """Stands in for an SDK error carrying an HTTP status, like openai.APIStatusError."""
+
+    def __init__(self, status_code: int, retry_after=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def flaky(failures: int, status_code: int = 429):
+    """A provider call that fails ``failures`` times with ``status_code``, then answers."""
+    attempts = []
+
+    async def call():
+        attempts.append(time.monotonic())
+        if len(attempts) <= failures:
+            raise StatusError(status_code)
+        return "ok"
+
+    return call, attempts
+
+
+@pytest.mark.asyncio
+async def test_throttled_call_is_retried_until_it_succeeds():
+    scheduler = ProviderScheduler(base_delay=0.001, max_delay=0.01)
+    call, attempts = flaky(failures=2)
+
+    assert await scheduler.run(call) == "ok"
+    assert len(attempts) == 3
+    assert scheduler.stats()["retries"] == 2
+    assert scheduler.stats()["throttled"] == 2
+    assert scheduler.stats()["inFlight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_provider_error_is_raised_once_retries_run_out():
+    scheduler = ProviderScheduler(max_retries=2, base_delay=0.001, max_delay=0.01)
+    call, attempts = flaky(failures=10)
+
+    with pytest.raises(AIProviderError) as error:
+        await scheduler.run(call)
+
+    assert error.value.status_code == 429
+    assert isinstance(error.value.__cause__, StatusError)
+    assert len(attempts) == 3
+    assert scheduler.failures == 1
+    assert scheduler.concurrency.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried():
+    scheduler = ProviderScheduler(base_delay=0.001)
+    call, attempts = flaky(failures=1, status_code=400)
+
+    with pytest.raises(AIProviderError) as error:
+        await scheduler.run(call)
+
+    assert error.value.status_code == 400
+    assert not error.value.retryable
+    assert len(attempts) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honoured():
+    scheduler = ProviderScheduler(base_delay=0.001, max_delay=0.001)
+    attempts = []
+
+    async def call():
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise StatusError(429, retry_after=0.1)
+        return "ok"
+
+    assert await scheduler.run(call) == "ok"
+    assert attempts[1] - attempts[0] >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_call_past_its_deadline_is_abandoned():
+    scheduler = ProviderScheduler()
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    started = time.monotonic()
+    with pytest.raises(AIProviderError, match="deadline"):
+        await scheduler.run(hang, deadline=0.1)
+    assert time.monotonic() - started < 1
+    assert scheduler.concurrency.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_jump_queued_background_work():
+    scheduler = ProviderScheduler(max_concurrency=1)
+    busy = asyncio.Event()
+    done = asyncio.Event()
+    order = []
+
+    async def hold_slot():
+        busy.set()
+        await done.wait()
+        return "first"
+
+    def record(name):
+        async def call():
+            order.append(name)
+            return name
+        return call
+
+    first = asyncio.create_task(scheduler.run(hold_slot, priority=BACKGROUND))
+    await busy.wait()
+    queued = [
+        asyncio.create_task(scheduler.run(record("background 1"), priority=BACKGROUND)),
+        asyncio.create_task(scheduler.run(record("background 2"), priority=BACKGROUND)),
+    ]
+    await asyncio.sleep(0)
+    queued.append(asyncio.create_task(scheduler.run(record("interactive"), priority=INTERACTIVE)))
+    await asyncio.sleep(0)
+
+    done.set()
+    await asyncio.gather(first, *queued)
+
+    assert order == ["interactive", "background 1", "background 2"]
+
+
+def test_provider_error_classifies_sdk_exceptions():
+    class APITimeoutError(Exception):
+        pass
+
+    assert provider_error(StatusError(503)).retryable
+    assert provider_error(APITimeoutError("read timed out")).retryable
+    assert not provider_error(ValueError("bad prompt")).retryable
@@ -0,0 +1,228 @@
+import asyncio
+import time
+
+import pytest
+
+import ai_service
+from ai_cache import ResponseCache
+from ai_service import AIService, MatchBatcher
+
+
+class CountingService(AIService):
+    """Offline provider that records every prompt sent upstream."""
+
+    def __init__(self):
+        self.prompts = []
+        super().__init__(cache=ResponseCache())
+
+    def _detect_provider(self) -> str:
+        return "mock"
+
+    def _generate_mock(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        return super()._generate_mock(prompt)
+
+
+@pytest.fixture
+def service():
+    return CountingService()
+
+
+# Response cache bypass
+
+@pytest.mark.asyncio
+async def test_generate_text_caches_identical_prompts(service):
+    first = await service.generate_text("Write a social post about Python")
+    second = await service.generate_text("Write a social post  about\nPython")
+
+    assert first == second
+    assert len(service.prompts) == 1
+
+
+@pytest.mark.asyncio
+async def test_use_cache_false_always_reaches_the_provider(service):
+    await service.generate_text("Write a social post", use_cache=False)
+    await service.generate_text("Write a social post", use_cache=False)
+
+    assert len(service.prompts) == 2
+    assert service.cache.stats()["entries"] == 0
+
+
+# Connection pool
+
+def test_pooled_client_is_closed_with_the_loop_that_used_it(monkeypatch):
+    if not (ai_service.OPENAI_AVAILABLE and ai_service.HTTPX_AVAILABLE):
+        pytest.skip("openai and httpx are not installed")
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    service = AIService(cache=ResponseCache())
+
+    async def bind():
+        service._bind_loop()
+        return service._http_client
+
+    first = asyncio.run(bind())
+    second = asyncio.run(bind())
+
+    assert first is not second
+    assert first.is_closed and second.is_closed
+
+
+# Match batching
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_as_soon_as_the_batch_is_full(service):
+    batcher = MatchBatcher(service=service, max_batch_size=3, max_wait=60, use_cache=False)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.match(["Python"], [f"Skill {number}"]) for number in range(3))),
+        timeout=5
+    )
+
+    assert batcher.batches == 1
+    assert len(service.prompts) == 1
+    assert service.prompts[0].count("\nPair ") == 3
+    assert [result["score"] for result in results] == [75, 75, 75]
+
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_a_partial_batch_after_max_wait(service):
+    batcher = MatchBatcher(service=service, max_batch_size=10, max_wait=0.05, use_cache=False)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(batcher.match(["Python"], [f"Skill {number}"]) for number in range(2)))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed >= 0.05
+    assert batcher.batches == 1
+    assert len(service.prompts) == 1
+    assert len(results) == 2
+
+
+@pytest.mark.asyncio
+async def test_batcher_splits_overflow_into_the_next_batch(service):
+    batcher = MatchBatcher(service=service, max_batch_size=2, max_wait=0.01, use_cache=False)
+
+    await asyncio.gather(*(batcher.match(["Python"], [f"Skill {number}"]) for number in range(4)))
+
+    assert batcher.batches == 2
+    assert [prompt.count("\nPair ") for prompt in service.prompts] == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_batcher_scores_locally_when_the_response_is_not_json():
+    class ProseService(CountingService):
+        def _generate_mock(self, prompt: str) -> str:
+            self.prompts.append(prompt)
+            return "Strong overlap in backend skills."
+
+    prose = ProseService()
+    batcher = MatchBatcher(service=prose, max_batch_size=2, max_wait=60, use_cache=False)
+
+    results = await asyncio.gather(
+        batcher.match(["Python", "Docker"], ["Python", "Kubernetes"]),
+        batcher.match(["Python"], ["Go"])
+    )
+
+    assert batcher.fallbacks == 2
+    # The batched prompt, then one retry per pair, all on the batcher's service
+    assert len(prose.prompts) == 3
+    assert results[0]["score"] == 50
+    assert results[1]["score"] == 0
+
+
+@pytest.mark.asyncio
+async def test_batcher_raises_unexpected_errors_to_every_caller():
+    class BrokenService(CountingService):
+        async def generate_text(self, prompt, max_tokens=500, use_cache=True, priority=ai_service.INTERACTIVE):
+            raise KeyError("score")
+
+    batcher = MatchBatcher(service=BrokenService(), max_batch_size=2, max_wait=60, use_cache=False)
+
+    results = await asyncio.gather(
+        batcher.match(["Python"], ["Go"]),
+        batcher.match(["Python"], ["Rust"]),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, KeyError) for result in results)
+    assert batcher.fallbacks == 0
+
+
+# Streaming
+
+class StreamingService(AIService):
+    """Provider whose stream yields the given chunks, then raises ``fail_with`` if set."""
+
+    def __init__(self, chunks, fail_with=None):
+        self.chunks = chunks
+        self.fail_with = fail_with
+        self.opened = 0
+        self.closed = 0
+        super().__init__(cache=ResponseCache())
+
+    def _detect_provider(self) -> str:
+        return "openai"
+
+    def _setup_client(self):
+        self.model = "stub"
+        self.client = object()
+
+    async def _stream_openai(self, prompt: str, max_tokens: int):
+        self.opened += 1
+        try:
+            for chunk in self.chunks:
+                await asyncio.sleep(0)
+                yield chunk
+            if self.fail_with is not None:
+                raise self.fail_with
+        finally:
+            self.closed += 1
+
+
+def cache_key(service: AIService, prompt: str, max_tokens: int = 500) -> str:
+    return ResponseCache.make_key(service.provider, service.model, max_tokens, prompt)
+
+
+@pytest.mark.asyncio
+async def test_finished_stream_is_cached_for_generate_text():
+    service = StreamingService(["Dear ", "Hiring ", "Manager"])
+
+    chunks = [chunk async for chunk in service.stream_text("Write a cover letter")]
+
+    assert chunks == ["Dear ", "Hiring ", "Manager"]
+    assert service.cache.get(cache_key(service, "Write a cover letter")) == "Dear Hiring Manager"
+    assert await service.generate_text("Write a cover letter") == "Dear Hiring Manager"
+    assert service.opened == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_early_is_not_cached_and_frees_its_slot():
+    service = StreamingService(["Dear ", "Hiring ", "Manager"])
+
+    stream = service.stream_text("Write a cover letter")
+    assert await stream.__anext__() == "Dear "
+    await stream.aclose()
+
+    assert service.cache.get(cache_key(service, "Write a cover letter")) is None
+    assert service.closed == 1
+    assert service.scheduler.concurrency.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_failing_midway_raises_and_is_not_cached():
+    class Overloaded(Exception):
+        status_code = 503
+
+    service = StreamingService(["Dear ", "Hiring "], fail_with=Overloaded("overloaded"))
+
+    received = []
+    with pytest.raises(ai_service.AIProviderError) as error:
+        async for chunk in service.stream_text("Write a cover letter"):
+            received.append(chunk)
+
+    assert received == ["Dear ", "Hiring "]
+    assert error.value.status_code == 503
+    # Chunks were already delivered, so the stream is not retried
+    assert service.opened == 1
+    assert service.cache.get(cache_key(service, "Write a cover letter")) is None
+    assert service.scheduler.concurrency.in_flight == 0
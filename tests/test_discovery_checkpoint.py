@@ -0,0 +1,48 @@
+from discovery_checkpoint import DiscoveryCheckpoint
+
+POSTINGS = [
+    {"guid": "job-1", "title": "Backend Engineer", "pubDate": "Mon, 01 Jan 2024 00:00:00 GMT"},
+    {"guid": "job-2", "title": "Data Engineer", "pubDate": "Tue, 02 Jan 2024 00:00:00 GMT"},
+]
+
+
+def run(checkpoint: DiscoveryCheckpoint, postings, complete: bool = True) -> list:
+    delta = checkpoint.begin("Feed")
+    new = [job["guid"] for job in postings if delta.is_new(job)]
+    delta.commit(complete=complete)
+    checkpoint.save()
+    return new
+
+
+def test_only_new_or_edited_postings_are_emitted(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    assert run(DiscoveryCheckpoint(path), POSTINGS) == ["job-1", "job-2"]
+
+    edited = [POSTINGS[0], dict(POSTINGS[1], title="Senior Data Engineer")]
+    added = {"guid": "job-3", "title": "SRE", "pubDate": "Wed, 03 Jan 2024 00:00:00 GMT"}
+
+    assert run(DiscoveryCheckpoint(path), POSTINGS) == []
+    assert run(DiscoveryCheckpoint(path), edited + [added]) == ["job-2", "job-3"]
+
+
+def test_pruned_posting_older_than_the_watermark_stays_seen(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    run(DiscoveryCheckpoint(path), POSTINGS)
+    # A complete run that no longer lists job-1 prunes it from the seen-set
+    run(DiscoveryCheckpoint(path), POSTINGS[1:])
+
+    assert DiscoveryCheckpoint(path).stats() == {"Feed": 1}
+    assert run(DiscoveryCheckpoint(path), POSTINGS) == []
+
+
+def test_partial_run_keeps_what_was_already_known(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    run(DiscoveryCheckpoint(path), POSTINGS)
+
+    run(DiscoveryCheckpoint(path), POSTINGS[:1], complete=False)
+
+    assert DiscoveryCheckpoint(path).stats() == {"Feed": 2}
+
+    checkpoint = DiscoveryCheckpoint(path)
+    checkpoint.reset("Feed")
+    assert run(checkpoint, POSTINGS) == ["job-1", "job-2"]
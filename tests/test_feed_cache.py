@@ -0,0 +1,115 @@
+import asyncio
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import job_scraper
+from feed_cache import FeedCache
+from job_scraper import JobScraper
+
+FEED = b"""<?xml version="1.0"?><rss version="2.0"><channel>
+<item><title>Backend Engineer</title><link>https://example.com/jobs/1</link><guid>job-1</guid></item>
+<item><title>Data Engineer</title><link>https://example.com/jobs/2</link><guid>job-2</guid></item>
+</channel></rss>"""
+ETAG = '"v1"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.requests.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(FEED)))
+        self.end_headers()
+        self.wfile.write(FEED)
+
+
+@pytest.fixture
+def feed_url():
+    if not job_scraper.HTTPX_AVAILABLE:
+        pytest.skip("httpx is not installed")
+    _Handler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/feed.xml"
+    server.shutdown()
+    server.server_close()
+
+
+def scrape(url: str, cache: FeedCache, min_refresh_interval=None) -> list:
+    return asyncio.run(JobScraper().scrape_rss_feed(url, cache=cache, min_refresh_interval=min_refresh_interval))
+
+
+def test_entry_holds_validators_and_items_load_separately(tmp_path):
+    cache = FeedCache(str(tmp_path))
+    cache.put("https://example.com/feed", [{"title": "Backend Engineer"}], etag=ETAG)
+
+    entry = cache.get("https://example.com/feed")
+
+    assert "items" not in entry
+    assert FeedCache.conditional_headers(entry) == {"If-None-Match": ETAG}
+    assert cache.items("https://example.com/feed") == [{"title": "Backend Engineer"}]
+
+    cache.discard("https://example.com/feed")
+    assert cache.get("https://example.com/feed") is None
+    assert cache.items("https://example.com/feed") is None
+
+
+def test_not_modified_rewrites_only_the_entry(tmp_path, feed_url):
+    cache = FeedCache(str(tmp_path))
+    first = scrape(feed_url, cache)
+    items_path = cache._path(feed_url, ".items")
+    items_written = os.stat(items_path).st_mtime_ns
+    fetched_at = cache.get(feed_url)["fetchedAt"]
+
+    second = scrape(feed_url, cache)
+
+    assert second == first
+    assert _Handler.requests == [None, ETAG]
+    assert os.stat(items_path).st_mtime_ns == items_written
+    assert cache.get(feed_url)["fetchedAt"] > fetched_at
+
+
+def test_entry_without_its_items_is_refetched_in_full(tmp_path, feed_url):
+    cache = FeedCache(str(tmp_path))
+    first = scrape(feed_url, cache)
+    os.remove(cache._path(feed_url, ".items"))
+
+    assert scrape(feed_url, cache) == first
+    assert _Handler.requests == [None, None]
+    assert cache.items(feed_url) == [dict(job) for job in first]
+
+
+def test_fresh_entry_skips_the_request_and_304_skips_the_parse(tmp_path, feed_url):
+    results = job_scraper.FEED_CACHE_RESULTS
+    before = {result: results.value(result) for result in ("fresh", "not_modified", "fetched")}
+    cache = FeedCache(str(tmp_path), min_refresh_interval=3600)
+
+    first = scrape(feed_url, cache)
+    fresh = scrape(feed_url, cache)
+    revalidated = scrape(feed_url, cache, min_refresh_interval=0)
+
+    assert [job["title"] for job in first] == ["Backend Engineer", "Data Engineer"]
+    assert fresh == revalidated == first
+    # The fresh copy never reached the server; the revalidation was answered with a 304
+    assert _Handler.requests == [None, ETAG]
+    assert {result: results.value(result) - count for result, count in before.items()} == {
+        "fresh": 1, "not_modified": 1, "fetched": 1
+    }
@@ -0,0 +1,75 @@
+from job_dedup import JobDeduplicator, title_key, titles_match
+
+BOILERPLATE = (
+    "Acme builds developer tools used by thousands of engineering teams around the world. We are a "
+    "remote-first company with colleagues in more than twenty countries, and we care deeply about "
+    "craftsmanship, written communication and sustainable pace. We offer a competitive salary, "
+    "meaningful equity, health, dental and vision insurance, a home office budget, unlimited paid time "
+    "off with a recommended minimum, and an annual learning stipend. Acme is an equal opportunity "
+    "employer and we value diversity and inclusion at every level of the company. "
+)
+
+
+def acme_job(title: str, number: int, **fields) -> dict:
+    job = {
+        "title": title,
+        "company": "Acme",
+        "location": "Remote",
+        "description": BOILERPLATE + f"You will own our {title.lower()} work.",
+        "applyUrl": f"https://acme.example/jobs/{number}",
+        "source": "Acme Careers"
+    }
+    job.update(fields)
+    return job
+
+
+def test_distinct_roles_from_one_company_are_kept():
+    jobs = [
+        acme_job("Senior Backend Engineer", 1),
+        acme_job("Frontend Engineer", 2),
+        acme_job("Product Designer", 3),
+        acme_job("Staff Backend Engineer", 4),
+    ]
+
+    deduplicator = JobDeduplicator()
+    unique = deduplicator.dedupe(jobs)
+
+    assert [job["title"] for job in unique] == [job["title"] for job in jobs]
+    assert deduplicator.merged == 0
+
+
+def test_cross_source_copy_is_merged_into_canonical_record():
+    original = acme_job("Senior Backend Engineer", 1)
+    copy = acme_job(
+        "Acme: Sr. Backend Engineer (Remote)", 1,
+        company="Unknown",
+        description=original["description"],
+        applyUrl="https://board.example/acme/123",
+        source="Job Board"
+    )
+
+    deduplicator = JobDeduplicator()
+    unique = deduplicator.dedupe([original, copy])
+
+    assert len(unique) == 1
+    assert unique[0]["applyUrls"] == ["https://acme.example/jobs/1", "https://board.example/acme/123"]
+    assert unique[0]["sources"] == ["Acme Careers", "Job Board"]
+
+
+def test_same_apply_url_always_merges():
+    deduplicator = JobDeduplicator()
+    deduplicator.add(acme_job("Backend Engineer", 1))
+
+    assert deduplicator.find(acme_job("Data Engineer", 1)) is not None
+    assert deduplicator.find(acme_job("Data Engineer", 2)) is None
+
+
+def test_title_key_normalizes_abbreviations_and_work_arrangement():
+    assert titles_match(
+        title_key({"title": "Sr. Backend Engineer (Remote)"}),
+        title_key({"title": "Senior Backend Engineer"})
+    )
+    assert not titles_match(
+        title_key({"title": "Senior Backend Engineer"}),
+        title_key({"title": "Staff Backend Engineer"})
+    )
@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+import job_matcher
+from job_matcher import JobMatchIndex
+from resume_parser import ResumeParser
+
+SKILLS = ["Python", "Go", "Docker", "Kubernetes", "PostgreSQL", "React", "AWS", "Terraform", "Rust", "Java"]
+
+
+def build_index(jobs) -> JobMatchIndex:
+    index = JobMatchIndex()
+    index.add_jobs(jobs)
+    return index
+
+
+def random_catalog(seed: int):
+    rng = random.Random(seed)
+    jobs = [(f"job-{number}", rng.sample(SKILLS, rng.randint(0, 5))) for number in range(200)]
+    profiles = [rng.sample(SKILLS, rng.randint(0, 6)) + ["COBOL"] for _ in range(20)]
+    return jobs, profiles
+
+
+def test_numpy_and_bitset_backends_rank_jobs_the_same(monkeypatch):
+    if not job_matcher.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    jobs, profiles = random_catalog(seed=7)
+
+    vectorized = build_index(jobs).top_matches_batch(profiles, k=15)
+    numpy_scores = build_index(jobs).scores(profiles)
+    monkeypatch.setattr(job_matcher, "NUMPY_AVAILABLE", False)
+    bitset = build_index(jobs).top_matches_batch(profiles, k=15)
+    bitset_scores = build_index(jobs).scores(profiles)
+
+    assert vectorized == bitset
+    for numpy_row, bitset_row in zip(numpy_scores.tolist(), bitset_scores):
+        assert numpy_row == pytest.approx(bitset_row)
+
+
+@pytest.mark.parametrize("numpy", [True, False], ids=["numpy", "bitset"])
+def test_top_matches_scores_requirement_coverage(monkeypatch, numpy):
+    if numpy and not job_matcher.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    monkeypatch.setattr(job_matcher, "NUMPY_AVAILABLE", numpy)
+    index = JobMatchIndex(matcher=ResumeParser.build_matcher())
+    index.add_jobs([
+        ("backend", ["5+ years of Python", "Docker", "PostgreSQL"]),
+        ("frontend", ["React", "TypeScript"]),
+        ("empty", []),
+    ])
+
+    matches = index.top_matches(["python", "Docker"], k=2)
+
+    assert matches == [
+        {"jobId": "backend", "score": 66, "matchingSkills": ["Python", "Docker"], "missingSkills": ["Postgresql"]},
+        {"jobId": "frontend", "score": 0, "matchingSkills": [], "missingSkills": ["React", "Typescript"]},
+    ]
+    assert index.top_matches(["python"], min_score=1)[0]["jobId"] == "backend"
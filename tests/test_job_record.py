@@ -0,0 +1,67 @@
+import json
+import pickle
+
+import pytest
+
+from job_record import Job, from_timestamp, to_timestamp
+
+CLEANED = {
+    "title": "Backend Engineer",
+    "company": "Acme",
+    "location": "Remote (US)",
+    "remote": True,
+    "description": "Python & Go",
+    "applyUrl": "https://acme.example/1",
+    "source": "Acme",
+    "discoveredAt": "2024-01-02T03:04:05.678901",
+}
+
+
+def test_record_behaves_like_the_cleaned_dict():
+    job = Job.from_dict(CLEANED)
+
+    assert dict(job) == job.to_dict() == CLEANED
+    assert job["discoveredAt"] == CLEANED["discoveredAt"]
+    assert job.get("applyUrls") is None and "applyUrls" not in job
+
+    job["applyUrls"] = [job["applyUrl"]]
+    job["company"] = "Acme Corp"
+    job.update(discoveredAt="2024-02-01T00:00:00")
+
+    assert job["applyUrls"] == ["https://acme.example/1"]
+    assert len(job) == len(CLEANED) + 1
+    assert list(job)[-1] == "applyUrls"
+    assert job.copy() == job
+    assert job.copy()["applyUrls"] is job["applyUrls"]
+    assert job["discoveredAt"] == "2024-02-01T00:00:00"
+
+    del job["applyUrls"]
+    assert dict(job) == dict(CLEANED, company="Acme Corp", discoveredAt="2024-02-01T00:00:00")
+    with pytest.raises(TypeError):
+        del job["title"]
+    with pytest.raises(KeyError):
+        job["missing"]
+
+
+def test_record_survives_pickling():
+    job = Job.from_dict(dict(CLEANED, applyUrls=["https://acme.example/1"]))
+
+    restored = pickle.loads(pickle.dumps(job))
+
+    assert restored == job
+    assert restored.to_dict() == job.to_dict()
+    assert restored.company is job.company
+
+
+def test_records_serialize_through_to_dict():
+    job = Job.from_dict(CLEANED)
+
+    with pytest.raises(TypeError):
+        json.dumps(job)
+    assert json.loads(json.dumps(job.to_dict())) == CLEANED
+
+
+def test_timestamps_round_trip_isoformat():
+    for value in ("2024-01-02T03:04:05.678901", "2024-01-02T03:04:05", "1969-12-31T23:59:59"):
+        assert from_timestamp(to_timestamp(value)) == value
+    assert to_timestamp("") == 0 and from_timestamp(0) == ""
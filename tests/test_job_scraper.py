@@ -0,0 +1,223 @@
+import asyncio
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import job_scraper
+from discovery_checkpoint import DiscoveryCheckpoint
+from job_scraper import MAX_DESCRIPTION_LENGTH, JobScraper, RssItemParser, discover_jobs, html_to_text
+
+FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom"><channel>
+<title>Jobs</title><link>https://example.com/</link>
+<item><title>Backend Engineer &amp; SRE — café</title><link>https://example.com/jobs/1</link>
+<atom:link href="https://example.com/self"/><guid isPermaLink="false">job-1</guid>
+<description><![CDATA[<p>Python &amp; <b>Go</b></p>]]></description>
+<pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate></item>
+<item><title></title><description>Escaped &lt;b&gt;markup&lt;/b&gt;</description><guid>job-2</guid></item>
+<item><title>Data Engineer</title><link>https://example.com/jobs/3</link></item>
+</channel></rss>""".encode("utf-8")
+
+
+def bs4_items(document: bytes, source: str) -> list:
+    """What the BeautifulSoup implementation returned for each item."""
+    bs4 = pytest.importorskip("bs4")
+    soup = bs4.BeautifulSoup(document, "xml")
+    items = []
+    for item in soup.find_all("item"):
+        job = {field: item.find(field).text if item.find(field) else "" for field in RssItemParser.FIELDS}
+        job["source"] = source
+        items.append(job)
+    return items
+
+
+@pytest.mark.parametrize("lxml", [True, False], ids=["lxml", "stdlib"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, len(FEED)])
+def test_rss_item_parser_matches_bs4_at_any_chunk_size(monkeypatch, lxml, chunk_size):
+    if lxml and not job_scraper.LXML_AVAILABLE:
+        pytest.skip("lxml is not installed")
+    monkeypatch.setattr(job_scraper, "LXML_AVAILABLE", lxml)
+
+    parser = RssItemParser("feed")
+    items = []
+    for start in range(0, len(FEED), chunk_size):
+        items.extend(parser.feed(FEED[start:start + chunk_size]))
+    items.extend(parser.close())
+
+    assert items == bs4_items(FEED, "feed")
+    assert [item["guid"] for item in items] == ["job-1", "job-2", ""]
+
+
+def bs4_text(html: str) -> str:
+    """What the BeautifulSoup implementation returned for a description."""
+    bs4 = pytest.importorskip("bs4")
+    return bs4.BeautifulSoup(html, "html.parser").get_text(separator=" ").strip()
+
+
+@pytest.mark.parametrize("html", [
+    "<p>Python &amp; <b>Go</b></p><br>Remote",
+    "Senior&nbsp;Engineer &#8212; &#150; &bogus; AT&T &amp",
+    "<ul>\n  <li>Docker</li>\n  <li>Kubernetes</li>\n</ul>",
+    "<pre>  keep\n  spacing  </pre><script>track('<p>')</script><style>p {}</style>",
+    "<template>hidden</template><ruby>Go<rt>lang</rt></ruby><!-- note -->tail",
+    "'\" word<!--\u00e9'",
+    "<word\" never closes",
+    "1 < 2 and 3 <4 <",
+    "<a href='x>y' disabled>link</a><br/></br>after<img src=/logo.png/>",
+    "<![CDATA[ raw ]]><!DOCTYPE html><?pi?>text</>end",
+])
+def test_html_to_text_matches_bs4(html):
+    assert html_to_text(html) == bs4_text(html)
+
+
+def test_html_to_text_matches_bs4_on_random_markup():
+    bs4_builder = pytest.importorskip("bs4.builder")
+    pieces = [
+        "word", " ", "\n", "\xa0", "\u00e9", "<", ">", "/", "!", "-", "=", "\"", "'", "&", ";", "#", "?", "[",
+        "<p>", "</p>", "<b class='x'>", "</b>", "<br>", "</br>", "<img src=/a/b/>", "<li/>", "<pre>", "</pre>",
+        "<script>", "</script>", "<template>", "</template>", "<rt>", "<textarea>", "<word",
+        "<!-- c -->", "<!---->", "<!-->", "<!--", "-->", "<![CDATA[", "]]>", "<!DOCTYPE", "<?",
+        "&amp;", "&nbsp;", "&bogus;", "&#65;", "&#x41;", "&#150;", "&#0;", "&#", "&amp",
+    ]
+    rng = random.Random(13)
+    for _ in range(3000):
+        html = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 20)))
+        try:
+            expected = bs4_text(html)
+        except bs4_builder.ParserRejectedMarkup:
+            continue
+        assert html_to_text(html) == expected, html
+        assert html_to_text(html, limit=5) == expected[:5], html
+
+
+def test_html_to_text_stops_at_the_limit_with_the_same_prefix():
+    html = "<p>  Build   services</p>\n<ul>" + "<li>Python &amp; Go</li>" * 500 + "</ul>"
+
+    for limit in (1, 6, 7, 40, 2000):
+        assert html_to_text(html, limit=limit) == bs4_text(html)[:limit]
+
+
+def test_clean_jobs_normalizes_a_batch_with_one_discovery_time():
+    raw = [
+        {
+            "title": "  Backend \n Engineer ", "company": "Acme", "location": "Remote (US)",
+            "description": "<p>Python &amp; Go</p>", "link": "https://acme.example/1", "source": "Acme"
+        },
+        {"title": "Designer", "description": "<p>" + "x" * 5000 + "</p>", "applyUrl": "https://acme.example/2"},
+    ]
+
+    jobs = JobScraper().clean_jobs(raw)
+
+    assert [job["title"] for job in jobs] == ["Backend Engineer", "Designer"]
+    assert jobs[0]["description"] == "Python & Go"
+    assert len(jobs[1]["description"]) == MAX_DESCRIPTION_LENGTH
+    assert [job["remote"] for job in jobs] == [True, False]
+    assert [job["applyUrl"] for job in jobs] == ["https://acme.example/1", "https://acme.example/2"]
+    assert jobs[1]["company"] == "Unknown"
+    assert jobs[0]["discoveredAt"] == jobs[1]["discoveredAt"]
+
+    records = JobScraper().clean_jobs(raw, as_records=True)
+    assert [record["description"] for record in records] == [job["description"] for job in jobs]
+
+
+def test_extract_requirements_maps_skills_across_whitespace_and_short_items():
+    scraper = JobScraper()
+    description = "Requirements: experience with Machine\tLearning and Node.js; aws. Benefits: lunch"
+
+    skills = scraper.extract_requirements(description, skills=True)
+
+    assert "Machine Learning" in skills
+    assert "AWS" in skills
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == "/stalls.xml":
+            # The first item arrives, then the feed stalls
+            cut = FEED.index(b"</item>") + len(b"</item>")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("Content-Length", str(len(FEED)))
+            self.end_headers()
+            self.wfile.write(FEED[:cut])
+            self.wfile.flush()
+            time.sleep(2)
+            self.wfile.write(FEED[cut:])
+            return
+        if self.path == "/slow.xml":
+            time.sleep(2)
+        if self.path in ("/feed.xml", "/slow.xml"):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("Content-Length", str(len(FEED)))
+            self.end_headers()
+            self.wfile.write(FEED)
+            return
+        self.send_response(500)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+@pytest.fixture
+def feed_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_discover_jobs_isolates_failing_and_slow_sources(monkeypatch, feed_server):
+    if not job_scraper.HTTPX_AVAILABLE:
+        pytest.skip("httpx is not installed")
+    monkeypatch.delenv("FEED_CACHE_DIR", raising=False)
+    sources = [
+        {"name": "Feed", "type": "rss", "url": f"{feed_server}/feed.xml"},
+        {"name": "Broken", "type": "rss", "url": f"{feed_server}/error"},
+        {"name": "Slow", "type": "rss", "url": f"{feed_server}/slow.xml", "timeout": 0.3},
+    ]
+
+    started = time.perf_counter()
+    jobs = asyncio.run(discover_jobs(sources, concurrent=True))
+    elapsed = time.perf_counter() - started
+
+    assert [job["source"] for job in jobs] == ["Feed"] * 3
+    assert jobs[0]["title"] == "Backend Engineer & SRE — café"
+    assert "<" not in jobs[0]["description"]
+    assert elapsed < 2
+
+
+def test_discover_jobs_keeps_jobs_parsed_before_a_timeout(monkeypatch, feed_server):
+    if not job_scraper.HTTPX_AVAILABLE:
+        pytest.skip("httpx is not installed")
+    monkeypatch.delenv("FEED_CACHE_DIR", raising=False)
+    sources = [{"name": "Stalls", "type": "rss", "url": f"{feed_server}/stalls.xml", "timeout": 0.5}]
+
+    jobs = asyncio.run(discover_jobs(sources))
+
+    assert [job["title"] for job in jobs] == ["Backend Engineer & SRE — café"]
+
+
+def test_second_delta_run_returns_no_new_jobs(monkeypatch, tmp_path, feed_server):
+    if not job_scraper.HTTPX_AVAILABLE:
+        pytest.skip("httpx is not installed")
+    monkeypatch.delenv("FEED_CACHE_DIR", raising=False)
+    path = str(tmp_path / "checkpoint.json")
+    sources = [{"name": "Feed", "type": "rss", "url": f"{feed_server}/feed.xml"}]
+
+    first = asyncio.run(discover_jobs(sources, checkpoint=DiscoveryCheckpoint(path)))
+    second = asyncio.run(discover_jobs(sources, checkpoint=DiscoveryCheckpoint(path)))
+
+    assert len(first) == 3
+    assert second == []
+    assert DiscoveryCheckpoint(path).stats() == {"Feed": 3}
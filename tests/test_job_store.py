@@ -0,0 +1,72 @@
+import pytest
+
+from job_store import JobStore
+
+
+def make_job(number: int, **fields) -> dict:
+    job = {
+        "title": f"Engineer {number}",
+        "company": "Acme",
+        "location": "Remote",
+        "remote": number % 2 == 0,
+        "description": "Python services",
+        "applyUrl": f"https://acme.example/jobs/{number}",
+        "source": "Acme",
+        "discoveredAt": f"2024-01-{number + 1:02d}T00:00:00",
+        "requirements": ["Python"],
+    }
+    job.update(fields)
+    return job
+
+
+@pytest.fixture
+def store():
+    with JobStore() as store:
+        yield store
+
+
+def test_upsert_is_idempotent(store):
+    jobs = [make_job(number) for number in range(3)]
+
+    assert store.upsert_jobs(jobs) == 3
+    assert store.upsert_jobs(jobs) == 0
+    assert len(store) == 3
+
+    edited = make_job(1, description="Go services", discoveredAt="2024-02-01T00:00:00")
+    assert store.upsert_jobs([edited]) == 1
+    stored = store.get(edited["applyUrl"])
+    assert stored["description"] == "Go services"
+    # The first discovery time is kept
+    assert stored["discoveredAt"] == "2024-01-02T00:00:00"
+    assert stored["requirements"] == ["Python"]
+
+
+@pytest.mark.parametrize("fts", [True, False], ids=["fts5", "like"])
+def test_search_matches_words_and_prefixes(store, fts):
+    if fts and not store.fts_available:
+        pytest.skip("SQLite was built without FTS5")
+    store.fts_available = fts
+    store.upsert_jobs([
+        make_job(0, title="Backend Engineer", description="Python and PostgreSQL"),
+        make_job(1, title="Frontend Engineer", description="React, TypeScript"),
+        make_job(2, title="Data Engineer", company="Pythonic Labs", description="Spark"),
+    ])
+
+    assert [job["title"] for job in store.search("python postgresql")] == ["Backend Engineer"]
+    assert {job["title"] for job in store.search("pyth*")} == {"Backend Engineer", "Data Engineer"}
+    assert [job["title"] for job in store.search("react,", remote=False)] == ["Frontend Engineer"]
+    assert store.search("engineer", source="Elsewhere") == []
+    assert store.count("engineer") == 3
+
+
+def test_pages_cover_every_job_once_newest_first(store):
+    store.upsert_jobs(make_job(number) for number in range(25))
+
+    pages = [store.search(limit=10, offset=offset) for offset in (0, 10, 20)]
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    urls = [job["applyUrl"] for page in pages for job in page]
+    assert urls == [make_job(number)["applyUrl"] for number in reversed(range(25))]
+    assert [job["applyUrl"] for job in store.iter_jobs(batch_size=7)] == urls
+    assert store.count(remote=True) == len(store.search(remote=True, limit=100)) == 13
+    assert store.count(since="2024-01-20T00:00:00") == 6
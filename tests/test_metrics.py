@@ -0,0 +1,69 @@
+import pytest
+
+import metrics
+
+
+def exposition(name: str) -> list:
+    """The rendered lines that belong to metric ``name``."""
+    return [
+        line for line in metrics.render_prometheus().splitlines()
+        if line.split(" ")[0].split("{")[0] in (name, f"{name}_bucket", f"{name}_sum", f"{name}_count")
+        or line.startswith((f"# HELP {name} ", f"# TYPE {name} "))
+    ]
+
+
+def test_counter_renders_one_sample_per_label_set():
+    requests = metrics.counter("test_requests_total", "Requests by\nresult", ("result",))
+    requests.inc("ok")
+    requests.inc("ok", amount=2)
+    requests.inc('say "hi"')
+
+    assert requests.value("ok") == 3
+    assert exposition("test_requests_total") == [
+        "# HELP test_requests_total Requests by result",
+        "# TYPE test_requests_total counter",
+        'test_requests_total{result="ok"} 3',
+        'test_requests_total{result="say \\"hi\\""} 1',
+    ]
+    assert metrics.counter("test_requests_total", "Requests by result", ("result",)) is requests
+    with pytest.raises(ValueError):
+        metrics.histogram("test_requests_total", "Same name, other type")
+    with pytest.raises(ValueError):
+        requests.inc()
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count():
+    latency = metrics.histogram("test_latency_seconds", "Latency", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value, "parse")
+
+    assert latency.count("parse") == 4
+    assert exposition("test_latency_seconds") == [
+        "# HELP test_latency_seconds Latency",
+        "# TYPE test_latency_seconds histogram",
+        'test_latency_seconds_bucket{stage="parse",le="0.1"} 2',
+        'test_latency_seconds_bucket{stage="parse",le="1.0"} 3',
+        'test_latency_seconds_bucket{stage="parse",le="+Inf"} 4',
+        'test_latency_seconds_sum{stage="parse"} 3.65',
+        'test_latency_seconds_count{stage="parse"} 4',
+    ]
+    snapshot = metrics.snapshot()["test_latency_seconds"]
+    assert snapshot["samples"][0]["buckets"] == {"0.1": 2, "1.0": 3, "+Inf": 4}
+
+
+def test_disabled_metrics_record_nothing():
+    calls = metrics.counter("test_disabled_total", "Calls")
+    timings = metrics.histogram("test_disabled_seconds", "Timings")
+    metrics.set_enabled(False)
+    try:
+        calls.inc()
+        with timings.time():
+            pass
+    finally:
+        metrics.set_enabled(True)
+
+    assert calls.value() == 0
+    assert timings.count() == 0
+    with timings.time():
+        pass
+    assert timings.count() == 1
@@ -0,0 +1,53 @@
+import json
+
+from resume_cache import ResumeCache
+
+
+def entry_size(value: dict) -> int:
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def test_memory_tier_evicts_least_recently_used_by_size():
+    value = {"skills": ["Python"]}
+    cache = ResumeCache(max_bytes=2 * entry_size(value))
+    cache.put("a", value)
+    cache.put("b", value)
+    cache.get("a")
+
+    cache.put("c", value)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == value
+    assert cache.get("c") == value
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 2 * entry_size(value)
+
+
+def test_entry_larger_than_the_budget_is_not_kept_in_memory():
+    cache = ResumeCache(max_bytes=10)
+    cache.put("big", {"rawText": "x" * 100})
+
+    assert cache.get("big") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lookups_return_independent_copies():
+    cache = ResumeCache()
+    cache.put("a", {"skills": ["Python"]})
+
+    cache.get("a")["skills"].append("Go")
+
+    assert cache.get("a") == {"skills": ["Python"]}
+
+
+def test_sqlite_tier_survives_a_restart(tmp_path):
+    db_path = str(tmp_path / "resumes.db")
+    key = ResumeCache.make_key(b"resume", "txt", 1)
+    ResumeCache(db_path=db_path).put(key, {"skills": ["Python"]})
+
+    restarted = ResumeCache(db_path=db_path)
+
+    assert restarted.get(key) == {"skills": ["Python"]}
+    assert restarted.get(key) == {"skills": ["Python"]}
+    assert restarted.stats()["diskHits"] == 1
+    assert restarted.stats()["hits"] == 2
@@ -0,0 +1,95 @@
+import multiprocessing
+import os
+import time
+
+import pytest
+
+import resume_parser
+from resume_parser import ResumeParser, parse_resume_batch
+
+RESUME = b"Jane Doe\njane@example.com\n\nSkills: Python, Docker, PostgreSQL\n"
+
+_original_parse = ResumeParser.parse
+
+
+def _faulty_parse(self, file_content, file_type, *args, **kwargs):
+    """Kills its worker on b"crash" and hangs on b"hang"; parses anything else."""
+    if file_content == b"crash":
+        os._exit(1)
+    if file_content == b"hang":
+        time.sleep(60)
+    return _original_parse(self, file_content, file_type, *args, **kwargs)
+
+
+@pytest.fixture
+def faulty_workers(monkeypatch):
+    # Workers only inherit the patched parser when they are forked
+    if multiprocessing.get_start_method(allow_none=False) != "fork":
+        pytest.skip("needs the fork start method")
+    monkeypatch.setattr(resume_parser.ResumeParser, "parse", _faulty_parse)
+
+
+def test_batch_isolates_a_crashing_worker(faulty_workers):
+    items = [(RESUME, "txt"), (b"crash", "txt"), (RESUME, "txt"), (RESUME, "txt")]
+
+    results = dict(parse_resume_batch(items, max_workers=2, chunk_size=2, use_cache=False))
+
+    assert sorted(results) == [0, 1, 2, 3]
+    assert "crashed" in results[1]["error"]
+    for index in (0, 2, 3):
+        assert "error" not in results[index]
+        assert "Python" in results[index]["skills"]
+
+
+def test_batch_abandons_an_item_past_its_timeout(faulty_workers):
+    items = [(RESUME, "txt"), (b"hang", "txt"), (RESUME, "txt")]
+
+    started = time.perf_counter()
+    results = dict(parse_resume_batch(items, max_workers=2, chunk_size=1, timeout=1.0, use_cache=False))
+
+    assert time.perf_counter() - started < 30
+    assert "timed out" in results[1]["error"]
+    assert "error" not in results[0] and "error" not in results[2]
+
+
+def test_batch_in_process_keeps_input_order():
+    items = [(RESUME, "txt"), (b"", "txt"), (RESUME, "doc")]
+
+    results = list(parse_resume_batch(items, max_workers=1, use_cache=False))
+
+    assert [index for index, _ in results] == [0, 1, 2]
+    assert "Python" in results[0][1]["skills"]
+
+
+FULL_RESUME = """Jane Doe - Senior Software Engineer
+jane@example.com | (555) 123-4567 | linkedin.com/in/janedoe | github.com/janedoe
+8+ years of experience building backend services.
+Skills: Python, Go, Machine  Learning, Docker, Kubernetes, PostgreSQL
+Education: Bachelor's degree, Computer Science
+"""
+
+
+def test_lazy_fields_equal_the_eager_extractors():
+    parser = ResumeParser()
+    parsed = parser.parse_text(FULL_RESUME)
+    eager = {
+        "skills": parser.extract_skills(" ".join(FULL_RESUME.lower().split())),
+        "jobTitles": parser.extract_job_titles(" ".join(FULL_RESUME.lower().split())),
+        "experienceYears": parser.extract_experience_years(FULL_RESUME),
+        "education": parser.extract_education(" ".join(FULL_RESUME.lower().split())),
+        "email": parser.extract_email(FULL_RESUME),
+        "phone": parser.extract_phone(FULL_RESUME),
+        "linkedin": parser.extract_linkedin(FULL_RESUME),
+        "github": parser.extract_github(FULL_RESUME),
+        "rawTextLength": len(FULL_RESUME),
+    }
+
+    assert parsed["email"] == "jane@example.com"
+    # Reading the contact fields does not run the skill scan
+    assert parsed._matches is None
+    assert {key: parsed[key] for key in reversed(parsed.KEYS)} == eager
+    assert dict(parsed) == parsed.to_dict() == eager
+    assert "Machine Learning" in eager["skills"]
+    assert eager["experienceYears"] == 8
+    assert eager["education"] and eager["linkedin"] and eager["github"] and eager["phone"]
+    assert parser.parse(FULL_RESUME.encode(), "txt") == eager
@@ -0,0 +1,53 @@
+import pytest
+
+import semantic_index
+from resume_parser import ResumeParser
+from semantic_index import SemanticIndex
+
+JOBS = [
+    {"applyUrl": "backend", "title": "Backend Engineer", "description": "Python services on PostgreSQL"},
+    {"applyUrl": "frontend", "title": "Frontend Developer", "description": "React and TypeScript user interfaces"},
+    {"applyUrl": "platform", "title": "Platform Engineer", "description": "Kubernetes clusters and Terraform"},
+    {"applyUrl": "data", "title": "Data Scientist", "description": "Machine learning models in PyTorch"},
+]
+
+
+def build_index(**kwargs) -> SemanticIndex:
+    index = SemanticIndex(matcher=ResumeParser.build_matcher(), initial_capacity=1, **kwargs)
+    index.add_jobs(JOBS)
+    return index
+
+
+@pytest.mark.parametrize("numpy", [True, False], ids=["numpy", "python"])
+def test_query_returns_the_closest_job_first(monkeypatch, numpy):
+    if numpy and not semantic_index.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    monkeypatch.setattr(semantic_index, "NUMPY_AVAILABLE", numpy)
+    index = build_index()
+
+    assert index.query("postgres and python backend", k=1)[0][0] == "backend"
+    # "k8s" is a taxonomy alias of Kubernetes
+    assert index.query("k8s operator", k=1)[0][0] == "platform"
+    assert index.query_resume({"skills": ["React"], "jobTitles": ["Frontend Developer"]}, k=1)[0][0] == "frontend"
+
+    hits = index.query("machine learning", k=10)
+    assert [item_id for item_id, _ in hits][0] == "data"
+    assert len(hits) == len(JOBS)
+    assert [score for _, score in hits] == sorted((score for _, score in hits), reverse=True)
+
+
+@pytest.mark.parametrize("numpy", [True, False], ids=["numpy", "python"])
+def test_removed_item_is_no_longer_returned(monkeypatch, numpy):
+    if numpy and not semantic_index.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    monkeypatch.setattr(semantic_index, "NUMPY_AVAILABLE", numpy)
+    index = build_index()
+
+    assert index.remove("backend")
+    assert not index.remove("backend")
+
+    assert "backend" not in index
+    assert len(index) == 3
+    assert "backend" not in [item_id for item_id, _ in index.query("python backend", k=10)]
+    # The last row moved into the freed slot and is still found
+    assert index.query("machine learning", k=1)[0][0] == "data"
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from resume_parser import ResumeParser
+from skill_matcher import SkillMatcher, load_taxonomy, normalize_text
+
+
+@pytest.fixture
+def matcher():
+    return ResumeParser.build_matcher()
+
+
+@pytest.mark.parametrize("text, skills", [
+    ("Worked at Google on ads", []),
+    ("Go and Google Cloud", ["GO"]),
+    ("MySQL and PostgreSQL", ["Mysql", "Postgresql"]),
+    ("Raw SQL, then MySQL", ["SQL", "Mysql"]),
+    ("Open source on GitHub", []),
+    ("Git, GitHub Actions", ["GIT", "Github Actions"]),
+])
+def test_skills_only_match_on_word_boundaries(matcher, text, skills):
+    assert matcher.scan(text).get("skills", []) == skills
+
+
+def test_aliases_map_to_their_skill_label(matcher):
+    found = matcher.scan("k8s, Golang and postgres")["skills"]
+
+    assert found == ["Kubernetes", "GO", "Postgresql"]
+
+
+def test_multiword_skills_match_across_whitespace_runs(matcher):
+    text = "Machine\n  Learning and GITHUB\tActions"
+
+    assert matcher.scan(text)["skills"] == ["Machine Learning", "Github Actions"]
+    assert matcher.scan(normalize_text(text), normalized=True)["skills"] == ["Machine Learning", "Github Actions"]
+
+
+def test_version_glued_to_cpp_is_not_cpp(matcher):
+    # "c++11" reads as one token, like "go" inside "google"; "C++ 17" is still C++
+    assert matcher.scan("Modern c++11 code").get("skills", []) == []
+    assert matcher.scan("C++ 17, C#/.NET")["skills"] == ["C++", "C#"]
+
+
+def test_load_taxonomy_from_json(tmp_path):
+    path = tmp_path / "taxonomy.json"
+    path.write_text(json.dumps({"skills": {"Kubernetes": ["k8s", "kube"]}, "titles": ["sre"]}))
+
+    matcher = load_taxonomy(str(path))
+
+    assert matcher.scan("kube and K8S for the SRE team") == {"skills": ["Kubernetes"], "titles": ["sre"]}
+
+
+def test_load_taxonomy_from_tsv(tmp_path):
+    path = tmp_path / "taxonomy.tsv"
+    path.write_text("# category\tlabel\taliases\n\nskills\tTerraform\ttf, opentofu\ntitles\tSRE\n")
+
+    matcher = load_taxonomy(str(path), SkillMatcher([("skills", "python", "Python")]))
+
+    assert matcher.scan("Python, TF and OpenTofu as an sre") == {"skills": ["Python", "Terraform"], "titles": ["SRE"]}
+
+
+def test_vocabulary_change_invalidates_cached_parses():
+    parser = ResumeParser(matcher=ResumeParser.build_matcher())
+    key = parser.cache_key(b"resume", "txt")
+
+    assert ResumeParser.build_matcher().version == parser.matcher.version
+    assert ResumeParser(matcher=ResumeParser.build_matcher()).cache_key(b"resume", "txt") == key
+
+    parser.matcher.add("skills", "zig", "Zig")
+
+    assert parser.cache_key(b"resume", "txt") != key
+    assert parser.matcher.scan("Zig")["skills"] == ["Zig"]